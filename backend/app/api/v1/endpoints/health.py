@@ -1,8 +1,18 @@
 """Health check endpoint."""
 
-from fastapi import APIRouter
+from typing import Any
 
-from app.core.schemas import HealthResponse
+import redis.asyncio as redis
+from fastapi import APIRouter, Depends
+
+from app.core.exceptions import TarotError
+from app.core.redis import get_redis
+from app.core.schemas import HealthResponse, SuccessResponse
+from app.services import llm_telemetry
+from app.services.interpretation_cache import InterpretationCache
+from app.services.llm_service import get_llm_service
+from app.services.prompt_cache_stats import PromptCacheStats
+from app.services.question_index import QuestionIndex
 
 router = APIRouter()
 
@@ -13,3 +23,55 @@ async def health_check() -> HealthResponse:
     from app.core.config import settings
 
     return HealthResponse(status="healthy", version=settings.app_version)
+
+
+@router.get("/health/cache")
+async def cache_stats(
+    redis_client: redis.Redis = Depends(get_redis),
+) -> SuccessResponse[dict[str, Any]]:
+    """Interpretation cache and validation index hit/miss counters."""
+    cache_stats = await InterpretationCache(redis_client).stats()
+    index_stats = await QuestionIndex(redis_client).stats()
+    return SuccessResponse(data={
+        "interpretation": {**cache_stats.model_dump(), "hit_rate": cache_stats.hit_rate},
+        "validation_index": {**index_stats.model_dump(), "hit_rate": index_stats.hit_rate},
+    })
+
+
+@router.get("/health/llm")
+async def llm_stats() -> SuccessResponse[dict[str, Any]]:
+    """LLM provider routing, latency and request coalescing statistics."""
+    try:
+        llm_service = get_llm_service()
+    except TarotError:
+        return SuccessResponse(data={"available": False})
+    singleflight = llm_service.singleflight
+    return SuccessResponse(data={
+        "available": True,
+        "routers": {task: router.stats() for task, router in llm_service.routers.items()},
+        "singleflight": singleflight.stats() if singleflight else None,
+    })
+
+
+@router.get("/health/llm/prefix-cache")
+async def prefix_cache_report(
+    redis_client: redis.Redis = Depends(get_redis),
+) -> SuccessResponse[list[dict[str, Any]]]:
+    """Provider prompt prefix-cache hit ratio per template and language."""
+    entries = await PromptCacheStats(redis_client).report()
+    return SuccessResponse(data=[
+        {**entry.model_dump(), "hit_ratio": entry.hit_ratio} for entry in entries
+    ])
+
+
+@router.get("/health/llm/models")
+async def model_report() -> SuccessResponse[list[dict[str, Any]]]:
+    """Latency and cost per model and task, from this process's call telemetry."""
+    return SuccessResponse(data=[
+        {
+            **entry.model_dump(),
+            "error_rate": entry.error_rate,
+            "cost_per_request": entry.cost_per_request,
+        }
+        for entry in llm_telemetry.report()
+    ])
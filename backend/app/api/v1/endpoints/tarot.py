@@ -1,15 +1,42 @@
 """Tarot reading API endpoints."""
 
-import random
-from typing import Any
+import json
+from collections.abc import AsyncIterator
+from typing import Any, Literal
 from uuid import uuid4
 
-from fastapi import APIRouter, Depends
-from pydantic import BaseModel
+from fastapi import APIRouter, Depends, Header, HTTPException, Query, Response, status
+from fastapi.responses import StreamingResponse
+from pydantic import BaseModel, Field, HttpUrl, model_validator
 
-from app.core.schemas import SuccessResponse
-from app.services.llm_service import LLMService, ValidationResult, InterpretationResult, get_llm_service
-from app.data.tarot_cards import TAROT_CARDS
+from app.core.config import settings
+from app.core.exceptions import AppError
+from app.core.schemas import DrawnCard, SuccessResponse
+from app.services.llm_service import (
+    CardInterpretation,
+    InterpretationResult,
+    LLMService,
+    ValidationResult,
+    get_llm_service,
+)
+from app.services.batch_service import (
+    BatchInterpretationService,
+    BatchItem,
+    BatchItemResult,
+    get_batch_interpretation_service,
+)
+from app.services.job_queue import (
+    InterpretationJob,
+    JobQueue,
+    JobRecord,
+    get_job_queue,
+    is_allowed_callback,
+)
+from app.services.card_catalog import CardCatalog, get_card_catalog
+from app.services.card_library import CardLibrary, get_card_library
+from app.services.draw_engine import Draw, DrawEngine, get_draw_engine
+from app.services.reading_service import ReadingService, get_reading_service
+from app.services.spreads import DEFAULT_SPREAD, Spread, get_spread
 
 router = APIRouter()
 
@@ -21,20 +48,177 @@ class ValidateQuestionRequest(BaseModel):
 
 
 class DrawCardsResponse(BaseModel):
+    spread: dict[str, Any]
     cards: list[dict[str, Any]]
+    # Pass to /interpret instead of the cards; the server re-derives them
+    draw_token: str
 
 
-class InterpretCardsRequest(BaseModel):
+class DrawnCardsRequest(BaseModel):
+    """Request naming drawn cards by draw token or, unverified, by card id."""
+
+    cards: list[DrawnCard] = []
+    draw_token: str | None = None
+    # Spread to lay raw cards out on; a draw token carries its own spread
+    spread: str | None = None
+
+    @model_validator(mode="after")
+    def require_cards(self) -> "DrawnCardsRequest":
+        if not self.cards and self.draw_token is None:
+            raise ValueError("Either draw_token or cards is required")
+        return self
+
+
+class InterpretCardsRequest(DrawnCardsRequest):
+    question: str
+    language: str = "zh"
+    # "parallel" runs one completion per card (default LLM_INTERPRETATION_MODE)
+    mode: Literal["single", "parallel"] | None = None
+    device_fingerprint: str | None = None
+
+    @model_validator(mode="before")
+    @classmethod
+    def reject_callback_url(cls, data: Any) -> Any:
+        if isinstance(data, dict) and "callback_url" in data:
+            raise ValueError("callback_url is only supported by POST /tarot/jobs")
+        return data
+
+
+class InterpretJobRequest(DrawnCardsRequest):
     question: str
-    cards: list[dict[str, Any]]
     language: str = "zh"
     device_fingerprint: str | None = None
+    # Notified with {"job_id", "status"} when the job finishes
+    callback_url: HttpUrl | None = None
 
 
 class InterpretCardsResponse(BaseModel):
     reading_id: str
     interpretations: list[dict[str, Any]]
     overall_interpretation: str
+    # Precomputed card meanings served while the LLM was unavailable
+    degraded: bool = False
+
+
+class JobStatusResponse(BaseModel):
+    job_id: str
+    status: str
+    attempts: int = 0
+    result: InterpretCardsResponse | None = None
+    error: dict[str, Any] | None = None
+
+
+class BatchInterpretRequest(BaseModel):
+    items: list[BatchItem] = Field(min_length=1)
+
+
+class ReadingRequest(BaseModel):
+    question: str
+    gender: str | None = None
+    language: str = "zh"
+    spread: str = DEFAULT_SPREAD
+    device_fingerprint: str | None = None
+
+
+class ReadingResponse(BaseModel):
+    suitable: bool
+    reason: str
+    redirect_message: str | None = None
+    reading_id: str | None = None
+    cards: list[dict[str, Any]] = []
+    interpretations: list[dict[str, Any]] = []
+    overall_interpretation: str | None = None
+    degraded: bool = False
+    spread: dict[str, Any] | None = None
+    draw_token: str | None = None
+
+
+def _spread(key: str | None) -> Spread:
+    try:
+        return get_spread(key)
+    except ValueError as e:
+        raise HTTPException(
+            status_code=status.HTTP_422_UNPROCESSABLE_ENTITY, detail=str(e)
+        ) from e
+
+
+def _draw(
+    engine: DrawEngine,
+    spread: Spread,
+    library: CardLibrary | None = None,
+    language: str = "zh",
+) -> Draw:
+    """Draw a spread's cards with a signed token that reproduces them.
+
+    With a card library, each card carries its precomputed ``meaning`` so
+    clients can show it before the interpretation arrives.
+    """
+    draw = engine.draw(spread)
+    if library is not None:
+        for card in draw.cards:
+            card["meaning"] = library.meaning(card["id"], card["position"], language)
+    return draw
+
+
+def _request_cards(request: DrawnCardsRequest, engine: DrawEngine) -> list[dict[str, Any]]:
+    """Cards to interpret: re-derived from the draw token, else as posted."""
+    if request.draw_token is not None:
+        try:
+            return engine.cards_for_token(request.draw_token)
+        except ValueError as e:
+            raise HTTPException(
+                status_code=status.HTTP_422_UNPROCESSABLE_ENTITY, detail=str(e)
+            ) from e
+    if settings.draw_token_required:
+        raise HTTPException(
+            status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
+            detail="draw_token is required",
+        )
+    cards = [card.model_dump() for card in request.cards]
+    if request.spread is None:
+        return cards
+    try:
+        return _spread(request.spread).assign(cards)
+    except ValueError as e:
+        raise HTTPException(
+            status_code=status.HTTP_422_UNPROCESSABLE_ENTITY, detail=str(e)
+        ) from e
+
+
+def _format_interpretations_list(
+    interpretations: list[CardInterpretation],
+) -> list[dict[str, Any]]:
+    return [
+        {
+            "index": interp.card_index,
+            "card_name": interp.card_name,
+            "spread_position": interp.spread_position,
+            "text": interp.interpretation,
+        }
+        for interp in interpretations
+    ]
+
+
+def _format_interpretations(result: InterpretationResult) -> list[dict[str, Any]]:
+    return _format_interpretations_list(result.interpretations)
+
+
+def _job_status(record: JobRecord) -> JobStatusResponse:
+    result = None
+    if record.result is not None:
+        result = InterpretCardsResponse(
+            reading_id=record.reading_id or "",
+            interpretations=_format_interpretations(record.result),
+            overall_interpretation=record.result.overall_interpretation,
+            degraded=record.result.degraded,
+        )
+    return JobStatusResponse(
+        job_id=record.id,
+        status=record.status,
+        attempts=record.attempts,
+        result=result,
+        error=record.error,
+    )
 
 
 @router.post("/validate")
@@ -66,36 +250,57 @@ async def validate_question(
 
 
 @router.post("/draw")
-async def draw_cards() -> SuccessResponse[DrawCardsResponse]:
-    # Filter out empty entries if any (though we cleaned them up)
-    valid_cards = [c for c in TAROT_CARDS if c["id"]]
-    selected_cards = random.sample(valid_cards, 3)
-    
-    cards = []
-    for card in selected_cards:
-        cards.append({
-            "id": card["id"],
-            "name_key": card["name_key"],
-            "image": card["image"],
-            "position": "upright" if random.choice([True, False]) else "reversed",
-        })
+async def draw_cards(
+    language: str = "zh",
+    spread: str = DEFAULT_SPREAD,
+    library: CardLibrary = Depends(get_card_library),
+    engine: DrawEngine = Depends(get_draw_engine),
+) -> SuccessResponse[DrawCardsResponse]:
+    draw = _draw(engine, _spread(spread), library=library, language=language)
+    return SuccessResponse(data=DrawCardsResponse(
+        spread=draw.spread.describe(language),
+        cards=draw.cards,
+        draw_token=draw.token,
+    ))
 
-    return SuccessResponse(data=DrawCardsResponse(cards=cards))
+
+@router.get("/cards")
+async def card_catalog(
+    language: str = "zh",
+    v: str | None = None,
+    if_none_match: str | None = Header(default=None),
+    catalog: CardCatalog = Depends(get_card_catalog),
+) -> Response:
+    """The whole deck with localized names and content-hashed image paths.
+
+    Served from bytes serialized at startup with a strong ETag; pass the
+    returned ``version`` as ``v`` to have the response cached as immutable.
+    """
+    representation = catalog.representation(language)
+    headers = {"ETag": representation.etag, "Cache-Control": catalog.cache_control(v)}
+    if catalog.not_modified(if_none_match, representation.etag):
+        return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=headers)
+    return Response(
+        content=representation.body, media_type="application/json", headers=headers
+    )
 
 
 @router.post("/interpret")
 async def interpret_cards(
     request: InterpretCardsRequest,
     llm_service: LLMService = Depends(get_llm_service),
+    engine: DrawEngine = Depends(get_draw_engine),
 ) -> SuccessResponse[InterpretCardsResponse]:
+    cards = _request_cards(request, engine)
     result = await llm_service.interpret_cards(
         request.question,
         "unknown", # Gender not in request? Check API design. API design has gender in validate, but not interpret? 
                    # Design says: "Interpret" request body has "question", "cards", "language".
                    # It seems I missed "gender" in Interpret request in API Design, or it's stateless?
                    # Actually, usually we pass context. Let's add gender to request or default to unknown.
-        request.cards,
+        cards,
         request.language,
+        mode=request.mode,
     )
     
     # Mock saving reading to DB
@@ -103,13 +308,193 @@ async def interpret_cards(
     
     return SuccessResponse(data=InterpretCardsResponse(
         reading_id=reading_id,
-        interpretations=[
-            {
-                "index": interp.card_index,
-                "card_name": interp.card_name,
-                "text": interp.interpretation,
-            }
-            for interp in result.interpretations
-        ],
+        interpretations=_format_interpretations(result),
         overall_interpretation=result.overall_interpretation,
+        degraded=result.degraded,
+    ))
+
+
+@router.post("/jobs", status_code=status.HTTP_202_ACCEPTED)
+async def enqueue_interpretation_job(
+    request: InterpretJobRequest,
+    job_queue: JobQueue = Depends(get_job_queue),
+    engine: DrawEngine = Depends(get_draw_engine),
+) -> SuccessResponse[JobStatusResponse]:
+    """Queue an interpretation for a worker (``python -m app.worker``).
+
+    Returns a job id to poll at ``/tarot/jobs/{id}``. Needs only Redis, so
+    API pods can accept jobs without LLM credentials.
+    """
+    callback_url = str(request.callback_url) if request.callback_url else None
+    if callback_url and not is_allowed_callback(callback_url):
+        raise HTTPException(
+            status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
+            detail="callback_url must be an HTTPS URL on an allowed host",
+        )
+    record = await job_queue.enqueue(InterpretationJob(
+        question=request.question,
+        cards=_request_cards(request, engine),
+        language=request.language,
+        callback_url=callback_url,
     ))
+    return SuccessResponse(data=_job_status(record))
+
+
+@router.get("/jobs/{job_id}")
+async def get_interpretation_job(
+    job_id: str,
+    wait: float = Query(0, ge=0, le=settings.job_wait_max_seconds),
+    job_queue: JobQueue = Depends(get_job_queue),
+) -> SuccessResponse[JobStatusResponse]:
+    """Get an async interpretation job.
+
+    With ``?wait=N`` the request long-polls for up to N seconds until the
+    job is done or failed.
+    """
+    record = await job_queue.wait(job_id, wait) if wait else await job_queue.get(job_id)
+    if record is None:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Job not found")
+    return SuccessResponse(data=_job_status(record))
+
+
+@router.post("/reading")
+async def perform_reading(
+    request: ReadingRequest,
+    reading_service: ReadingService = Depends(get_reading_service),
+    library: CardLibrary = Depends(get_card_library),
+    engine: DrawEngine = Depends(get_draw_engine),
+) -> SuccessResponse[ReadingResponse]:
+    """Validate, draw and interpret in a single round-trip.
+
+    Cards are drawn locally and interpreted concurrently with validation;
+    a rejected question returns the verdict without cards.
+    """
+    draw = _draw(engine, _spread(request.spread), library=library, language=request.language)
+    outcome = await reading_service.perform_reading(
+        request.question,
+        request.gender or "unknown",
+        draw.cards,
+        request.language,
+    )
+
+    validation = outcome.validation
+    if outcome.interpretation is None:
+        return SuccessResponse(data=ReadingResponse(
+            suitable=validation.suitable,
+            reason=validation.reason,
+            redirect_message=validation.redirect_message,
+        ))
+
+    # Mock saving reading to DB
+    return SuccessResponse(data=ReadingResponse(
+        suitable=validation.suitable,
+        reason=validation.reason,
+        redirect_message=validation.redirect_message,
+        reading_id=str(uuid4()),
+        cards=draw.cards,
+        interpretations=_format_interpretations(outcome.interpretation),
+        overall_interpretation=outcome.interpretation.overall_interpretation,
+        degraded=outcome.interpretation.degraded,
+        spread=draw.spread.describe(request.language),
+        draw_token=draw.token,
+    ))
+
+
+def _sse_event(event: str, data: dict[str, Any]) -> str:
+    """Format a server-sent event frame."""
+    return f"event: {event}\ndata: {json.dumps(data, ensure_ascii=False)}\n\n"
+
+
+@router.post("/interpret/stream")
+async def interpret_cards_stream(
+    request: InterpretCardsRequest,
+    llm_service: LLMService = Depends(get_llm_service),
+    library: CardLibrary = Depends(get_card_library),
+    engine: DrawEngine = Depends(get_draw_engine),
+) -> StreamingResponse:
+    """Stream interpretations as server-sent events.
+
+    Emits a ``preview`` event with the precomputed meaning of each card,
+    one ``card`` event per finished card interpretation, then an
+    ``overall`` event and a final ``done`` event carrying the reading id.
+    """
+    cards = _request_cards(request, engine)
+
+    async def event_stream() -> AsyncIterator[str]:
+        preview = library.interpretations(cards, request.language)
+        if preview is not None:
+            yield _sse_event("preview", {"cards": _format_interpretations_list(preview)})
+        try:
+            async for item in llm_service.interpret_cards_stream(
+                request.question,
+                "unknown",
+                cards,
+                request.language,
+                mode=request.mode,
+            ):
+                if isinstance(item, CardInterpretation):
+                    yield _sse_event("card", _format_interpretations_list([item])[0])
+                elif isinstance(item, InterpretationResult):
+                    yield _sse_event("overall", {
+                        "overall_interpretation": item.overall_interpretation,
+                        "degraded": item.degraded,
+                    })
+        except AppError as e:
+            yield _sse_event("error", {"code": e.code, "message": e.message})
+            return
+
+        # Mock saving reading to DB
+        yield _sse_event("done", {"reading_id": str(uuid4())})
+
+    return StreamingResponse(
+        event_stream(),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
+
+
+def _batch_line(item: BatchItemResult) -> str:
+    """Format one batch outcome as an NDJSON line."""
+    if item.result is None:
+        data: dict[str, Any] = {
+            "index": item.index,
+            "status": "error",
+            "error": {"code": item.error_code, "message": item.error_message},
+        }
+    else:
+        # Mock saving reading to DB
+        data = {
+            "index": item.index,
+            "status": "ok",
+            "reading_id": str(uuid4()),
+            "interpretations": _format_interpretations(item.result),
+            "overall_interpretation": item.result.overall_interpretation,
+            "degraded": item.result.degraded,
+        }
+    return json.dumps(data, ensure_ascii=False) + "\n"
+
+
+@router.post("/interpret/batch")
+async def interpret_cards_batch(
+    request: BatchInterpretRequest,
+    ordered: bool = True,
+    batch_service: BatchInterpretationService = Depends(get_batch_interpretation_service),
+) -> StreamingResponse:
+    """Interpret many readings, streaming one NDJSON line per item.
+
+    Items run concurrently up to ``BATCH_INTERPRET_CONCURRENCY``. Lines are
+    written in input order by default, or as items finish with
+    ``?ordered=false``; each line carries its item ``index``. A failed item
+    produces an error line and does not stop the batch.
+    """
+    if len(request.items) > settings.batch_interpret_max_items:
+        raise HTTPException(
+            status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
+            detail=f"A batch may contain at most {settings.batch_interpret_max_items} items",
+        )
+
+    async def lines() -> AsyncIterator[str]:
+        async for item in batch_service.interpret_many(request.items, ordered=ordered):
+            yield _batch_line(item)
+
+    return StreamingResponse(lines(), media_type="application/x-ndjson")
@@ -52,6 +52,133 @@ class Settings(BaseSettings):
     deepseek_api_key: str = ""
     deepseek_model: str = "deepseek/deepseek-chat"
 
+    # LLM transport; llm_base_url points every provider at one
+    # OpenAI-compatible endpoint (e.g. benchmarks/mock_llm.py)
+    llm_base_url: str = ""
+    llm_timeout_seconds: float = 60.0
+    llm_http_max_connections: int = 100
+    llm_http_keepalive_seconds: float = 120.0
+    llm_warmup_enabled: bool = True
+    llm_warmup_timeout_seconds: float = 3.0
+    # Stream non-streaming completions internally so time to first token is
+    # measured for every call, not only /interpret/stream
+    llm_internal_streaming: bool = True
+
+    # Per-task routing, keyed by prompt task (validation, interpretation,
+    # reading). Unset tasks use the default model above; fallbacks are
+    # tried in order while a task's model is unavailable. JSON in env,
+    # e.g. LLM_TASK_MODELS={"validation": "gpt-4o-mini"}
+    llm_task_models: dict[str, str] = {}
+    llm_task_fallbacks: dict[str, list[str]] = {}
+    # Output caps, sized from each task's longest expected output so they only
+    # stop runaway completions. Budget zh/ja, the most token-dense output:
+    # a card's 2-4 sentences (~200 characters) plus its JSON fields is ~350
+    # tokens, and the 80-150 word overall paragraph ~450. Single-call tasks
+    # see at most spread_parallel_min_cards - 1 = 4 cards (larger spreads go
+    # to "cards" parts of spread_parallel_cards_per_call = 3 cards), so:
+    # interpretation 4 * 350 + 450 = 1850, reading adds the verdict, cards
+    # 3 * 350 = 1050, each with ~25% headroom. Raise these with those limits.
+    # Validation only returns a short verdict, so its tight cap keeps it cheap.
+    llm_task_max_tokens: dict[str, int] = {
+        "validation": 200,
+        "interpretation": 2400,
+        "reading": 2500,
+        "cards": 1300,
+        "synthesis": 600,
+    }
+    llm_task_temperature: dict[str, float] = {
+        "validation": 0.0,
+        "interpretation": 0.8,
+        "reading": 0.7,
+        "cards": 0.8,
+        "synthesis": 0.7,
+    }
+
+    # Hedged requests: after the primary exceeds its observed latency
+    # quantile, the same request goes to a secondary model (first valid
+    # response wins). The secondary defaults to the other configured vendor.
+    llm_hedge_enabled: bool = True
+    llm_hedge_model: str = ""
+    llm_hedge_quantile: float = 0.9
+    llm_hedge_max_ratio: float = 0.1
+    llm_hedge_min_delay_seconds: float = 1.0
+    llm_hedge_initial_delay_seconds: float = 8.0
+
+    # Per-provider AIMD concurrency limit and circuit breaker
+    llm_limiter_initial_limit: int = 20
+    llm_limiter_min_limit: int = 2
+    llm_limiter_max_limit: int = 100
+    llm_limiter_queue_timeout_seconds: float = 10.0
+    llm_breaker_failure_threshold: int = 5
+    llm_breaker_reset_seconds: float = 30.0
+
+    # Coalesce identical in-flight completions; the Redis variant also
+    # coalesces across workers and replicas
+    llm_singleflight_enabled: bool = True
+    llm_singleflight_redis: bool = False
+
+    # Batch interpretation (/tarot/interpret/batch)
+    batch_interpret_concurrency: int = 4
+    batch_interpret_max_items: int = 50
+
+    # Async interpretation jobs (/tarot/jobs, app.worker)
+    job_queue_stream: str = "jobs:interpret"
+    job_queue_group: str = "interpret-workers"
+    job_max_attempts: int = 3
+    # Re-claim delay for jobs of crashed workers; running jobs are kept
+    # claimed by a heartbeat, but keep this above the worst-case call time
+    # (LLM timeout + limiter queue timeout) so a missed beat is harmless
+    job_retry_idle_seconds: float = 120.0
+    job_result_ttl_seconds: int = 3600
+    job_worker_concurrency: int = 8
+    job_wait_max_seconds: float = 30.0
+    # Hosts job callback URLs may point at (HTTPS only); empty disables callbacks
+    job_callback_allowed_hosts: list[str] = []
+
+    # Reading mode for /tarot/reading: "pipelined" (concurrent validate and
+    # interpret completions) or "merged" (single combined completion)
+    llm_reading_mode: str = "pipelined"
+
+    # Interpretation mode: "single" (one completion for every card) or
+    # "parallel" (one concurrent completion per card plus a synthesis call)
+    llm_interpretation_mode: str = "single"
+
+    # Spreads with at least this many cards are interpreted by concurrent
+    # calls of up to spread_parallel_cards_per_call cards each, then merged
+    # by a short synthesis call
+    spread_parallel_min_cards: int = 5
+    spread_parallel_cards_per_call: int = 3
+
+    # Question validation
+    question_prefilter_enabled: bool = True
+    question_index_enabled: bool = True
+    question_index_max_distance: int = 8
+    # Questions with fewer unigram + bigram features are not indexed
+    question_index_min_features: int = 5
+    question_index_ttl_seconds: int = 86400
+
+    # Card draws are dealt from a CSPRNG seed and returned with a signed
+    # draw token that /interpret re-derives the cards from. The secret
+    # defaults to the JWT secret; with draw_token_required, raw card lists
+    # are rejected.
+    draw_token_secret: str = ""
+    draw_token_required: bool = False
+
+    # Serve precomputed card meanings (app/data/card_meanings.json) while no
+    # LLM provider is accepting calls
+    card_library_fallback_enabled: bool = True
+
+    # GET /tarot/cards freshness. Requests carrying the current catalog
+    # version (?v=) are cached as immutable for a year; others for this
+    # long, then revalidated with the ETag.
+    card_catalog_max_age_seconds: int = 300
+
+    # Interpretation cache
+    interpretation_cache_enabled: bool = True
+    interpretation_cache_ttl_seconds: int = 86400
+    interpretation_cache_max_entries: int = 10000
+    prompt_template_version: str = "4"
+
     # Anthropic
     anthropic_api_key: str = ""
 
@@ -41,6 +41,13 @@ class TarotError(AppError):
         super().__init__(code="TAROT_ERROR", message=message, details=details)
 
 
+class LLMUnavailableError(AppError):
+    """LLM provider temporarily unavailable (circuit open or overloaded)."""
+
+    def __init__(self, message: str, details: Any | None = None) -> None:
+        super().__init__(code="LLM_UNAVAILABLE", message=message, details=details)
+
+
 class PaymentError(AppError):
     """Payment related errors."""
 
@@ -0,0 +1,108 @@
+"""Prometheus metrics shared across the application."""
+
+from prometheus_client import CONTENT_TYPE_LATEST, Counter, Gauge, Histogram, generate_latest
+
+# LLM provider concurrency limiter
+LLM_CONCURRENCY_LIMIT = Gauge(
+    "tarot_llm_concurrency_limit",
+    "Current adaptive concurrency limit per LLM provider",
+    ["provider"],
+)
+LLM_IN_FLIGHT = Gauge(
+    "tarot_llm_in_flight",
+    "LLM completions currently in flight per provider",
+    ["provider"],
+)
+LLM_LIMITER_REJECTIONS = Counter(
+    "tarot_llm_limiter_rejections_total",
+    "LLM calls rejected after waiting too long for a concurrency slot",
+    ["provider"],
+)
+
+# LLM provider circuit breaker
+LLM_CIRCUIT_STATE = Gauge(
+    "tarot_llm_circuit_state",
+    "Circuit breaker state per LLM provider (0=closed, 1=half_open, 2=open)",
+    ["provider"],
+)
+LLM_CIRCUIT_TRANSITIONS = Counter(
+    "tarot_llm_circuit_transitions_total",
+    "Circuit breaker state transitions per LLM provider",
+    ["provider", "state"],
+)
+
+# LLM routing
+LLM_HEDGED_REQUESTS = Counter(
+    "tarot_llm_hedged_requests_total",
+    "Completions hedged to a secondary provider",
+    ["provider"],
+)
+LLM_FAILOVERS = Counter(
+    "tarot_llm_failovers_total",
+    "Completions routed to a secondary provider because the primary was unavailable",
+    ["provider"],
+)
+
+# Provider-side prompt prefix caching
+LLM_PROMPT_TOKENS = Counter(
+    "tarot_llm_prompt_tokens_total",
+    "Prompt tokens sent to LLM providers per template and language",
+    ["template", "language"],
+)
+LLM_CACHED_PROMPT_TOKENS = Counter(
+    "tarot_llm_cached_prompt_tokens_total",
+    "Prompt tokens served from the provider prefix cache per template and language",
+    ["template", "language"],
+)
+
+# Per-call LLM telemetry, tagged by model and prompt task
+LLM_REQUESTS = Counter(
+    "tarot_llm_requests_total",
+    "LLM completions by model, task and outcome",
+    ["model", "task", "status"],
+)
+LLM_REQUEST_LATENCY = Histogram(
+    "tarot_llm_request_latency_seconds",
+    "LLM completion latency from request to last byte",
+    ["model", "task", "status"],
+    buckets=(0.25, 0.5, 1, 2, 3, 5, 8, 13, 20, 30, 60),
+)
+LLM_TIME_TO_FIRST_TOKEN = Histogram(
+    "tarot_llm_time_to_first_token_seconds",
+    "Time to the first content token of streamed LLM completions",
+    ["model", "task"],
+    buckets=(0.1, 0.25, 0.5, 0.75, 1, 1.5, 2, 3, 5, 10),
+)
+LLM_TOKENS = Counter(
+    "tarot_llm_tokens_total",
+    "LLM tokens by model, task and kind (prompt, completion, cached)",
+    ["model", "task", "kind"],
+)
+LLM_COMPLETION_COST = Counter(
+    "tarot_llm_cost_usd_total",
+    "Estimated LLM spend in USD from litellm's price map",
+    ["model", "task"],
+)
+
+# Malformed model output
+LLM_OUTPUT_REPAIRS = Counter(
+    "tarot_llm_output_repairs_total",
+    "Model outputs accepted after repair (repaired) or a re-ask for missing parts (reasked)",
+    ["result", "kind"],
+)
+
+# Degraded mode
+DEGRADED_READINGS = Counter(
+    "tarot_degraded_readings_total",
+    "Readings served from the precomputed card library because no LLM was available",
+    ["task"],
+)
+
+
+def render_metrics() -> tuple[bytes, str]:
+    """Render all metrics in the Prometheus text format.
+
+    Returns:
+        Tuple of (payload, content type)
+    """
+    return generate_latest(), CONTENT_TYPE_LATEST
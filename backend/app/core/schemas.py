@@ -1,7 +1,9 @@
 """Common response schemas."""
 
-from pydantic import BaseModel, Field
-from typing import Any, Generic, TypeVar
+from pydantic import BaseModel, Field, field_validator
+from typing import Any, Generic, Literal, TypeVar
+
+from app.data.card_registry import CARD_REGISTRY
 
 
 T = TypeVar("T")
@@ -35,3 +37,17 @@ class HealthResponse(BaseModel):
 
     status: str = Field(description="Application status")
     version: str = Field(description="Application version")
+
+
+class DrawnCard(BaseModel):
+    """A card named by deck id; its localized name is resolved server-side."""
+
+    id: str
+    position: Literal["upright", "reversed"] = "upright"
+
+    @field_validator("id")
+    @classmethod
+    def known_card(cls, value: str) -> str:
+        if value not in CARD_REGISTRY:
+            raise ValueError(f"Unknown card id {value!r}")
+        return value
@@ -0,0 +1,173 @@
+"""Immutable, id-indexed tarot deck with localized card names.
+
+The deck (``tarot_cards.py``), the card names in ``i18n/messages.json``
+and the image manifest ``card_images.json`` (content-hashed paths,
+responsive variants and placeholders) are generated by
+``scripts/process_tarot_data.py``. They are compiled once at import
+into slotted records so lookups by id and name resolution are dictionary
+hits rather than scans of the raw lists.
+"""
+
+import json
+from collections.abc import Iterable, Iterator, Mapping
+from dataclasses import dataclass, field
+from pathlib import Path
+from types import MappingProxyType
+from typing import Any
+
+from app.data.tarot_cards import TAROT_CARDS
+
+DATA_DIR = Path(__file__).resolve().parent
+MESSAGES_PATH = DATA_DIR / "i18n" / "messages.json"
+IMAGES_PATH = DATA_DIR / "card_images.json"
+DEFAULT_LANGUAGE = "en"
+
+
+@dataclass(frozen=True, slots=True)
+class Card:
+    """One card of the deck."""
+
+    id: str
+    name_key: str
+    image: str
+    # Localized names keyed by language
+    names: Mapping[str, str]
+    # Responsive variants as an HTML srcset per image format (avif, webp)
+    srcset: Mapping[str, str] = field(default_factory=lambda: MappingProxyType({}))
+    # Tiny blurred preview as a data URI
+    placeholder: str | None = None
+
+    def name(self, language: str = DEFAULT_LANGUAGE) -> str:
+        """Localized card name, falling back to English, then the id."""
+        return self.names.get(language) or self.names.get(DEFAULT_LANGUAGE) or self.id
+
+    def assets(self) -> dict[str, Any]:
+        """Image fields sent to clients with the card."""
+        return {"image": self.image, "srcset": dict(self.srcset), "placeholder": self.placeholder}
+
+
+def _srcset(variants: Iterable[Mapping[str, Any]]) -> MappingProxyType[str, str]:
+    """Group manifest variants into one srcset string per format."""
+    sets: dict[str, list[str]] = {}
+    for variant in sorted(variants, key=lambda v: v["width"]):
+        sets.setdefault(variant["format"], []).append(f"{variant['path']} {variant['width']}w")
+    return MappingProxyType({fmt: ", ".join(entries) for fmt, entries in sets.items()})
+
+
+class CardRegistry:
+    """Read-only deck in draw order, indexed by card id."""
+
+    __slots__ = ("_by_id", "_cards", "back_image", "sprite")
+
+    def __init__(
+        self,
+        cards: Iterable[Card],
+        back_image: str = "/cards/card_back.webp",
+        sprite: Mapping[str, Any] | None = None,
+    ) -> None:
+        """Initialize CardRegistry.
+
+        Args:
+            cards: Cards in a fixed deck order
+            back_image: Image path of the card back
+            sprite: Thumbnail sprite sheet from the image manifest
+
+        Raises:
+            ValueError: If two cards share an id
+        """
+        self.back_image = back_image
+        self.sprite = sprite
+        self._cards = tuple(cards)
+        self._by_id = MappingProxyType({card.id: card for card in self._cards})
+        if len(self._by_id) != len(self._cards):
+            raise ValueError("Duplicate card ids in deck")
+
+    @classmethod
+    def compile(
+        cls,
+        deck: Iterable[dict[str, str]],
+        names: Mapping[str, Mapping[str, str]],
+        manifest: Mapping[str, Any] | None = None,
+    ) -> "CardRegistry":
+        """Build a registry from raw card dicts, i18n names and image manifest.
+
+        Args:
+            deck: Cards with "id", "name_key" and "image"
+            names: Localized names keyed by i18n name key
+            manifest: Parsed ``card_images.json``; cards missing from it
+                keep their plain image and get no variants
+        """
+        images: Mapping[str, Mapping[str, Any]] = (manifest or {}).get("images", {})
+        cards = []
+        for card in deck:
+            if not card["id"]:
+                continue
+            image = images.get(card["id"], {})
+            cards.append(Card(
+                id=card["id"],
+                name_key=card["name_key"],
+                image=image.get("path", card["image"]),
+                names=MappingProxyType(dict(names.get(card["name_key"], {}))),
+                srcset=_srcset(image.get("variants", [])),
+                placeholder=image.get("placeholder"),
+            ))
+        return cls(
+            cards,
+            back_image=images.get("card_back", {}).get("path", "/cards/card_back.webp"),
+            sprite=(manifest or {}).get("sprite"),
+        )
+
+    @classmethod
+    def from_files(
+        cls,
+        messages_path: Path = MESSAGES_PATH,
+        images_path: Path = IMAGES_PATH,
+    ) -> "CardRegistry":
+        """Compile the bundled deck with its i18n names and image manifest."""
+        messages = json.loads(messages_path.read_text(encoding="utf-8"))
+        manifest = (
+            json.loads(images_path.read_text(encoding="utf-8")) if images_path.exists() else None
+        )
+        return cls.compile(TAROT_CARDS, messages.get("Cards", {}), manifest)
+
+    @property
+    def cards(self) -> tuple[Card, ...]:
+        """All cards in deck order."""
+        return self._cards
+
+    def __len__(self) -> int:
+        return len(self._cards)
+
+    def __iter__(self) -> Iterator[Card]:
+        return iter(self._cards)
+
+    def __contains__(self, card_id: object) -> bool:
+        return card_id in self._by_id
+
+    def get(self, card_id: str) -> Card | None:
+        """Get a card by id, or None if the deck has no such card."""
+        return self._by_id.get(card_id)
+
+    def localize(
+        self,
+        cards: list[dict[str, Any]],
+        language: str = DEFAULT_LANGUAGE,
+    ) -> list[dict[str, Any]]:
+        """Set each known card's ``name`` in the given language.
+
+        Args:
+            cards: Drawn cards with "id" and "position"
+            language: Preferred language (zh/ja/en)
+
+        Returns:
+            Copies of the cards; cards with an unknown id are returned as is
+        """
+        return [
+            {**card, "name": deck_card.name(language)}
+            if (deck_card := self._by_id.get(str(card.get("id", "")))) is not None
+            else card
+            for card in cards
+        ]
+
+
+CARD_REGISTRY = CardRegistry.from_files()
@@ -81,9 +81,8 @@ TAROT_CARDS = [
     {"id": "pk2", "name_key": "card_pk2", "image": "/cards/pk2.webp"},
 ]
 
+_CARDS_BY_ID = {card["id"]: card for card in TAROT_CARDS}
+
 def get_card_by_id(card_id: str) -> dict | None:
     """Get a tarot card by its ID."""
-    for card in TAROT_CARDS:
-        if card["id"] == card_id:
-            return card
-    return None
+    return _CARDS_BY_ID.get(card_id)
@@ -2,13 +2,20 @@
 
 from contextlib import asynccontextmanager
 
-from fastapi import FastAPI
+from fastapi import FastAPI, Request, Response
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import JSONResponse
 
 from app.api.v1.router import api_router
 from app.core.config import settings
 from app.core.database import init_db, close_db
+from app.core.exceptions import LLMUnavailableError
+from app.core.metrics import render_metrics
 from app.core.redis import init_redis, close_redis
+from app.core.schemas import ErrorDetail, ErrorResponse
+from app.services.card_catalog import get_card_catalog
+from app.services.card_library import get_card_library
+from app.services.llm_service import init_llm_service, close_llm_service
 
 
 @asynccontextmanager
@@ -17,8 +24,14 @@ async def lifespan(app: FastAPI):
     # Startup
     await init_db()
     await init_redis()
+    # Load card meanings up front; they are served before and instead of the LLM
+    get_card_library()
+    # Serialize the card catalog once; GET /tarot/cards serves the bytes
+    get_card_catalog()
+    await init_llm_service()
     yield
     # Shutdown
+    await close_llm_service()
     await close_redis()
     await close_db()
 
@@ -40,6 +53,19 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+
+
+@app.exception_handler(LLMUnavailableError)
+async def llm_unavailable_handler(request: Request, exc: LLMUnavailableError) -> JSONResponse:
+    """Shed load with 503 while LLM providers are saturated or failing."""
+    error = ErrorResponse(error=ErrorDetail(code=exc.code, message=exc.message, details=exc.details))
+    return JSONResponse(
+        status_code=503,
+        content=error.model_dump(),
+        headers={"Retry-After": str(int(settings.llm_breaker_reset_seconds))},
+    )
+
+
 # Include API router
 app.include_router(api_router, prefix=settings.api_v1_prefix)
 
@@ -48,3 +74,10 @@ app.include_router(api_router, prefix=settings.api_v1_prefix)
 async def health_check():
     """Health check endpoint."""
     return {"status": "healthy", "version": settings.app_version}
+
+
+@app.get("/metrics", include_in_schema=False)
+async def metrics() -> Response:
+    """Prometheus metrics endpoint."""
+    payload, content_type = render_metrics()
+    return Response(content=payload, media_type=content_type)
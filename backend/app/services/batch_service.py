@@ -0,0 +1,126 @@
+"""Batch interpretation with bounded concurrency."""
+
+import asyncio
+import contextlib
+import logging
+from collections.abc import AsyncIterator
+
+from fastapi import Depends
+from pydantic import BaseModel
+
+from app.core.config import settings
+from app.core.exceptions import AppError
+from app.core.schemas import DrawnCard
+from app.services.llm_service import InterpretationResult, LLMService, get_llm_service
+
+logger = logging.getLogger(__name__)
+
+
+class BatchItem(BaseModel):
+    """One reading to interpret in a batch."""
+
+    question: str
+    cards: list[DrawnCard]
+    language: str = "zh"
+    gender: str | None = None
+
+
+class BatchItemResult(BaseModel):
+    """Outcome of one batch item; exactly one of result/error is set."""
+
+    index: int
+    result: InterpretationResult | None = None
+    error_code: str | None = None
+    error_message: str | None = None
+
+    @property
+    def ok(self) -> bool:
+        """Whether the item was interpreted."""
+        return self.result is not None
+
+
+class BatchInterpretationService:
+    """Fan batch items out through LLMService.interpret_cards.
+
+    At most ``concurrency`` items are in flight at once. Items hit the
+    interpretation cache and single-flight like any other request, so
+    repeated items in a batch cost one completion.
+    """
+
+    def __init__(self, llm_service: LLMService, concurrency: int | None = None) -> None:
+        """Initialize BatchInterpretationService.
+
+        Args:
+            llm_service: LLM service used for interpretation
+            concurrency: Maximum items in flight (default from settings)
+        """
+        self._llm_service = llm_service
+        self._concurrency = concurrency or settings.batch_interpret_concurrency
+
+    async def _interpret(
+        self,
+        index: int,
+        item: BatchItem,
+        slots: asyncio.Semaphore,
+    ) -> BatchItemResult:
+        async with slots:
+            try:
+                result = await self._llm_service.interpret_cards(
+                    item.question,
+                    item.gender or "unknown",
+                    [card.model_dump() for card in item.cards],
+                    item.language,
+                )
+            except AppError as e:
+                return BatchItemResult(index=index, error_code=e.code, error_message=e.message)
+            except Exception as e:
+                logger.warning("Batch item %d failed", index, exc_info=True)
+                return BatchItemResult(
+                    index=index, error_code="INTERNAL_ERROR", error_message=str(e)
+                )
+        return BatchItemResult(index=index, result=result)
+
+    async def interpret_many(
+        self,
+        items: list[BatchItem],
+        ordered: bool = True,
+    ) -> AsyncIterator[BatchItemResult]:
+        """Interpret items concurrently, yielding each outcome.
+
+        Per-item failures are yielded as error results rather than raised.
+        If the consumer stops early, items still running are cancelled.
+
+        Args:
+            items: Readings to interpret
+            ordered: Yield in input order (each item as soon as it and all
+                earlier items are done); otherwise in completion order
+
+        Yields:
+            BatchItemResult per item
+        """
+        slots = asyncio.Semaphore(self._concurrency)
+        tasks = [
+            asyncio.create_task(self._interpret(index, item, slots))
+            for index, item in enumerate(items)
+        ]
+        try:
+            if ordered:
+                for task in tasks:
+                    yield await task
+            else:
+                for next_done in asyncio.as_completed(tasks):
+                    yield await next_done
+        finally:
+            for task in tasks:
+                if not task.done():
+                    task.cancel()
+            for task in tasks:
+                with contextlib.suppress(asyncio.CancelledError, Exception):
+                    await task
+
+
+def get_batch_interpretation_service(
+    llm_service: LLMService = Depends(get_llm_service),
+) -> BatchInterpretationService:
+    """Get a configured BatchInterpretationService instance."""
+    return BatchInterpretationService(llm_service)
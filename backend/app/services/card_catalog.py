@@ -0,0 +1,104 @@
+"""Pre-serialized card catalog for GET /tarot/cards."""
+
+import hashlib
+import json
+from functools import lru_cache
+
+from app.core.config import settings
+from app.core.schemas import SuccessResponse
+from app.data.card_registry import CARD_REGISTRY, CardRegistry
+
+CATALOG_LANGUAGES = ("en", "zh", "ja")
+DEFAULT_LANGUAGE = "en"
+IMMUTABLE_CACHE_CONTROL = "public, max-age=31536000, immutable"
+
+
+class CatalogRepresentation:
+    """One language's serialized catalog and its strong validator."""
+
+    __slots__ = ("body", "etag")
+
+    def __init__(self, body: bytes) -> None:
+        self.body = body
+        self.etag = f'"{hashlib.sha256(body).hexdigest()[:32]}"'
+
+
+class CardCatalog:
+    """The deck with localized names and hashed image paths, serialized once.
+
+    Every supported language is rendered to JSON bytes up front, so a
+    request costs a dictionary lookup and, when the client already holds
+    the current ETag, an empty 304. The catalog ``version`` hashes all
+    representations; a request naming it (``?v=``) can be cached as
+    immutable because any change to the deck changes the version.
+    """
+
+    def __init__(
+        self,
+        registry: CardRegistry = CARD_REGISTRY,
+        languages: tuple[str, ...] = CATALOG_LANGUAGES,
+    ) -> None:
+        """Initialize CardCatalog.
+
+        Args:
+            registry: Deck to describe
+            languages: Languages to pre-render; others are served in English
+        """
+        cards = [
+            {"id": card.id, "name_key": card.name_key, "names": card.names, **card.assets()}
+            for card in registry
+        ]
+        self.version = hashlib.sha256(
+            json.dumps(
+                {"back_image": registry.back_image, "sprite": registry.sprite, "cards": cards},
+                sort_keys=True,
+                default=dict,
+            ).encode("utf-8")
+        ).hexdigest()[:16]
+        self._representations = {
+            language: CatalogRepresentation(
+                SuccessResponse(data={
+                    "version": self.version,
+                    "language": language,
+                    "back_image": registry.back_image,
+                    "sprite": registry.sprite,
+                    "cards": [
+                        {
+                            "id": card.id,
+                            "name_key": card.name_key,
+                            "name": card.name(language),
+                            **card.assets(),
+                        }
+                        for card in registry
+                    ],
+                }).model_dump_json().encode("utf-8")
+            )
+            for language in languages
+        }
+
+    def representation(self, language: str) -> CatalogRepresentation:
+        """Serialized catalog in a language, falling back to English."""
+        return self._representations.get(language) or self._representations[DEFAULT_LANGUAGE]
+
+    def cache_control(self, version: str | None) -> str:
+        """Cache-Control for a request naming the given catalog version."""
+        if version == self.version:
+            return IMMUTABLE_CACHE_CONTROL
+        return f"public, max-age={settings.card_catalog_max_age_seconds}"
+
+    @staticmethod
+    def not_modified(if_none_match: str | None, etag: str) -> bool:
+        """Whether an If-None-Match header matches the current ETag.
+
+        If-None-Match uses weak comparison, so ``W/`` prefixes are ignored.
+        """
+        if not if_none_match:
+            return False
+        tags = [tag.strip().removeprefix("W/") for tag in if_none_match.split(",")]
+        return "*" in tags or etag in tags
+
+
+@lru_cache
+def get_card_catalog() -> CardCatalog:
+    """Get the shared card catalog, built on first use."""
+    return CardCatalog()
@@ -0,0 +1,129 @@
+"""Precomputed per-card meanings for instant and degraded-mode readings."""
+
+import json
+from functools import lru_cache
+from pathlib import Path
+from typing import Any
+
+from app.data.card_registry import CARD_REGISTRY, CardRegistry
+from app.services.llm_service import CardInterpretation, InterpretationResult
+
+DATA_DIR = Path(__file__).resolve().parent.parent / "data"
+CARD_MEANINGS_PATH = DATA_DIR / "card_meanings.json"
+DEFAULT_LANGUAGE = "en"
+
+
+class CardLibrary:
+    """In-memory library of upright and reversed meanings per card.
+
+    The library is built offline by ``scripts/generate_card_meanings.py``.
+    Meanings do not depend on the question, so they can be shown the moment
+    cards are drawn and stand in for the LLM reading when it is unavailable.
+    Languages missing from the library fall back to English.
+    """
+
+    def __init__(self, meanings: dict[str, Any], registry: CardRegistry = CARD_REGISTRY) -> None:
+        """Initialize CardLibrary.
+
+        Args:
+            meanings: Parsed ``card_meanings.json``
+            registry: Deck providing the localized card names
+        """
+        self._cards: dict[str, dict[str, dict[str, str]]] = meanings.get("cards", {})
+        self._overall: dict[str, str] = meanings.get("overall", {})
+        self._registry = registry
+
+    @classmethod
+    def from_files(cls, meanings_path: Path = CARD_MEANINGS_PATH) -> "CardLibrary":
+        """Load the bundled meanings."""
+        return cls(json.loads(meanings_path.read_text(encoding="utf-8")))
+
+    def __len__(self) -> int:
+        return len(self._cards)
+
+    @staticmethod
+    def _localized(texts: dict[str, str], language: str) -> str | None:
+        return texts.get(language) or texts.get(DEFAULT_LANGUAGE)
+
+    def card_name(self, card_id: str, language: str = DEFAULT_LANGUAGE) -> str:
+        """Localized card name, or the id for unknown cards."""
+        card = self._registry.get(card_id)
+        return card.name(language) if card is not None else card_id
+
+    def meaning(
+        self,
+        card_id: str,
+        position: str = "upright",
+        language: str = DEFAULT_LANGUAGE,
+    ) -> str | None:
+        """Get the meaning of a card in a position.
+
+        Args:
+            card_id: Card id from the deck
+            position: "upright" or "reversed"
+            language: Preferred language (zh/ja/en)
+
+        Returns:
+            Meaning text, or None if the card is not in the library
+        """
+        return self._localized(self._cards.get(card_id, {}).get(position, {}), language)
+
+    def interpretations(
+        self,
+        cards: list[dict[str, Any]],
+        language: str = DEFAULT_LANGUAGE,
+    ) -> list[CardInterpretation] | None:
+        """Library meanings for drawn cards, or None if any card is missing.
+
+        Args:
+            cards: Drawn cards with "id", "position" and optional "spread_position"
+            language: Preferred language (zh/ja/en)
+
+        Returns:
+            One CardInterpretation per card, in draw order
+        """
+        interpretations = []
+        for index, card in enumerate(cards):
+            card_id = str(card.get("id", ""))
+            position = card.get("position", "upright")
+            text = self.meaning(card_id, position, language)
+            if text is None:
+                return None
+            interpretations.append(CardInterpretation(
+                card_index=index,
+                card_name=self.card_name(card_id, language),
+                position=position,
+                interpretation=text,
+                spread_position=card.get("spread_position"),
+            ))
+        return interpretations
+
+    def interpret(
+        self,
+        cards: list[dict[str, Any]],
+        language: str = DEFAULT_LANGUAGE,
+    ) -> InterpretationResult | None:
+        """Build a question-independent reading from library meanings.
+
+        Args:
+            cards: Drawn cards with "id" and "position"
+            language: Preferred language (zh/ja/en)
+
+        Returns:
+            Degraded InterpretationResult, or None if any card is missing
+        """
+        interpretations = self.interpretations(cards, language)
+        overall = self._localized(self._overall, language)
+        if interpretations is None or overall is None:
+            return None
+        return InterpretationResult(
+            interpretations=interpretations,
+            overall_interpretation=overall,
+            degraded=True,
+        )
+
+
+@lru_cache
+def get_card_library() -> CardLibrary:
+    """Get the shared card library loaded from the bundled data files."""
+    return CardLibrary.from_files()
@@ -0,0 +1,168 @@
+"""Reproducible card draws from signed, server-issued seeds."""
+
+import base64
+import binascii
+import hashlib
+import hmac
+import itertools
+import secrets
+from collections.abc import Iterator, Sequence
+from functools import lru_cache
+from typing import Any
+
+from pydantic import BaseModel
+
+from app.core.config import settings
+from app.data.card_registry import CARD_REGISTRY, Card
+from app.services.spreads import SPREAD_CODES, SPREADS, Spread
+
+# Version 2 tokens name a spread instead of a bare card count
+DRAW_TOKEN_VERSION = 2
+SEED_BYTES = 16
+# Truncated HMAC-SHA256; 128 bits is ample against forgery
+SIGNATURE_BYTES = 16
+PAYLOAD_BYTES = 2 + SEED_BYTES
+
+
+class Draw(BaseModel):
+    """Cards dealt from one seed, with the token that reproduces them."""
+
+    token: str
+    spread: Spread
+    cards: list[dict[str, Any]]
+
+
+class DrawEngine:
+    """Deal cards deterministically from a random seed and sign the seed.
+
+    Seeds come from the OS CSPRNG (``secrets``). Cards are dealt by a
+    Fisher-Yates shuffle driven by an HMAC-SHA256 stream keyed with the
+    seed, so a seed always yields the same cards and orientations. The draw
+    token carries the seed and spread signed with the server secret, so
+    ``/interpret`` can re-derive the cards that were actually drawn instead
+    of trusting card dicts posted by the client.
+    """
+
+    def __init__(
+        self,
+        secret: str | None = None,
+        deck: Sequence[Card] | None = None,
+    ) -> None:
+        """Initialize DrawEngine.
+
+        Args:
+            secret: Token signing secret (default ``DRAW_TOKEN_SECRET``,
+                falling back to the JWT secret)
+            deck: Cards to deal from, in a fixed order (default the bundled deck)
+        """
+        secret = secret or settings.draw_token_secret or settings.jwt_secret_key
+        self._secret = secret.encode("utf-8")
+        self._deck = tuple(deck if deck is not None else CARD_REGISTRY.cards)
+
+    def draw(self, spread: Spread) -> Draw:
+        """Draw a spread's cards from a fresh seed.
+
+        Args:
+            spread: Spread to lay out
+
+        Returns:
+            The cards and their signed draw token
+        """
+        if spread.card_count > len(self._deck):
+            raise ValueError(f"Cannot draw {spread.key} from a deck of {len(self._deck)}")
+        seed = secrets.token_bytes(SEED_BYTES)
+        return Draw(token=self.sign(seed, spread), spread=spread, cards=self.deal(seed, spread))
+
+    def deal(self, seed: bytes, spread: Spread) -> list[dict[str, Any]]:
+        """Deal the cards a seed determines.
+
+        Args:
+            seed: Draw seed
+            spread: Spread the cards are laid out on
+
+        Returns:
+            Cards with id, name_key, image assets, upright/reversed position
+            and spread position
+        """
+        deck = list(self._deck)
+        stream = self._stream(seed)
+        cards = []
+        for i in range(spread.card_count):
+            # Partial Fisher-Yates: only the dealt prefix is shuffled
+            j = i + self._below(stream, len(deck) - i)
+            deck[i], deck[j] = deck[j], deck[i]
+            card = deck[i]
+            cards.append({
+                "id": card.id,
+                "name_key": card.name_key,
+                **card.assets(),
+                "position": "reversed" if self._below(stream, 2) else "upright",
+            })
+        return spread.assign(cards)
+
+    def sign(self, seed: bytes, spread: Spread) -> str:
+        """Build the URL-safe draw token for a seed and spread."""
+        payload = bytes([DRAW_TOKEN_VERSION, SPREAD_CODES.index(spread.key)]) + seed
+        token = payload + self._signature(payload)
+        return base64.urlsafe_b64encode(token).rstrip(b"=").decode("ascii")
+
+    def verify(self, token: str) -> tuple[bytes, Spread]:
+        """Check a draw token's signature.
+
+        Args:
+            token: Token issued by draw()
+
+        Returns:
+            The (seed, spread) the token was issued for
+
+        Raises:
+            ValueError: If the token is malformed, forged or from an
+                unsupported version
+        """
+        try:
+            raw = base64.urlsafe_b64decode(token + "=" * (-len(token) % 4))
+        except (binascii.Error, ValueError) as e:
+            raise ValueError("Malformed draw token") from e
+        if len(raw) != PAYLOAD_BYTES + SIGNATURE_BYTES:
+            raise ValueError("Malformed draw token")
+        payload, signature = raw[:PAYLOAD_BYTES], raw[PAYLOAD_BYTES:]
+        if not hmac.compare_digest(signature, self._signature(payload)):
+            raise ValueError("Invalid draw token signature")
+        version, code, seed = payload[0], payload[1], payload[2:]
+        if version != DRAW_TOKEN_VERSION or code >= len(SPREAD_CODES):
+            raise ValueError("Unsupported draw token")
+        return seed, SPREADS[SPREAD_CODES[code]]
+
+    def cards_for_token(self, token: str) -> list[dict[str, Any]]:
+        """Re-derive the cards of a draw token.
+
+        Raises:
+            ValueError: If the token does not verify
+        """
+        return self.deal(*self.verify(token))
+
+    def _signature(self, payload: bytes) -> bytes:
+        return hmac.new(self._secret, payload, hashlib.sha256).digest()[:SIGNATURE_BYTES]
+
+    @staticmethod
+    def _stream(seed: bytes) -> Iterator[int]:
+        """Yield 32-bit integers from HMAC-SHA256(seed, block counter)."""
+        for block in itertools.count():
+            digest = hmac.new(seed, block.to_bytes(8, "big"), hashlib.sha256).digest()
+            for offset in range(0, len(digest), 4):
+                yield int.from_bytes(digest[offset:offset + 4], "big")
+
+    @staticmethod
+    def _below(stream: Iterator[int], n: int) -> int:
+        """Uniform integer in [0, n), rejecting values that would bias the modulo."""
+        limit = 2**32 - 2**32 % n
+        value = next(stream)
+        while value >= limit:
+            value = next(stream)
+        return value % n
+
+
+@lru_cache
+def get_draw_engine() -> DrawEngine:
+    """Get the shared draw engine."""
+    return DrawEngine()
@@ -0,0 +1,171 @@
+"""Redis-backed cache for tarot interpretation results."""
+
+import hashlib
+import json
+import re
+import time
+import unicodedata
+from typing import Any
+
+import redis.asyncio as aioredis
+from pydantic import BaseModel
+
+from app.core.config import settings
+from app.services.llm_service import InterpretationResult
+
+
+class CacheStats(BaseModel):
+    """Interpretation cache counters."""
+
+    hits: int
+    misses: int
+    entries: int
+
+    @property
+    def hit_rate(self) -> float:
+        """Fraction of lookups served from cache."""
+        total = self.hits + self.misses
+        return self.hits / total if total else 0.0
+
+
+class InterpretationCache:
+    """Cache of interpretation results keyed on the full reading context.
+
+    Entries expire after a TTL; a sorted set of insertion times bounds the
+    number of live entries by evicting the oldest ones first.
+    """
+
+    # Redis keys
+    KEY_PREFIX = "interp_cache:entry:"
+    INDEX_KEY = "interp_cache:index"
+    STATS_KEY = "interp_cache:stats"
+
+    _WHITESPACE_RE = re.compile(r"\s+")
+    # ASCII and fullwidth ? ! . ~ (\uff1f \uff01 \u3002 \uff5e)
+    _TRAILING_PUNCT = " \t\n?\uff1f!\uff01.\u3002~\uff5e"
+
+    def __init__(
+        self,
+        redis_client: aioredis.Redis,
+        ttl_seconds: int | None = None,
+        max_entries: int | None = None,
+    ) -> None:
+        """Initialize InterpretationCache.
+
+        Args:
+            redis_client: Redis client
+            ttl_seconds: Entry lifetime (default from settings)
+            max_entries: Maximum number of cached entries (default from settings)
+        """
+        self._redis = redis_client
+        self._ttl_seconds = ttl_seconds or settings.interpretation_cache_ttl_seconds
+        self._max_entries = max_entries or settings.interpretation_cache_max_entries
+
+    @classmethod
+    def normalize_question(cls, question: str) -> str:
+        """Normalize a question so trivial variations share a cache entry.
+
+        Args:
+            question: Raw user question
+
+        Returns:
+            NFKC-normalized, case-folded question with collapsed whitespace
+        """
+        normalized = unicodedata.normalize("NFKC", question).casefold()
+        normalized = cls._WHITESPACE_RE.sub(" ", normalized)
+        return normalized.strip(cls._TRAILING_PUNCT)
+
+    @classmethod
+    def build_key(
+        cls,
+        question: str,
+        gender: str,
+        cards: list[dict[str, Any]],
+        language: str,
+        model: str,
+        template_version: str,
+    ) -> str:
+        """Build the cache key for an interpretation request.
+
+        Args:
+            question: User's question
+            gender: User's gender, which the prompts render
+            cards: Drawn cards in order
+            language: Response language
+            model: LLM model name
+            template_version: Prompt template version
+
+        Returns:
+            Redis key for the entry
+        """
+        card_tuple = [
+            (
+                card.get("id") or card.get("name_key") or card.get("name"),
+                card.get("position"),
+                card.get("spread_position"),
+            )
+            for card in cards
+        ]
+        material = json.dumps(
+            [
+                cls.normalize_question(question),
+                gender,
+                card_tuple,
+                language,
+                model,
+                template_version,
+            ],
+            ensure_ascii=False,
+            separators=(",", ":"),
+        )
+        digest = hashlib.sha256(material.encode("utf-8")).hexdigest()
+        return f"{cls.KEY_PREFIX}{digest}"
+
+    async def get(self, key: str) -> InterpretationResult | None:
+        """Look up a cached interpretation and update hit/miss counters.
+
+        Args:
+            key: Cache key from build_key
+
+        Returns:
+            Cached InterpretationResult, or None on miss
+        """
+        raw = await self._redis.get(key)
+        if raw is None:
+            await self._redis.hincrby(self.STATS_KEY, "misses", 1)
+            return None
+
+        await self._redis.hincrby(self.STATS_KEY, "hits", 1)
+        return InterpretationResult.model_validate_json(raw)
+
+    async def set(self, key: str, result: InterpretationResult) -> None:
+        """Store an interpretation, evicting the oldest entries over capacity.
+
+        Args:
+            key: Cache key from build_key
+            result: Interpretation to cache
+        """
+        now = time.time()
+        await self._redis.set(key, result.model_dump_json(), ex=self._ttl_seconds)
+        await self._redis.zadd(self.INDEX_KEY, {key: now})
+        # Drop index members whose entries have already expired
+        await self._redis.zremrangebyscore(self.INDEX_KEY, 0, now - self._ttl_seconds)
+
+        overflow = await self._redis.zcard(self.INDEX_KEY) - self._max_entries
+        if overflow > 0:
+            evicted = await self._redis.zpopmin(self.INDEX_KEY, overflow)
+            if evicted:
+                await self._redis.delete(*(member for member, _ in evicted))
+
+    async def stats(self) -> CacheStats:
+        """Get cache counters.
+
+        Returns:
+            CacheStats with hits, misses and entry count
+        """
+        counters = await self._redis.hgetall(self.STATS_KEY)
+        return CacheStats(
+            hits=int(counters.get("hits", 0)),
+            misses=int(counters.get("misses", 0)),
+            entries=await self._redis.zcard(self.INDEX_KEY),
+        )
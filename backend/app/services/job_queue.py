@@ -0,0 +1,268 @@
+"""Asynchronous interpretation jobs on Redis Streams."""
+
+import time
+from typing import Any
+from urllib.parse import urlsplit
+from uuid import uuid4
+
+import redis.asyncio as aioredis
+from fastapi import Depends
+from pydantic import BaseModel, Field
+
+from app.core.config import settings
+from app.core.redis import get_redis
+from app.services.llm_service import InterpretationResult
+
+# Job states; "done" and "failed" are terminal
+JOB_QUEUED = "queued"
+JOB_RUNNING = "running"
+JOB_DONE = "done"
+JOB_FAILED = "failed"
+TERMINAL_STATES = (JOB_DONE, JOB_FAILED)
+
+
+class InterpretationJob(BaseModel):
+    """Payload of a queued interpretation."""
+
+    id: str = Field(default_factory=lambda: str(uuid4()))
+    question: str
+    gender: str = "unknown"
+    cards: list[dict[str, Any]]
+    language: str = "zh"
+    callback_url: str | None = None
+
+
+class JobRecord(BaseModel):
+    """Client-visible state of a job."""
+
+    id: str
+    status: str = JOB_QUEUED
+    attempts: int = 0
+    created_at: float = Field(default_factory=time.time)
+    updated_at: float = Field(default_factory=time.time)
+    reading_id: str | None = None
+    result: InterpretationResult | None = None
+    error: dict[str, Any] | None = None
+
+    @property
+    def finished(self) -> bool:
+        """Whether the job reached a terminal state."""
+        return self.status in TERMINAL_STATES
+
+
+def is_allowed_callback(url: str) -> bool:
+    """Whether a job callback URL may be called by workers.
+
+    Workers run inside the cluster, so callbacks are limited to HTTPS URLs
+    on hosts listed in ``JOB_CALLBACK_ALLOWED_HOSTS`` (none by default).
+    """
+    parts = urlsplit(url)
+    return parts.scheme == "https" and parts.hostname in settings.job_callback_allowed_hosts
+
+
+def _stream_entries(response: Any) -> list[tuple[str, dict[str, str]]]:
+    """Flatten an XREADGROUP reply (RESP2 list or RESP3 dict) into entries."""
+    if not response:
+        return []
+    streams = response.values() if isinstance(response, dict) else (s[1] for s in response)
+    return [tuple(entry) for entries in streams for entry in entries]
+
+
+class JobQueue:
+    """Interpretation job queue backed by a Redis Stream and consumer group.
+
+    Jobs are appended to a stream read by a consumer group, so each job is
+    delivered to one worker. A worker acknowledges a job only once it
+    reaches a terminal state; jobs whose worker crashed or failed stay
+    pending and are re-claimed after ``retry_idle_seconds``. After
+    ``max_attempts`` deliveries a job is moved to the dead-letter stream.
+    Workers refresh the claim on jobs they are still running (``touch``),
+    so only jobs of dead or stuck workers go idle. Job state lives in a separate key with a TTL for clients to poll.
+    """
+
+    RECORD_PREFIX = "jobs:record:"
+    NOTIFY_PREFIX = "jobs:notify:"
+
+    def __init__(
+        self,
+        redis_client: aioredis.Redis,
+        stream: str | None = None,
+        group: str | None = None,
+        max_attempts: int | None = None,
+        retry_idle_seconds: float | None = None,
+        result_ttl_seconds: int | None = None,
+    ) -> None:
+        """Initialize JobQueue.
+
+        Args:
+            redis_client: Redis client
+            stream: Job stream key (default from settings)
+            group: Consumer group name (default from settings)
+            max_attempts: Deliveries before dead-lettering (default from settings)
+            retry_idle_seconds: Idle time before a pending job is re-claimed
+            result_ttl_seconds: Lifetime of job records (default from settings)
+        """
+        self._redis = redis_client
+        self.stream = stream or settings.job_queue_stream
+        self.group = group or settings.job_queue_group
+        self.dead_letter_stream = f"{self.stream}:dead"
+        self._max_attempts = max_attempts or settings.job_max_attempts
+        self._retry_idle_ms = int(
+            1000 * (
+                settings.job_retry_idle_seconds
+                if retry_idle_seconds is None else retry_idle_seconds
+            )
+        )
+        self._ttl_seconds = result_ttl_seconds or settings.job_result_ttl_seconds
+
+    @property
+    def max_attempts(self) -> int:
+        """Deliveries before a job is dead-lettered."""
+        return self._max_attempts
+
+    @property
+    def retry_idle_seconds(self) -> float:
+        """Idle time before a pending job is re-claimed."""
+        return self._retry_idle_ms / 1000
+
+    async def ensure_group(self) -> None:
+        """Create the stream and consumer group if they do not exist."""
+        try:
+            await self._redis.xgroup_create(self.stream, self.group, id="0", mkstream=True)
+        except aioredis.ResponseError as e:
+            if "BUSYGROUP" not in str(e):
+                raise
+
+    async def enqueue(self, job: InterpretationJob) -> JobRecord:
+        """Record a job as queued and append it to the stream.
+
+        Args:
+            job: Interpretation to run
+
+        Returns:
+            The queued JobRecord
+        """
+        record = JobRecord(id=job.id)
+        await self.save(record)
+        await self._redis.xadd(self.stream, {"job": job.model_dump_json()})
+        return record
+
+    async def save(self, record: JobRecord) -> None:
+        """Store a job record, waking long-pollers if it is finished."""
+        record.updated_at = time.time()
+        await self._redis.set(
+            f"{self.RECORD_PREFIX}{record.id}", record.model_dump_json(), ex=self._ttl_seconds
+        )
+        if record.finished:
+            await self._notify(record.id)
+
+    async def get(self, job_id: str) -> JobRecord | None:
+        """Get a job record, or None if unknown or expired."""
+        raw = await self._redis.get(f"{self.RECORD_PREFIX}{job_id}")
+        return JobRecord.model_validate_json(raw) if raw else None
+
+    async def wait(self, job_id: str, timeout: float) -> JobRecord | None:
+        """Long-poll a job until it finishes or the timeout passes.
+
+        Args:
+            job_id: Job id
+            timeout: Maximum seconds to wait
+
+        Returns:
+            Latest JobRecord (possibly unfinished), or None if unknown
+        """
+        deadline = time.monotonic() + timeout
+        notify_key = f"{self.NOTIFY_PREFIX}{job_id}"
+        while True:
+            record = await self.get(job_id)
+            remaining = deadline - time.monotonic()
+            if record is None or record.finished or remaining <= 0:
+                return record
+            # BLPOP timeouts are whole seconds; 0 would block forever
+            if await self._redis.blpop([notify_key], timeout=max(1, int(remaining))):
+                # Put the token back for any other waiter on the same job
+                await self._notify(job_id)
+
+    async def _notify(self, job_id: str) -> None:
+        notify_key = f"{self.NOTIFY_PREFIX}{job_id}"
+        await self._redis.rpush(notify_key, "1")
+        await self._redis.expire(notify_key, 60)
+
+    async def read(
+        self,
+        consumer: str,
+        count: int,
+        block_ms: int,
+    ) -> list[tuple[str, InterpretationJob]]:
+        """Read new jobs for a consumer.
+
+        Args:
+            consumer: Consumer (worker) name
+            count: Maximum jobs to read
+            block_ms: Milliseconds to block when the stream is empty
+
+        Returns:
+            List of (message id, job)
+        """
+        response = await self._redis.xreadgroup(
+            self.group, consumer, {self.stream: ">"}, count=count, block=block_ms
+        )
+        return [
+            (message_id, InterpretationJob.model_validate_json(fields["job"]))
+            for message_id, fields in _stream_entries(response)
+        ]
+
+    async def claim_stale(self, consumer: str, count: int) -> list[tuple[str, InterpretationJob]]:
+        """Take over jobs left pending longer than the retry idle time.
+
+        Args:
+            consumer: Consumer (worker) name taking the jobs
+            count: Maximum jobs to claim
+
+        Returns:
+            List of (message id, job)
+        """
+        response = await self._redis.xautoclaim(
+            self.stream, self.group, consumer, self._retry_idle_ms, start_id="0-0", count=count
+        )
+        return [
+            (message_id, InterpretationJob.model_validate_json(fields["job"]))
+            for message_id, fields in response[1]
+            if fields
+        ]
+
+    async def touch(self, message_id: str, consumer: str) -> None:
+        """Reset a running job's idle time so it is not re-claimed.
+
+        Args:
+            message_id: Stream message id
+            consumer: Consumer (worker) running the job
+        """
+        await self._redis.xclaim(
+            self.stream, self.group, consumer, 0, [message_id], justid=True
+        )
+
+    async def ack(self, message_id: str) -> None:
+        """Acknowledge a job that reached a terminal state."""
+        await self._redis.xack(self.stream, self.group, message_id)
+
+    async def dead_letter(self, message_id: str, job: InterpretationJob, error: str) -> None:
+        """Move a job to the dead-letter stream and acknowledge it.
+
+        Args:
+            message_id: Stream message id
+            job: Job payload
+            error: Last failure description
+        """
+        await self._redis.xadd(self.dead_letter_stream, {
+            "job": job.model_dump_json(),
+            "error": error,
+            "message_id": message_id,
+        })
+        await self.ack(message_id)
+
+
+def get_job_queue(redis_client: aioredis.Redis = Depends(get_redis)) -> JobQueue:
+    """Get a configured JobQueue instance."""
+    return JobQueue(redis_client)
+
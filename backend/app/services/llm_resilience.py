@@ -0,0 +1,281 @@
+"""Adaptive concurrency limiting and circuit breaking for LLM providers."""
+
+import asyncio
+import time
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
+from typing import ClassVar
+
+import litellm
+
+from app.core.config import settings
+from app.core.exceptions import LLMUnavailableError
+from app.core.metrics import (
+    LLM_CIRCUIT_STATE,
+    LLM_CIRCUIT_TRANSITIONS,
+    LLM_CONCURRENCY_LIMIT,
+    LLM_IN_FLIGHT,
+    LLM_LIMITER_REJECTIONS,
+)
+
+# Provider errors that signal overload or an unhealthy provider, as opposed
+# to request errors (bad prompt, auth) that say nothing about capacity
+OVERLOAD_ERRORS: tuple[type[BaseException], ...] = (
+    *(
+        getattr(litellm, name)
+        for name in (
+            "RateLimitError",
+            "Timeout",
+            "ServiceUnavailableError",
+            "APIConnectionError",
+            "InternalServerError",
+            "BadGatewayError",
+        )
+        if hasattr(litellm, name)
+    ),
+    TimeoutError,
+)
+
+
+def is_overload_error(error: BaseException) -> bool:
+    """Whether an error indicates provider overload or unavailability."""
+    return isinstance(error, OVERLOAD_ERRORS)
+
+
+class AdaptiveLimiter:
+    """AIMD concurrency limiter.
+
+    Each successful call raises the limit by ``1 / limit`` (about +1 per
+    window of calls); each overload signal multiplies it by
+    ``decrease_factor``. Callers beyond the limit wait up to
+    ``queue_timeout`` seconds for a slot before failing fast.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        initial_limit: int | None = None,
+        min_limit: int | None = None,
+        max_limit: int | None = None,
+        decrease_factor: float = 0.5,
+        queue_timeout: float | None = None,
+    ) -> None:
+        """Initialize AdaptiveLimiter.
+
+        Args:
+            name: Provider name used in metrics
+            initial_limit: Starting concurrency limit (default from settings)
+            min_limit: Lowest limit after decreases (default from settings)
+            max_limit: Highest limit after increases (default from settings)
+            decrease_factor: Multiplier applied on overload
+            queue_timeout: Seconds to wait for a slot (default from settings)
+        """
+        self.name = name
+        self._min_limit = min_limit or settings.llm_limiter_min_limit
+        self._max_limit = max_limit or settings.llm_limiter_max_limit
+        self._limit = float(initial_limit or settings.llm_limiter_initial_limit)
+        self._decrease_factor = decrease_factor
+        self._queue_timeout = (
+            settings.llm_limiter_queue_timeout_seconds if queue_timeout is None else queue_timeout
+        )
+        self._in_flight = 0
+        self._condition = asyncio.Condition()
+        LLM_CONCURRENCY_LIMIT.labels(provider=name).set(self.limit)
+
+    @property
+    def limit(self) -> int:
+        """Current whole-number concurrency limit."""
+        return int(self._limit)
+
+    @property
+    def in_flight(self) -> int:
+        """Calls currently holding a slot."""
+        return self._in_flight
+
+    async def acquire(self) -> None:
+        """Wait for a slot.
+
+        Raises:
+            LLMUnavailableError: If no slot frees up within the queue timeout
+        """
+        async with self._condition:
+            try:
+                await asyncio.wait_for(
+                    self._condition.wait_for(lambda: self._in_flight < self.limit),
+                    timeout=self._queue_timeout,
+                )
+            except TimeoutError as e:
+                LLM_LIMITER_REJECTIONS.labels(provider=self.name).inc()
+                raise LLMUnavailableError(
+                    message=f"LLM provider {self.name} is overloaded",
+                    details={"limit": self.limit, "in_flight": self._in_flight},
+                ) from e
+            self._in_flight += 1
+            LLM_IN_FLIGHT.labels(provider=self.name).set(self._in_flight)
+
+    async def release(self, overloaded: bool = False) -> None:
+        """Return a slot and adapt the limit.
+
+        Args:
+            overloaded: Whether the call hit an overload signal
+        """
+        async with self._condition:
+            self._in_flight -= 1
+            if overloaded:
+                self._limit = max(float(self._min_limit), self._limit * self._decrease_factor)
+            else:
+                self._limit = min(float(self._max_limit), self._limit + 1 / self._limit)
+            LLM_IN_FLIGHT.labels(provider=self.name).set(self._in_flight)
+            LLM_CONCURRENCY_LIMIT.labels(provider=self.name).set(self.limit)
+            self._condition.notify_all()
+
+
+class CircuitBreaker:
+    """Consecutive-failure circuit breaker.
+
+    Closed: calls pass. After ``failure_threshold`` consecutive overload
+    failures the breaker opens and calls fail fast for ``reset_timeout``
+    seconds; it then half-opens and lets a single probe through, closing on
+    success and re-opening on failure.
+    """
+
+    CLOSED = "closed"
+    HALF_OPEN = "half_open"
+    OPEN = "open"
+    _STATE_VALUES: ClassVar[dict[str, int]] = {CLOSED: 0, HALF_OPEN: 1, OPEN: 2}
+
+    def __init__(
+        self,
+        name: str,
+        failure_threshold: int | None = None,
+        reset_timeout: float | None = None,
+    ) -> None:
+        """Initialize CircuitBreaker.
+
+        Args:
+            name: Provider name used in metrics
+            failure_threshold: Consecutive failures that open the circuit
+            reset_timeout: Seconds the circuit stays open before probing
+        """
+        self.name = name
+        self._failure_threshold = failure_threshold or settings.llm_breaker_failure_threshold
+        self._reset_timeout = (
+            settings.llm_breaker_reset_seconds if reset_timeout is None else reset_timeout
+        )
+        self._state = self.CLOSED
+        self._failures = 0
+        self._opened_at = 0.0
+        self._probe_in_flight = False
+        LLM_CIRCUIT_STATE.labels(provider=name).set(0)
+
+    @property
+    def state(self) -> str:
+        """Current state, moving open -> half_open once the timeout elapses."""
+        if (
+            self._state == self.OPEN
+            and time.monotonic() - self._opened_at >= self._reset_timeout
+        ):
+            self._transition(self.HALF_OPEN)
+        return self._state
+
+    def _transition(self, state: str) -> None:
+        if state == self._state:
+            return
+        self._state = state
+        if state == self.OPEN:
+            self._opened_at = time.monotonic()
+        self._probe_in_flight = False
+        LLM_CIRCUIT_STATE.labels(provider=self.name).set(self._STATE_VALUES[state])
+        LLM_CIRCUIT_TRANSITIONS.labels(provider=self.name, state=state).inc()
+
+    def available(self) -> bool:
+        """Whether a call would currently be allowed, without claiming it."""
+        state = self.state
+        return state == self.CLOSED or (state == self.HALF_OPEN and not self._probe_in_flight)
+
+    def allow(self) -> bool:
+        """Claim permission for a call; in half-open only one probe is allowed."""
+        if not self.available():
+            return False
+        if self._state == self.HALF_OPEN:
+            self._probe_in_flight = True
+        return True
+
+    def record_success(self) -> None:
+        """Record a healthy call."""
+        self._failures = 0
+        self._transition(self.CLOSED)
+        self._probe_in_flight = False
+
+    def record_failure(self) -> None:
+        """Record an overload failure."""
+        self._failures += 1
+        if self._state == self.HALF_OPEN or self._failures >= self._failure_threshold:
+            self._transition(self.OPEN)
+        self._probe_in_flight = False
+
+    def release_probe(self) -> None:
+        """Give back a half-open probe that ended without a verdict."""
+        self._probe_in_flight = False
+
+
+class ProviderGuard:
+    """Limiter and circuit breaker protecting one provider."""
+
+    def __init__(self, name: str) -> None:
+        """Initialize ProviderGuard.
+
+        Args:
+            name: Provider name used in metrics
+        """
+        self.name = name
+        self.limiter = AdaptiveLimiter(name)
+        self.breaker = CircuitBreaker(name)
+
+    def available(self) -> bool:
+        """Whether the provider currently accepts calls."""
+        return self.breaker.available()
+
+    @asynccontextmanager
+    async def call(self) -> AsyncIterator[None]:
+        """Hold a concurrency slot for one provider call.
+
+        Raises:
+            LLMUnavailableError: If the circuit is open or no slot is free
+        """
+        if not self.breaker.allow():
+            raise LLMUnavailableError(
+                message=f"LLM provider {self.name} is unavailable",
+                details={"circuit": self.breaker.state},
+            )
+        try:
+            await self.limiter.acquire()
+        except BaseException:
+            self.breaker.release_probe()
+            raise
+        overloaded = False
+        try:
+            yield
+        except asyncio.CancelledError:
+            # Hedge losers are cancelled; that says nothing about provider health
+            self.breaker.release_probe()
+            raise
+        except BaseException as e:
+            overloaded = is_overload_error(e)
+            if overloaded:
+                self.breaker.record_failure()
+            else:
+                self.breaker.record_success()
+            raise
+        else:
+            self.breaker.record_success()
+        finally:
+            await self.limiter.release(overloaded=overloaded)
+
+    def stats(self) -> dict[str, int | str]:
+        """Limiter and breaker state."""
+        return {
+            "limit": self.limiter.limit,
+            "in_flight": self.limiter.in_flight,
+            "circuit": self.breaker.state,
+        }
@@ -0,0 +1,347 @@
+"""Provider routing with hedged requests for LLM completions."""
+
+import asyncio
+import contextlib
+import logging
+import time
+from collections import deque
+from collections.abc import Awaitable, Callable
+from typing import Any, TypeVar
+
+from pydantic import BaseModel
+
+from app.core.config import settings
+from app.core.exceptions import LLMUnavailableError
+from app.core.metrics import LLM_FAILOVERS, LLM_HEDGED_REQUESTS
+from app.services import llm_telemetry
+from app.services.llm_resilience import ProviderGuard
+
+T = TypeVar("T")
+
+# Receives every provider response, e.g. to record token usage
+ResponseHook = Callable[["LLMProvider", Any], Awaitable[None]]
+
+logger = logging.getLogger(__name__)
+
+DEEPSEEK_BASE_URL = "https://api.deepseek.com"
+
+
+class LLMProvider(BaseModel):
+    """A model endpoint that completions can be routed to."""
+
+    name: str
+    model: str
+    api_key: str
+    base_url: str | None = None
+
+    @classmethod
+    def for_model(cls, model: str, api_key: str | None = None) -> "LLMProvider":
+        """Build a provider for a model, taking credentials from settings.
+
+        ``settings.llm_base_url`` redirects every provider to one endpoint,
+        e.g. the local mock server in ``benchmarks.mock_llm``.
+
+        Args:
+            model: litellm model name
+            api_key: API key override
+
+        Returns:
+            LLMProvider (api_key may be empty if not configured)
+        """
+        if "deepseek" in model.lower():
+            # Explicit base_url avoids 401s on DeepSeek's beta endpoint
+            return cls(
+                name="deepseek",
+                model=model,
+                api_key=api_key or settings.deepseek_api_key,
+                base_url=settings.llm_base_url or DEEPSEEK_BASE_URL,
+            )
+        return cls(
+            name="openai",
+            model=model,
+            api_key=api_key or settings.openai_api_key,
+            base_url=settings.llm_base_url or None,
+        )
+
+    def completion_kwargs(self, messages: list[dict[str, str]], **options: Any) -> dict[str, Any]:
+        """Build litellm.acompletion arguments for this provider.
+
+        Args:
+            messages: Chat messages
+            **options: Extra completion options (e.g. stream=True)
+
+        Returns:
+            Keyword arguments for litellm.acompletion
+        """
+        kwargs: dict[str, Any] = {
+            "model": self.model,
+            "messages": messages,
+            "api_key": self.api_key,
+            "response_format": {"type": "json_object"},
+            **options,
+        }
+        if self.base_url:
+            kwargs["base_url"] = self.base_url
+        return kwargs
+
+
+class LatencyTracker:
+    """Rolling window of successful completion latencies for one provider."""
+
+    def __init__(self, window: int = 200, min_samples: int = 20) -> None:
+        """Initialize LatencyTracker.
+
+        Args:
+            window: Number of recent samples kept
+            min_samples: Samples required before quantiles are reported
+        """
+        self._samples: deque[float] = deque(maxlen=window)
+        self._min_samples = min_samples
+
+    def record(self, seconds: float) -> None:
+        """Record a completion latency."""
+        self._samples.append(seconds)
+
+    def quantile(self, q: float) -> float | None:
+        """Latency at quantile q, or None until enough samples exist."""
+        if len(self._samples) < self._min_samples:
+            return None
+        ordered = sorted(self._samples)
+        return ordered[min(len(ordered) - 1, int(q * len(ordered)))]
+
+    def snapshot(self) -> dict[str, Any]:
+        """Sample count and p50/p90/p99 latencies."""
+        return {
+            "count": len(self._samples),
+            "p50": self.quantile(0.5),
+            "p90": self.quantile(0.9),
+            "p99": self.quantile(0.99),
+        }
+
+
+class HedgeBudget:
+    """Token bucket capping hedged requests to a fraction of all requests.
+
+    Every primary request deposits ``ratio`` tokens (up to ``burst``) and
+    every hedge spends one, so over time at most ``ratio`` of requests are
+    duplicated no matter how slow the primary gets.
+    """
+
+    def __init__(self, ratio: float, burst: float = 10.0) -> None:
+        self._ratio = ratio
+        self._burst = burst
+        self._tokens = burst if ratio > 0 else 0.0
+
+    def deposit(self) -> None:
+        """Credit one primary request."""
+        self._tokens = min(self._burst, self._tokens + self._ratio)
+
+    def try_spend(self) -> bool:
+        """Spend a token for a hedge; False if the budget is exhausted."""
+        if self._tokens >= 1.0:
+            self._tokens -= 1.0
+            return True
+        return False
+
+
+class LLMRouter:
+    """Route completions to a primary provider, hedging to a secondary.
+
+    If the primary has not answered within its observed latency quantile
+    (p90 by default), the same request is issued to the secondary. The
+    first response that parses wins and the other request is cancelled.
+    While the primary's circuit is open, calls fail over to the fallback
+    providers in order, then to the secondary.
+    """
+
+    def __init__(
+        self,
+        primary: LLMProvider,
+        secondary: LLMProvider | None = None,
+        hedge_quantile: float | None = None,
+        hedge_ratio: float | None = None,
+        min_delay: float | None = None,
+        initial_delay: float | None = None,
+        fallbacks: list[LLMProvider] | None = None,
+        completion_options: dict[str, Any] | None = None,
+        guards: dict[str, ProviderGuard] | None = None,
+    ) -> None:
+        """Initialize LLMRouter.
+
+        Args:
+            primary: Provider every request goes to first
+            secondary: Provider for hedged requests (hedging disabled if None)
+            hedge_quantile: Primary latency quantile that triggers a hedge
+            hedge_ratio: Maximum fraction of requests that may be hedged
+            min_delay: Lower bound on the hedge delay in seconds
+            initial_delay: Hedge delay used until enough latencies are recorded
+            fallbacks: Providers tried in order while the primary is unavailable
+            completion_options: Extra completion arguments (e.g. max_tokens)
+            guards: Guard registry shared with other routers, so a model has
+                one limiter and breaker however many tasks use it
+        """
+        self.primary = primary
+        self.secondary = secondary
+        self.fallbacks = [p for p in fallbacks or [] if p.model != primary.model]
+        self.completion_options = completion_options or {}
+        self._hedge_quantile = hedge_quantile or settings.llm_hedge_quantile
+        self._min_delay = settings.llm_hedge_min_delay_seconds if min_delay is None else min_delay
+        self._initial_delay = initial_delay or settings.llm_hedge_initial_delay_seconds
+        self._budget = HedgeBudget(
+            settings.llm_hedge_max_ratio if hedge_ratio is None else hedge_ratio
+        )
+        self._latency = {provider.model: LatencyTracker() for provider in self.providers}
+        self._guards = {} if guards is None else guards
+        for provider in self.providers:
+            if provider.model not in self._guards:
+                self._guards[provider.model] = ProviderGuard(provider.model)
+        self._counters = {"requests": 0, "hedged": 0, "hedge_wins": 0, "failovers": 0}
+
+    @property
+    def providers(self) -> list[LLMProvider]:
+        """Configured providers in failover order, primary first."""
+        providers: list[LLMProvider] = []
+        for provider in (self.primary, *self.fallbacks, self.secondary):
+            if provider is not None and all(p.model != provider.model for p in providers):
+                providers.append(provider)
+        return providers
+
+    def guard(self, provider: LLMProvider) -> ProviderGuard:
+        """Concurrency limiter and circuit breaker for a provider."""
+        return self._guards[provider.model]
+
+    def select_provider(self) -> LLMProvider:
+        """Pick the provider for a non-hedged call, failing over if needed.
+
+        Returns:
+            The primary, or the first available fallback (then the
+            secondary) while the primary's circuit is open
+
+        Raises:
+            LLMUnavailableError: If no provider is accepting calls
+        """
+        if self.guard(self.primary).available():
+            return self.primary
+        for provider in self.providers[1:]:
+            if self.guard(provider).available():
+                self._counters["failovers"] += 1
+                LLM_FAILOVERS.labels(provider=provider.model).inc()
+                return provider
+        raise LLMUnavailableError(
+            message="No LLM provider is available",
+            details={"providers": [p.model for p in self.providers]},
+        )
+
+    def hedge_delay(self) -> float:
+        """Seconds to wait on the primary before hedging."""
+        observed = self._latency[self.primary.model].quantile(self._hedge_quantile)
+        if observed is None:
+            return self._initial_delay
+        return max(self._min_delay, observed)
+
+    async def _attempt(
+        self,
+        provider: LLMProvider,
+        messages: list[dict[str, str]],
+        parse: Callable[[str], T],
+        on_response: ResponseHook | None = None,
+        task: str = "completion",
+    ) -> T:
+        started = time.perf_counter()
+        async with self.guard(provider).call():
+            response = await llm_telemetry.acompletion(
+                task, **provider.completion_kwargs(messages, **self.completion_options)
+            )
+        if on_response is not None:
+            await on_response(provider, response)
+        # Parse failures are the model's output, not provider health
+        result = parse(response.choices[0].message.content)
+        self._latency[provider.model].record(time.perf_counter() - started)
+        return result
+
+    async def complete(
+        self,
+        messages: list[dict[str, str]],
+        parse: Callable[[str], T],
+        on_response: ResponseHook | None = None,
+        task: str = "completion",
+    ) -> T:
+        """Run a completion, hedging to the secondary provider if slow.
+
+        Args:
+            messages: Chat messages
+            parse: Converts response text to a result; raising rejects it
+            on_response: Awaited with every provider response, hedges included
+            task: Prompt task used to tag telemetry
+
+        Returns:
+            First successfully parsed result
+
+        Raises:
+            LLMUnavailableError: If no provider is accepting calls
+            Exception: The primary's error if no attempt succeeded
+        """
+        self._counters["requests"] += 1
+        provider = self.select_provider()
+        if provider is not self.primary:
+            return await self._attempt(provider, messages, parse, on_response, task)
+
+        self._budget.deposit()
+        started = time.perf_counter()
+        primary_task = asyncio.create_task(
+            self._attempt(self.primary, messages, parse, on_response, task)
+        )
+        attempts = [primary_task]
+        try:
+            if self.secondary is None:
+                return await primary_task
+
+            done, _ = await asyncio.wait({primary_task}, timeout=self.hedge_delay())
+            if done and primary_task.exception() is None:
+                return primary_task.result()
+            if not self.guard(self.secondary).available() or not self._budget.try_spend():
+                return await primary_task
+
+            self._counters["hedged"] += 1
+            LLM_HEDGED_REQUESTS.labels(provider=self.secondary.model).inc()
+            secondary_task = asyncio.create_task(
+                self._attempt(self.secondary, messages, parse, on_response, task)
+            )
+            attempts.append(secondary_task)
+            pending = set(attempts)
+            while pending:
+                done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                for finished in done:
+                    if finished.exception() is None:
+                        if finished is secondary_task:
+                            self._counters["hedge_wins"] += 1
+                        return finished.result()
+                    logger.warning("LLM attempt failed during hedge: %s", finished.exception())
+            # Both attempts failed; surface the primary's error
+            return primary_task.result()
+        finally:
+            primary_unfinished = not primary_task.done()
+            for attempt in attempts:
+                if not attempt.done():
+                    attempt.cancel()
+                    with contextlib.suppress(asyncio.CancelledError, Exception):
+                        await attempt
+            if primary_unfinished:
+                # Record the cancelled primary's elapsed time as a lower bound so
+                # slow periods still raise the observed quantile
+                self._latency[self.primary.model].record(time.perf_counter() - started)
+
+    def stats(self) -> dict[str, Any]:
+        """Request/hedge counters and per-provider latency and guard state."""
+        return {
+            **self._counters,
+            "hedge_delay_seconds": self.hedge_delay() if self.secondary else None,
+            "providers": {
+                provider.model: {
+                    "name": provider.name,
+                    **self._latency[provider.model].snapshot(),
+                    **self.guard(provider).stats(),
+                }
+                for provider in self.providers
+            },
+        }
@@ -1,14 +1,57 @@
 """LLM service for question validation and tarot interpretation."""
 
+import asyncio
+import contextlib
+import functools
+import json
+import logging
+from collections.abc import AsyncIterator, Callable, Collection
 from pathlib import Path
-from typing import Any
+from typing import TYPE_CHECKING, Any, TypeVar
 
+import httpx
 import litellm
-from jinja2 import Environment, FileSystemLoader
-from pydantic import BaseModel
+from jinja2 import Environment, FileSystemLoader, Template
+from pydantic import BaseModel, ValidationError
 
 from app.core.config import settings
-from app.core.exceptions import TarotError
+from app.core.exceptions import LLMUnavailableError, TarotError
+from app.core.metrics import DEGRADED_READINGS, LLM_OUTPUT_REPAIRS
+from app.core.redis import get_redis
+from app.data.card_registry import CARD_REGISTRY
+from app.services import llm_telemetry
+from app.services.llm_resilience import ProviderGuard
+from app.services.llm_router import LLMProvider, LLMRouter
+from app.services.prompt_cache_stats import PromptCacheStats
+from app.services.singleflight import RedisSingleFlight, SingleFlight, prompt_key
+from app.services.spreads import SPREADS, card_positions
+
+if TYPE_CHECKING:
+    from app.services.card_library import CardLibrary
+    from app.services.interpretation_cache import InterpretationCache
+    from app.services.question_filter import QuestionPrefilter
+    from app.services.question_index import QuestionIndex
+
+ModelT = TypeVar("ModelT", bound=BaseModel)
+
+logger = logging.getLogger(__name__)
+
+PROMPT_TEMPLATES = (
+    "system.j2", "validation.j2", "interpretation.j2", "reading.j2", "cards.j2", "synthesis.j2"
+)
+# Task templates split into a static "instructions" block, sent as the system
+# message, and a per-user "request" block, sent last as the user message.
+# "cards" and "synthesis" interpret large spreads in parallel parts.
+TASK_TEMPLATES = (
+    "validation.j2", "interpretation.j2", "reading.j2", "cards.j2", "synthesis.j2"
+)
+TASKS = tuple(name.removesuffix(".j2") for name in TASK_TEMPLATES)
+SUPPORTED_LANGUAGES = ("zh", "ja", "en")
+# "single": one completion writes every card and the overall interpretation;
+# "parallel": one concurrent completion per card, then a synthesis call
+INTERPRETATION_MODES = ("single", "parallel")
+
+OPENAI_BASE_URL = "https://api.openai.com"
 
 
 class ValidationResult(BaseModel):
@@ -26,6 +69,8 @@ class CardInterpretation(BaseModel):
     card_name: str
     position: str
     interpretation: str
+    # Key of the card's position in its spread (e.g. "past"), set by the service
+    spread_position: str | None = None
 
 
 class InterpretationResult(BaseModel):
@@ -33,6 +78,356 @@ class InterpretationResult(BaseModel):
 
     interpretations: list[CardInterpretation]
     overall_interpretation: str
+    # Built from the precomputed card library instead of the LLM
+    degraded: bool = False
+
+
+class CardBatchResult(BaseModel):
+    """Interpretations of some of a spread's cards."""
+
+    interpretations: list[CardInterpretation]
+
+
+class SynthesisResult(BaseModel):
+    """Overall interpretation written from per-card interpretations."""
+
+    overall_interpretation: str
+
+
+class CombinedReadingResult(BaseModel):
+    """Result of a merged validation + interpretation completion."""
+
+    suitable: bool
+    reason: str
+    redirect_message: str | None = None
+    interpretations: list[CardInterpretation] = []
+    overall_interpretation: str | None = None
+
+    def to_validation(self) -> ValidationResult:
+        """Extract the validation verdict."""
+        return ValidationResult(
+            suitable=self.suitable,
+            reason=self.reason,
+            redirect_message=self.redirect_message,
+        )
+
+    def to_interpretation(self) -> InterpretationResult | None:
+        """Extract the interpretation, or None for rejected questions."""
+        if not self.suitable or self.overall_interpretation is None:
+            return None
+        return InterpretationResult(
+            interpretations=self.interpretations,
+            overall_interpretation=self.overall_interpretation,
+        )
+
+
+class PartialOutputError(ValueError):
+    """Model output is missing parts, but some card interpretations survived.
+
+    Raised for output cut off at the token limit or missing cards, so the
+    caller can ask for just the missing parts instead of starting over.
+    """
+
+    def __init__(
+        self,
+        interpretations: list[CardInterpretation],
+        missing: list[int],
+        overall_interpretation: str | None = None,
+    ) -> None:
+        self.interpretations = interpretations
+        self.missing = missing
+        self.overall_interpretation = overall_interpretation
+        super().__init__(
+            f"Interpretation output is incomplete (missing cards {missing}"
+            f"{'' if overall_interpretation else ' and overall interpretation'})"
+        )
+
+
+def repair_json(text: str) -> str:
+    """Fix common defects in model JSON output.
+
+    Keeps only the first top-level object (dropping markdown fences and
+    prose around it), removes trailing commas before closing brackets and
+    escapes raw newlines inside strings. Truncated output is left unclosed;
+    salvaging it is up to the caller.
+
+    Args:
+        text: Raw model output
+
+    Returns:
+        Repaired JSON text
+    """
+    start = text.find("{")
+    if start < 0:
+        return text.strip()
+
+    out: list[str] = []
+    depth = 0
+    in_string = escape = pending_comma = False
+    for char in text[start:]:
+        if in_string:
+            if escape:
+                escape = False
+            elif char == "\\":
+                escape = True
+            elif char == '"':
+                in_string = False
+            elif char == "\n":
+                char = "\\n"
+            out.append(char)
+            continue
+        if char.isspace():
+            if not pending_comma:
+                out.append(char)
+            continue
+        if char == ",":
+            pending_comma = True
+            continue
+        if pending_comma:
+            pending_comma = False
+            if char not in "}]":
+                out.append(",")
+        out.append(char)
+        if char == '"':
+            in_string = True
+        elif char in "{[":
+            depth += 1
+        elif char in "}]":
+            depth -= 1
+            if depth == 0:
+                break
+    return "".join(out)
+
+
+def parse_json_model(model: type[ModelT], content: str) -> ModelT:
+    """Parse model output into a result model, repairing it if needed.
+
+    Args:
+        model: Result model class
+        content: Raw model output
+
+    Returns:
+        Parsed result
+
+    Raises:
+        ValidationError: If the output is invalid even after repair
+    """
+    try:
+        return model.model_validate_json(content)
+    except ValidationError:
+        repaired = repair_json(content)
+        if repaired == content:
+            raise
+    result = model.model_validate_json(repaired)
+    LLM_OUTPUT_REPAIRS.labels(result=model.__name__, kind="repaired").inc()
+    return result
+
+
+class InterpretationStreamParser:
+    """Incremental, tolerant parser for interpretation JSON.
+
+    Tracks string/escape state and nesting depth over the raw model output so
+    that each object in the top-level ``interpretations`` array can be parsed
+    as soon as its closing brace arrives. Works the same on a whole response
+    fed at once, so complete cards survive output that is later cut off.
+    """
+
+    def __init__(self) -> None:
+        self._text = ""
+        self._pos = 0
+        self._depth = 0
+        self._in_string = False
+        self._escape = False
+        self._string_start = 0
+        self._last_key: str | None = None
+        self._after_colon = False
+        self._array_depth: int | None = None
+        self._object_start: int | None = None
+        self._cards: dict[int, CardInterpretation] = {}
+        self._overall: str | None = None
+
+    @property
+    def content(self) -> str:
+        """All text received so far."""
+        return self._text
+
+    def _top_level_string(self, raw: str) -> None:
+        """Record a key or value string closed at the top level."""
+        if not self._after_colon:
+            self._last_key = raw[1:-1]
+            return
+        self._after_colon = False
+        if self._last_key == "overall_interpretation":
+            self._overall = json.loads(raw, strict=False)
+
+    def _card(self, raw: str) -> CardInterpretation | None:
+        """Parse one card object, skipping it if unusable."""
+        try:
+            card = parse_json_model(CardInterpretation, raw)
+        except ValidationError:
+            logger.warning("Skipping malformed card interpretation: %s", raw[:200])
+            return None
+        if card.card_index in self._cards:
+            return None
+        self._cards[card.card_index] = card
+        return card
+
+    def feed(self, chunk: str) -> list[CardInterpretation]:
+        """Consume a chunk of model output.
+
+        Args:
+            chunk: Next piece of streamed text
+
+        Returns:
+            Card interpretations completed by this chunk
+        """
+        self._text += chunk
+        completed: list[CardInterpretation] = []
+        text = self._text
+
+        while self._pos < len(text):
+            char = text[self._pos]
+            if self._in_string:
+                if self._escape:
+                    self._escape = False
+                elif char == "\\":
+                    self._escape = True
+                elif char == '"':
+                    self._in_string = False
+                    if self._depth == 1:
+                        self._top_level_string(text[self._string_start : self._pos + 1])
+            elif char == '"':
+                self._in_string = True
+                self._string_start = self._pos
+            elif char in ":," and self._depth == 1:
+                self._after_colon = char == ":"
+            elif char in "{[":
+                self._depth += 1
+                if char == "[" and self._depth == 2 and self._last_key == "interpretations":
+                    self._array_depth = self._depth
+                elif (
+                    char == "{"
+                    and self._array_depth is not None
+                    and self._depth == self._array_depth + 1
+                ):
+                    self._object_start = self._pos
+            elif char in "}]":
+                if (
+                    char == "}"
+                    and self._object_start is not None
+                    and self._depth == self._array_depth + 1
+                ):
+                    card = self._card(text[self._object_start : self._pos + 1])
+                    if card is not None:
+                        completed.append(card)
+                    self._object_start = None
+                elif char == "]" and self._depth == self._array_depth:
+                    self._array_depth = None
+                self._depth -= 1
+            self._pos += 1
+
+        return completed
+
+    def result(self, expected: Collection[int] | None = None) -> InterpretationResult:
+        """Build the final result from everything fed so far.
+
+        Args:
+            expected: Card indices the output must cover (any if None)
+
+        Returns:
+            InterpretationResult
+
+        Raises:
+            PartialOutputError: If cards or the overall interpretation are
+                missing but at least one card was salvaged
+            ValueError: If nothing usable was found
+        """
+        try:
+            parsed = parse_json_model(InterpretationResult, self._text)
+            cards = {card.card_index: card for card in reversed(parsed.interpretations)}
+            overall: str | None = parsed.overall_interpretation
+        except ValidationError:
+            cards, overall = self._cards, self._overall
+
+        interpretations = [cards[index] for index in sorted(cards)]
+        missing = sorted(set(expected or ()) - cards.keys())
+        # A re-ask for only the overall interpretation expects no cards
+        if overall and not missing and (interpretations or expected is not None):
+            return InterpretationResult(
+                interpretations=interpretations, overall_interpretation=overall
+            )
+        if not interpretations:
+            raise ValueError("No card interpretations found in model output")
+        raise PartialOutputError(interpretations, missing, overall)
+
+
+def parse_interpretation(
+    content: str,
+    expected: Collection[int] | None = None,
+) -> InterpretationResult:
+    """Parse interpretation output, salvaging complete cards.
+
+    Args:
+        content: Raw model output
+        expected: Card indices the output must cover (any if None)
+
+    Returns:
+        InterpretationResult
+
+    Raises:
+        PartialOutputError: If only some parts are usable
+        ValueError: If nothing usable was found
+    """
+    parser = InterpretationStreamParser()
+    parser.feed(content)
+    return parser.result(expected)
+
+
+def parse_card_batch(content: str, expected: Collection[int]) -> list[CardInterpretation]:
+    """Parse a part of a split interpretation.
+
+    Args:
+        content: Model output
+        expected: Card indices the part was asked for
+
+    Returns:
+        One interpretation per expected card, in index order
+
+    Raises:
+        ValueError: If the output is not valid JSON or misses a card
+    """
+    batch = parse_json_model(CardBatchResult, content)
+    cards = {card.card_index: card for card in batch.interpretations if card.card_index in expected}
+    missing = sorted(set(expected) - set(cards))
+    if missing:
+        raise ValueError(f"Card interpretations missing for {missing}")
+    return [cards[index] for index in sorted(cards)]
+
+
+def encode_result(result: BaseModel | list[CardInterpretation]) -> str:
+    """Serialize a parsed completion so its parser can restore it.
+
+    Card batches are parsed from a ``{"interpretations": [...]}`` object, so
+    a list of card interpretations is wrapped in a CardBatchResult.
+    """
+    if isinstance(result, list):
+        result = CardBatchResult(interpretations=result)
+    return result.model_dump_json()
+
+
+def place_cards(
+    interpretations: list[CardInterpretation],
+    cards: list[dict[str, Any]],
+) -> list[CardInterpretation]:
+    """Tag interpretations with the spread position of the card they read."""
+    return [
+        interpretation.model_copy(update={
+            "spread_position": cards[interpretation.card_index].get("spread_position")
+        })
+        if 0 <= interpretation.card_index < len(cards)
+        else interpretation
+        for interpretation in interpretations
+    ]
 
 
 class LLMService:
@@ -42,47 +437,409 @@ class LLMService:
         self,
         api_key: str | None = None,
         model: str | None = None,
+        cache: "InterpretationCache | None" = None,
+        prefilter: "QuestionPrefilter | None" = None,
+        question_index: "QuestionIndex | None" = None,
+        http_client: httpx.AsyncClient | None = None,
+        router: LLMRouter | None = None,
+        singleflight: SingleFlight | None = None,
+        prompt_cache_stats: PromptCacheStats | None = None,
+        card_library: "CardLibrary | None" = None,
     ) -> None:
         """Initialize LLMService.
 
         Args:
             api_key: API key (default from settings)
             model: Model name (default from settings)
+            cache: Interpretation result cache (disabled if None)
+            prefilter: Keyword prefilter for validation (default bundled keywords)
+            question_index: Near-duplicate verdict index (disabled if None)
+            http_client: Shared keep-alive client used to warm provider connections
+            router: Provider router for every task (default one router per
+                task from the per-task model settings plus configured hedge)
+            singleflight: Coalescer for identical in-flight completions
+                (default in-process, disabled by settings)
+            prompt_cache_stats: Prefix-cache token counters (disabled if None)
+            card_library: Precomputed meanings served when no LLM is available
+                (default bundled library, disabled by settings)
         """
+        from app.services.card_library import get_card_library
+        from app.services.question_filter import get_question_prefilter
+
         # Prioritize DeepSeek as requested by the user
         self._model = model or settings.deepseek_model or settings.openai_model
-        
-        if "deepseek" in self._model.lower():
-            self._api_key = api_key or settings.deepseek_api_key
-        else:
-            self._api_key = api_key or settings.openai_api_key
+        primary = LLMProvider.for_model(self._model, api_key)
+        self._api_key = primary.api_key
 
         if not self._api_key:
             raise TarotError(
                 message=f"LLM API key is missing for model {self._model}. "
                 "Please check your .env file and ensure DEEPSEEK_API_KEY or OPENAI_API_KEY is set."
             )
-        
-        # Initialize Jinja2 environment
+
+        if router is not None:
+            self._routers = dict.fromkeys(TASKS, router)
+        else:
+            # Routers share guards so a model has one breaker across tasks
+            guards: dict[str, ProviderGuard] = {}
+            self._routers = {
+                task: self._task_router(task, primary, guards) for task in TASKS
+            }
+        self._cache = cache
+        self._prefilter = prefilter or get_question_prefilter()
+        self._question_index = question_index
+        self._http_client = http_client
+        if singleflight is None and settings.llm_singleflight_enabled:
+            singleflight = SingleFlight()
+        self._singleflight = singleflight
+        self._prompt_cache_stats = prompt_cache_stats
+        if card_library is None and settings.card_library_fallback_enabled:
+            card_library = get_card_library()
+        self._card_library = card_library
+
+        # Initialize Jinja2 environment and compile prompt templates up front
         template_dir = Path(__file__).resolve().parent.parent / "templates" / "prompts"
         self._jinja_env = Environment(
             loader=FileSystemLoader(template_dir),
             trim_blocks=True,
             lstrip_blocks=True,
         )
+        self._templates: dict[str, Template] = {
+            name: self._jinja_env.get_template(name) for name in PROMPT_TEMPLATES
+        }
+        self._system_prompts = {
+            (template_name, language): self._render_system_prompt(template_name, language)
+            for template_name in TASK_TEMPLATES
+            for language in SUPPORTED_LANGUAGES
+        }
 
-    def _render_template(self, template_name: str, **kwargs: Any) -> str:
-        """Render a Jinja2 template.
+    def _render_template(
+        self,
+        template_name: str,
+        block: str | None = None,
+        **kwargs: Any,
+    ) -> str:
+        """Render a Jinja2 template, or a single block of it.
 
         Args:
             template_name: Name of the template file
+            block: Block to render ("instructions" or "request"); whole template if None
             **kwargs: Context variables for the template
 
         Returns:
             Rendered string
         """
-        template = self._jinja_env.get_template(template_name)
-        return template.render(**kwargs)
+        template = self._templates.get(template_name)
+        if template is None:
+            template = self._jinja_env.get_template(template_name)
+        if block is None:
+            return template.render(**kwargs)
+        context = template.new_context(kwargs)
+        return "".join(template.blocks[block](context)).strip()
+
+    def _render_system_prompt(self, template_name: str, language: str) -> str:
+        """Render a task's static instructions followed by the language rule."""
+        return self._render_template(
+            "system.j2",
+            instructions=self._render_template(template_name, block="instructions"),
+            language=language,
+        )
+
+    @property
+    def router(self) -> LLMRouter:
+        """Provider router used for interpretations."""
+        return self._routers["interpretation"]
+
+    @property
+    def routers(self) -> dict[str, LLMRouter]:
+        """Provider router per prompt task."""
+        return self._routers
+
+    def _system_prompt(self, template_name: str, language: str) -> str:
+        """Get a task's system prompt, pre-rendered for supported languages.
+
+        The system prompt holds only static text, so every request for the
+        same task and language shares a byte-identical prefix that providers
+        can serve from their prompt cache.
+        """
+        prompt = self._system_prompts.get((template_name, language))
+        if prompt is None:
+            prompt = self._render_system_prompt(template_name, language)
+        return prompt
+
+    def _prompt_messages(
+        self,
+        template_name: str,
+        language: str,
+        **kwargs: Any,
+    ) -> list[dict[str, str]]:
+        """Build chat messages: static instructions first, per-user data last.
+
+        Args:
+            template_name: Task template name
+            language: User's preferred language (zh/ja/en)
+            **kwargs: Per-user template variables (question, gender, cards)
+
+        Returns:
+            System and user chat messages
+        """
+        cards = kwargs.get("cards")
+        if cards:
+            # Cards are named by id; names are resolved here in the user's language
+            cards = kwargs["cards"] = CARD_REGISTRY.localize(cards, language)
+            # Spread positions are rendered next to the cards they belong to
+            kwargs.setdefault("positions", card_positions(cards))
+            kwargs.setdefault("spread", SPREADS.get(cards[0].get("spread") or ""))
+        return self._messages(
+            self._system_prompt(template_name, language),
+            self._render_template(template_name, block="request", **kwargs),
+        )
+
+    @staticmethod
+    def _hedge_provider(primary: LLMProvider) -> LLMProvider | None:
+        """Secondary provider for hedged requests, if one is configured."""
+        if not settings.llm_hedge_enabled:
+            return None
+        model = settings.llm_hedge_model or (
+            settings.openai_model if primary.name == "deepseek" else settings.deepseek_model
+        )
+        provider = LLMProvider.for_model(model)
+        if not provider.api_key or provider.model == primary.model:
+            return None
+        return provider
+
+    def _task_router(
+        self,
+        task: str,
+        default: LLMProvider,
+        guards: dict[str, ProviderGuard],
+    ) -> LLMRouter:
+        """Build the router for one task from the per-task settings.
+
+        Models without an API key are skipped with a warning; if none is
+        left, the task uses the default provider.
+
+        Args:
+            task: Prompt task name
+            default: Provider of the default model
+            guards: Guard registry shared by all task routers
+
+        Returns:
+            Router with the task's model chain and completion options
+        """
+        chain = [
+            settings.llm_task_models.get(task) or default.model,
+            *settings.llm_task_fallbacks.get(task, []),
+        ]
+        providers: list[LLMProvider] = []
+        for model in chain:
+            provider = default if model == default.model else LLMProvider.for_model(model)
+            if not provider.api_key:
+                logger.warning("No API key for %s model %s; skipping it", task, model)
+            elif all(p.model != provider.model for p in providers):
+                providers.append(provider)
+        primary, *fallbacks = providers or [default]
+
+        options: dict[str, Any] = {}
+        if task in settings.llm_task_max_tokens:
+            options["max_tokens"] = settings.llm_task_max_tokens[task]
+        if task in settings.llm_task_temperature:
+            options["temperature"] = settings.llm_task_temperature[task]
+        return LLMRouter(
+            primary,
+            self._hedge_provider(primary),
+            fallbacks=fallbacks,
+            completion_options=options,
+            guards=guards,
+        )
+
+    async def warm_up(self, timeout: float | None = None) -> None:
+        """Open keep-alive connections to every routed provider.
+
+        Any HTTP response means the TCP and TLS handshakes are done and the
+        connection is pooled for the first real completion; failures are
+        logged and ignored.
+
+        Args:
+            timeout: Seconds to wait (default from settings)
+        """
+        if self._http_client is None:
+            return
+        urls = {
+            provider.base_url or OPENAI_BASE_URL
+            for router in self._routers.values()
+            for provider in router.providers
+        }
+        for url in sorted(urls):
+            try:
+                await self._http_client.get(
+                    url, timeout=timeout or settings.llm_warmup_timeout_seconds
+                )
+            except httpx.HTTPError:
+                logger.warning("LLM provider warm-up failed for %s", url, exc_info=True)
+
+    @property
+    def singleflight(self) -> SingleFlight | None:
+        """Coalescer for identical in-flight completions, if enabled."""
+        return self._singleflight
+
+    async def _record_usage(self, template_name: str, language: str, usage: Any) -> None:
+        """Record prompt/cached token usage, ignoring stats failures."""
+        if self._prompt_cache_stats is None:
+            return
+        try:
+            await self._prompt_cache_stats.record(
+                template_name.removesuffix(".j2"), language, usage
+            )
+        except Exception:
+            logger.warning("Prompt cache stats update failed", exc_info=True)
+
+    async def _complete(
+        self,
+        template_name: str,
+        language: str,
+        parse: Callable[[str], ModelT],
+        **kwargs: Any,
+    ) -> ModelT:
+        """Render a task prompt and route its completion.
+
+        Identical prompts already in flight share a single completion.
+
+        Args:
+            template_name: Task template name
+            language: User's preferred language (zh/ja/en)
+            parse: Converts response text to a result model
+            **kwargs: Per-user template variables
+
+        Returns:
+            Parsed result
+        """
+        messages = self._prompt_messages(template_name, language, **kwargs)
+        task = template_name.removesuffix(".j2")
+
+        async def on_response(provider: LLMProvider, response: Any) -> None:
+            await self._record_usage(template_name, language, getattr(response, "usage", None))
+
+        call = functools.partial(
+            self._routers[task].complete,
+            messages,
+            parse,
+            on_response,
+            task=task,
+        )
+        if self._singleflight is None:
+            return await call()
+
+        key = prompt_key(messages, task)
+        if isinstance(self._singleflight, RedisSingleFlight):
+            return await self._singleflight.do_shared(key, call, encode_result, parse)
+        return await self._singleflight.do(key, call)
+
+    @staticmethod
+    def _messages(system_prompt: str, user_prompt: str) -> list[dict[str, str]]:
+        """Build chat messages for a system/user prompt pair."""
+        return [
+            {"role": "system", "content": system_prompt},
+            {"role": "user", "content": user_prompt},
+        ]
+
+    def _interpretation_cache_key(
+        self,
+        question: str,
+        gender: str,
+        cards: list[dict[str, Any]],
+        language: str,
+    ) -> str | None:
+        """Build the interpretation cache key, or None when caching is off."""
+        if self._cache is None:
+            return None
+        return self._cache.build_key(
+            question,
+            gender,
+            cards,
+            language,
+            self.router.primary.model,
+            settings.prompt_template_version,
+        )
+
+    async def _cached_interpretation(
+        self,
+        question: str,
+        gender: str,
+        cards: list[dict[str, Any]],
+        language: str,
+    ) -> tuple[str | None, InterpretationResult | None]:
+        """Look up a cached interpretation.
+
+        Cache failures are logged and treated as a miss so that Redis problems
+        never fail a reading.
+
+        Returns:
+            Tuple of (cache key, cached result); both None when caching is off
+        """
+        key = self._interpretation_cache_key(question, gender, cards, language)
+        if key is None:
+            return None, None
+
+        try:
+            return key, await self._cache.get(key)
+        except Exception:
+            logger.warning("Interpretation cache lookup failed", exc_info=True)
+            return key, None
+
+    async def _store_interpretation(
+        self,
+        key: str | None,
+        result: InterpretationResult,
+    ) -> None:
+        """Store an interpretation in the cache, ignoring cache failures."""
+        if self._cache is None or key is None:
+            return
+        try:
+            await self._cache.set(key, result)
+        except Exception:
+            logger.warning("Interpretation cache store failed", exc_info=True)
+
+    async def _indexed_verdict(self, question: str, language: str) -> ValidationResult | None:
+        """Reuse the verdict of a near-duplicate question, if indexed.
+
+        Sensitive questions are never matched by similarity: a small wording
+        change can flip their meaning.
+        """
+        if self._question_index is None or self._prefilter.is_sensitive(question):
+            return None
+        try:
+            return await self._question_index.lookup(question, language)
+        except Exception:
+            logger.warning("Question index lookup failed", exc_info=True)
+            return None
+
+    async def _index_verdict(
+        self,
+        question: str,
+        language: str,
+        result: ValidationResult,
+    ) -> None:
+        """Index a fresh LLM verdict, ignoring index failures."""
+        if self._question_index is None or self._prefilter.is_sensitive(question):
+            return
+        try:
+            await self._question_index.add(question, language, result)
+        except Exception:
+            logger.warning("Question index store failed", exc_info=True)
+
+    def _degraded_interpretation(
+        self,
+        cards: list[dict[str, Any]],
+        language: str,
+    ) -> InterpretationResult | None:
+        """Library meanings for the cards, or None if the fallback is off."""
+        if self._card_library is None:
+            return None
+        result = self._card_library.interpret(cards, language)
+        if result is not None:
+            DEGRADED_READINGS.labels(task="interpretation").inc()
+        return result
 
     async def validate_question(
         self,
@@ -101,42 +858,39 @@ class LLMService:
             ValidationResult with validation result
 
         Raises:
+            LLMUnavailableError: If no LLM provider is accepting calls
             TarotError: If LLM call fails
         """
+        # Clear-cut questions are settled locally; only ambiguous ones reach the LLM
+        if settings.question_prefilter_enabled:
+            verdict = self._prefilter.check(question, language)
+            if verdict is not None:
+                return verdict
+
+        reused = await self._indexed_verdict(question, language)
+        if reused is not None:
+            return reused
+
         try:
-            system_prompt = self._render_template("system.j2", language=language)
-            user_prompt = self._render_template(
+            result = await self._complete(
                 "validation.j2",
+                language,
+                functools.partial(parse_json_model, ValidationResult),
                 question=question,
                 gender=gender,
             )
 
-            completion_kwargs = {
-                "model": self._model,
-                "messages": [
-                    {"role": "system", "content": system_prompt},
-                    {"role": "user", "content": user_prompt},
-                ],
-                "api_key": self._api_key,
-                "response_format": {"type": "json_object"},
-            }
-
-            # Add base_url for DeepSeek to avoid 401 on beta endpoint
-            if "deepseek" in self._model.lower():
-                completion_kwargs["base_url"] = "https://api.deepseek.com"
-
-            response = await litellm.acompletion(**completion_kwargs)
-
-            # litellm returns a ModelResponse object, similar to OpenAI
-            content = response.choices[0].message.content
-            return ValidationResult.model_validate_json(content)
-
+        except LLMUnavailableError:
+            raise
         except Exception as e:
             raise TarotError(
                 message="Failed to validate question",
                 details={"error": str(e)},
             ) from e
 
+        await self._index_verdict(question, language, result)
+        return result
+
     def validate_question_sync(
         self,
         question: str,
@@ -148,28 +902,11 @@ class LLMService:
         This is a simplified version that returns a mock result.
         Use async version for production.
         """
-        # Simplified logic for testing without real LLM calls
-        # In production, this should call async version in an async context
-        pain_keywords = ["pain", "painful", "hurt", "injured", "injury", "self-harm", "suicide"]
-        factual_keywords = ["calculate", "math", "equals", "formula", "science"]
-
-        question_lower = question.lower()
-
-        for keyword in pain_keywords:
-            if keyword in question_lower:
-                return ValidationResult(
-                    suitable=False,
-                    reason="This question concerns physical pain or mental health.",
-                    redirect_message="Please consult with a doctor or mental health professional.",
-                )
-
-        for keyword in factual_keywords:
-            if keyword in question_lower:
-                return ValidationResult(
-                    suitable=False,
-                    reason="This question appears to be a factual query.",
-                    redirect_message="Please use a search engine or calculator for factual questions.",
-                )
+        # Simplified logic for testing without real LLM calls: keyword
+        # verdicts, erring on rejection for sensitive wording, else suitable
+        verdict = self._prefilter.check(question, language, defer_sensitive=False)
+        if verdict is not None:
+            return verdict
 
         return ValidationResult(
             suitable=True,
@@ -177,61 +914,438 @@ class LLMService:
             redirect_message=None,
         )
 
+    @staticmethod
+    def _cards_per_call(cards: list[dict[str, Any]], mode: str | None) -> int | None:
+        """Cards per completion when interpreting in parallel parts.
+
+        Args:
+            cards: List of drawn tarot cards
+            mode: Interpretation mode (default ``LLM_INTERPRETATION_MODE``)
+
+        Returns:
+            Part size, or None to interpret in a single completion
+        """
+        mode = mode or settings.llm_interpretation_mode
+        if mode not in INTERPRETATION_MODES:
+            raise ValueError(f"Unknown interpretation mode {mode!r}")
+        if mode == "parallel":
+            return 1
+        if len(cards) >= settings.spread_parallel_min_cards:
+            return max(1, settings.spread_parallel_cards_per_call)
+        return None
+
+    async def _complete_cards(
+        self,
+        question: str,
+        gender: str,
+        cards: list[dict[str, Any]],
+        language: str,
+        indices: list[int],
+    ) -> list[CardInterpretation]:
+        """Interpret some of a spread's cards, with the whole spread as context."""
+        return await self._complete(
+            "cards.j2",
+            language,
+            functools.partial(parse_card_batch, expected=indices),
+            question=question,
+            gender=gender,
+            cards=cards,
+            indices=indices,
+        )
+
+    async def _interpret_in_parts(
+        self,
+        question: str,
+        gender: str,
+        cards: list[dict[str, Any]],
+        language: str,
+        size: int,
+    ) -> AsyncIterator[CardInterpretation | InterpretationResult]:
+        """Interpret a spread in concurrent per-position calls plus a synthesis.
+
+        Cards are split into groups of ``size``, each interpreted by its own
+        completion, so wall time follows the slowest group rather than the
+        whole spread's output. A short
+        synthesis call then writes the overall interpretation from the
+        per-card texts. If the consumer stops early or a group fails, the
+        remaining calls are cancelled.
+
+        Args:
+            question: User's question
+            gender: User's gender
+            cards: List of drawn tarot cards
+            language: User's preferred language (zh/ja/en)
+            size: Cards per completion
+
+        Yields:
+            CardInterpretation per card as its group finishes, then the
+            InterpretationResult
+        """
+        tasks = [
+            asyncio.create_task(self._complete_cards(
+                question, gender, cards, language, list(range(start, min(start + size, len(cards))))
+            ))
+            for start in range(0, len(cards), size)
+        ]
+        interpretations: list[CardInterpretation] = []
+        try:
+            for next_done in asyncio.as_completed(tasks):
+                for interpretation in await next_done:
+                    interpretations.append(interpretation)
+                    yield interpretation
+        finally:
+            for task in tasks:
+                if not task.done():
+                    task.cancel()
+            for task in tasks:
+                with contextlib.suppress(asyncio.CancelledError, Exception):
+                    await task
+
+        interpretations.sort(key=lambda card: card.card_index)
+        synthesis = await self._complete(
+            "synthesis.j2",
+            language,
+            functools.partial(parse_json_model, SynthesisResult),
+            question=question,
+            gender=gender,
+            cards=cards,
+            interpretations=interpretations,
+        )
+        yield InterpretationResult(
+            interpretations=interpretations,
+            overall_interpretation=synthesis.overall_interpretation,
+        )
+
+    async def _complete_interpretation(
+        self,
+        question: str,
+        gender: str,
+        cards: list[dict[str, Any]],
+        language: str,
+        mode: str | None = None,
+    ) -> InterpretationResult:
+        """Run the interpretation prompt, re-asking only for missing parts."""
+        size = self._cards_per_call(cards, mode)
+        if size is not None:
+            # The parts yield each card, then the merged result last
+            parts = self._interpret_in_parts(question, gender, cards, language, size)
+            items = [item async for item in parts]
+            return items[-1]
+        try:
+            return await self._complete(
+                "interpretation.j2",
+                language,
+                functools.partial(parse_interpretation, expected=range(len(cards))),
+                question=question,
+                gender=gender,
+                cards=cards,
+            )
+        except PartialOutputError as e:
+            return await self._complete_missing(question, gender, cards, language, e)
+
+    async def _complete_missing(
+        self,
+        question: str,
+        gender: str,
+        cards: list[dict[str, Any]],
+        language: str,
+        partial: PartialOutputError,
+    ) -> InterpretationResult:
+        """Complete a partial interpretation with one targeted re-ask.
+
+        The prompt lists the cards already interpreted so the model returns
+        only the missing cards and the overall interpretation, which is
+        much shorter than the full reading.
+
+        Args:
+            question: User's question
+            gender: User's gender
+            cards: List of drawn tarot cards
+            language: User's preferred language (zh/ja/en)
+            partial: Salvaged output and the card indices it is missing
+
+        Returns:
+            The merged InterpretationResult
+        """
+        logger.info("Re-asking for incomplete interpretation: %s", partial)
+        LLM_OUTPUT_REPAIRS.labels(result=InterpretationResult.__name__, kind="reasked").inc()
+        extra = await self._complete(
+            "interpretation.j2",
+            language,
+            functools.partial(parse_interpretation, expected=partial.missing),
+            question=question,
+            gender=gender,
+            cards=cards,
+            completed=partial.interpretations,
+        )
+        merged = {
+            card.card_index: card
+            for card in extra.interpretations
+            if card.card_index in partial.missing
+        }
+        merged.update({card.card_index: card for card in partial.interpretations})
+        return InterpretationResult(
+            interpretations=[merged[index] for index in sorted(merged)],
+            overall_interpretation=extra.overall_interpretation,
+        )
+
     async def interpret_cards(
         self,
         question: str,
         gender: str,
         cards: list[dict[str, Any]],
         language: str = "en",
+        fallback: bool = True,
+        mode: str | None = None,
     ) -> InterpretationResult:
         """Interpret drawn tarot cards.
 
+        When no LLM provider is accepting calls, the precomputed card
+        meanings are returned instead, marked ``degraded``.
+
         Args:
             question: User's question
             gender: User's gender
             cards: List of drawn tarot cards
             language: User's preferred language (zh/ja/en)
+            fallback: Serve library meanings while the LLM is unavailable
+            mode: "single" or "parallel" (default ``LLM_INTERPRETATION_MODE``);
+                large spreads are always interpreted in parallel parts
 
         Returns:
             InterpretationResult with card interpretations
 
         Raises:
+            LLMUnavailableError: If no LLM provider is accepting calls and
+                there is no fallback
             TarotError: If LLM call fails
         """
+        cache_key, cached = await self._cached_interpretation(
+            question, gender, cards, language
+        )
+        if cached is not None:
+            return cached
+
         try:
-            system_prompt = self._render_template("system.j2", language=language)
-            user_prompt = self._render_template(
-                "interpretation.j2",
-                question=question,
-                gender=gender,
-                cards=cards,
+            result = await self._complete_interpretation(
+                question, gender, cards, language, mode
+            )
+            result = result.model_copy(
+                update={"interpretations": place_cards(result.interpretations, cards)}
             )
 
-            completion_kwargs = {
-                "model": self._model,
-                "messages": [
-                    {"role": "system", "content": system_prompt},
-                    {"role": "user", "content": user_prompt},
-                ],
-                "api_key": self._api_key,
-                "response_format": {"type": "json_object"},
-            }
+        except LLMUnavailableError:
+            degraded = self._degraded_interpretation(cards, language) if fallback else None
+            if degraded is None:
+                raise
+            return degraded
+        except Exception as e:
+            raise TarotError(
+                message="Failed to interpret cards",
+                details={"error": str(e)},
+            ) from e
 
-            # Add base_url for DeepSeek to avoid 401 on beta endpoint
-            if "deepseek" in self._model.lower():
-                completion_kwargs["base_url"] = "https://api.deepseek.com"
+        await self._store_interpretation(cache_key, result)
+        return result
+
+    async def _stream_interpretation(
+        self,
+        question: str,
+        gender: str,
+        cards: list[dict[str, Any]],
+        language: str,
+    ) -> AsyncIterator[CardInterpretation | InterpretationResult]:
+        """Stream a single interpretation completion, yielding cards as they close."""
+        messages = self._prompt_messages(
+            "interpretation.j2",
+            language,
+            question=question,
+            gender=gender,
+            cards=cards,
+        )
 
-            response = await litellm.acompletion(**completion_kwargs)
+        parser = InterpretationStreamParser()
+        router = self.router
+        provider = router.select_provider()
+        usage = None
+        async with router.guard(provider).call():
+            response = await llm_telemetry.acompletion(
+                "interpretation",
+                **provider.completion_kwargs(
+                    messages,
+                    stream=True,
+                    stream_options={"include_usage": True},
+                    **router.completion_options,
+                ),
+            )
+            async for chunk in response:
+                # The final chunk carries usage and no choices
+                usage = getattr(chunk, "usage", None) or usage
+                delta = chunk.choices[0].delta.content if chunk.choices else None
+                if not delta:
+                    continue
+                for interpretation in parser.feed(delta):
+                    yield interpretation
 
-            content = response.choices[0].message.content
-            return InterpretationResult.model_validate_json(content)
+        await self._record_usage("interpretation.j2", language, usage)
+        try:
+            result = parser.result(range(len(cards)))
+        except PartialOutputError as e:
+            result = await self._complete_missing(question, gender, cards, language, e)
+            for interpretation in result.interpretations:
+                if interpretation.card_index in e.missing:
+                    yield interpretation
+        yield result
 
+    async def interpret_cards_stream(
+        self,
+        question: str,
+        gender: str,
+        cards: list[dict[str, Any]],
+        language: str = "en",
+        mode: str | None = None,
+    ) -> AsyncIterator[CardInterpretation | InterpretationResult]:
+        """Interpret drawn tarot cards, streaming results as they are generated.
+
+        Each CardInterpretation is yielded as soon as its JSON object is complete
+        in the model output (or, in parallel mode and for large spreads, as its
+        part finishes); the full InterpretationResult is yielded last.
+        When no LLM provider is accepting calls, the precomputed card meanings
+        are yielded instead, marked ``degraded``.
+
+        Args:
+            question: User's question
+            gender: User's gender
+            cards: List of drawn tarot cards
+            language: User's preferred language (zh/ja/en)
+            mode: "single" or "parallel" (default ``LLM_INTERPRETATION_MODE``)
+
+        Yields:
+            CardInterpretation per finished card, then the InterpretationResult
+
+        Raises:
+            LLMUnavailableError: If no LLM provider is accepting calls
+            TarotError: If LLM call fails
+        """
+        cache_key, cached = await self._cached_interpretation(
+            question, gender, cards, language
+        )
+        if cached is not None:
+            for interpretation in cached.interpretations:
+                yield interpretation
+            yield cached
+            return
+
+        size = self._cards_per_call(cards, mode)
+        streamed = False
+        try:
+            items = (
+                self._stream_interpretation(question, gender, cards, language)
+                if size is None
+                else self._interpret_in_parts(question, gender, cards, language, size)
+            )
+            async for item in items:
+                if isinstance(item, InterpretationResult):
+                    result = item.model_copy(
+                        update={"interpretations": place_cards(item.interpretations, cards)}
+                    )
+                else:
+                    streamed = True
+                    yield place_cards([item], cards)[0]
+
+        except LLMUnavailableError:
+            # Only fall back if nothing was streamed yet
+            degraded = None if streamed else self._degraded_interpretation(cards, language)
+            if degraded is None:
+                raise
+            for interpretation in degraded.interpretations:
+                yield interpretation
+            yield degraded
+            return
         except Exception as e:
             raise TarotError(
                 message="Failed to interpret cards",
                 details={"error": str(e)},
             ) from e
 
+        await self._store_interpretation(cache_key, result)
+        yield result
+
+    @staticmethod
+    def _parse_combined(content: str) -> CombinedReadingResult:
+        """Parse a merged-mode response, rejecting approvals without readings."""
+        combined = parse_json_model(CombinedReadingResult, content)
+        if combined.suitable and combined.to_interpretation() is None:
+            raise ValueError("Suitable reading is missing its interpretation")
+        return combined
+
+    async def validate_and_interpret(
+        self,
+        question: str,
+        gender: str,
+        cards: list[dict[str, Any]],
+        language: str = "en",
+    ) -> tuple[ValidationResult, InterpretationResult | None]:
+        """Validate a question and interpret cards in a single completion.
+
+        Questions settled by the keyword prefilter or the near-duplicate
+        index skip the merged prompt: rejections return immediately and
+        approvals fall through to interpret_cards.
+
+        Args:
+            question: User's question
+            gender: User's gender
+            cards: List of drawn tarot cards
+            language: User's preferred language (zh/ja/en)
+
+        Returns:
+            Tuple of (verdict, interpretation); interpretation is None if rejected
+
+        Raises:
+            LLMUnavailableError: If no LLM provider is accepting calls
+            TarotError: If LLM call fails
+        """
+        verdict = None
+        if settings.question_prefilter_enabled:
+            verdict = self._prefilter.check(question, language)
+        if verdict is None:
+            verdict = await self._indexed_verdict(question, language)
+        if verdict is not None:
+            if not verdict.suitable:
+                return verdict, None
+            return verdict, await self.interpret_cards(question, gender, cards, language)
+
+        try:
+            combined = await self._complete(
+                "reading.j2",
+                language,
+                self._parse_combined,
+                question=question,
+                gender=gender,
+                cards=cards,
+            )
+            validation = combined.to_validation()
+            interpretation = combined.to_interpretation()
+            if interpretation is not None:
+                interpretation = interpretation.model_copy(update={
+                    "interpretations": place_cards(interpretation.interpretations, cards)
+                })
+
+        except LLMUnavailableError:
+            raise
+        except Exception as e:
+            raise TarotError(
+                message="Failed to perform reading",
+                details={"error": str(e)},
+            ) from e
+
+        await self._index_verdict(question, language, validation)
+        if interpretation is not None:
+            await self._store_interpretation(
+                self._interpretation_cache_key(question, gender, cards, language), interpretation
+            )
+        return validation, interpretation
+
     def interpret_cards_sync(
         self,
         question: str,
@@ -268,6 +1382,78 @@ class LLMService:
         )
 
 
+llm_service: LLMService | None = None
+llm_http_client: httpx.AsyncClient | None = None
+
+
+async def init_llm_service() -> None:
+    """Create the app-scoped LLMService.
+
+    Must run after init_redis(). litellm is pointed at a shared keep-alive
+    HTTP client and the provider connection is warmed so the first user
+    request does not pay the TLS handshake. A missing API key is logged
+    rather than raised, so the rest of the API can still start.
+    """
+    global llm_service, llm_http_client
+    from app.services.interpretation_cache import InterpretationCache
+    from app.services.question_index import QuestionIndex
+
+    llm_http_client = httpx.AsyncClient(
+        limits=httpx.Limits(
+            max_connections=settings.llm_http_max_connections,
+            max_keepalive_connections=settings.llm_http_max_connections,
+            keepalive_expiry=settings.llm_http_keepalive_seconds,
+        ),
+        timeout=httpx.Timeout(settings.llm_timeout_seconds, connect=10.0),
+    )
+    litellm.aclient_session = llm_http_client
+
+    redis_client = get_redis()
+    cache = (
+        InterpretationCache(redis_client) if settings.interpretation_cache_enabled else None
+    )
+    question_index = (
+        QuestionIndex(redis_client) if settings.question_index_enabled else None
+    )
+    prompt_cache_stats = PromptCacheStats(redis_client)
+    singleflight = (
+        RedisSingleFlight(redis_client)
+        if settings.llm_singleflight_enabled and settings.llm_singleflight_redis
+        else None
+    )
+    try:
+        service = LLMService(
+            cache=cache,
+            question_index=question_index,
+            http_client=llm_http_client,
+            singleflight=singleflight,
+            prompt_cache_stats=prompt_cache_stats,
+        )
+    except TarotError as e:
+        logger.warning("LLM service disabled: %s", e.message)
+        return
+
+    if settings.llm_warmup_enabled:
+        await service.warm_up()
+    llm_service = service
+
+
+async def close_llm_service() -> None:
+    """Release the app-scoped LLMService and its HTTP client."""
+    global llm_service, llm_http_client
+    llm_service = None
+    if llm_http_client:
+        if litellm.aclient_session is llm_http_client:
+            litellm.aclient_session = None
+        await llm_http_client.aclose()
+        llm_http_client = None
+
+
 def get_llm_service() -> LLMService:
-    """Get a configured LLMService instance."""
-    return LLMService()
+    """Get the app-scoped LLMService instance."""
+    if llm_service is None:
+        raise TarotError(
+            message="LLM service is not available. "
+            "Check that DEEPSEEK_API_KEY or OPENAI_API_KEY is set and init_llm_service() ran."
+        )
+    return llm_service
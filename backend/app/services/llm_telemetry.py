@@ -0,0 +1,322 @@
+"""Per-call telemetry for LLM completions."""
+
+import asyncio
+import logging
+import math
+import time
+from collections import defaultdict
+from collections.abc import AsyncIterator
+from typing import Any
+
+import litellm
+from pydantic import BaseModel
+
+from app.core.config import settings
+from app.core.metrics import (
+    LLM_COMPLETION_COST,
+    LLM_REQUEST_LATENCY,
+    LLM_REQUESTS,
+    LLM_TIME_TO_FIRST_TOKEN,
+    LLM_TOKENS,
+)
+from app.services.prompt_cache_stats import cached_prompt_tokens
+
+logger = logging.getLogger(__name__)
+
+
+def completion_cost(model: str, usage: Any, response: Any = None) -> float:
+    """Estimate the USD cost of a completion from litellm's price map.
+
+    Args:
+        model: litellm model name
+        usage: Usage object from the response
+        response: Full non-streaming response, used for cache-aware pricing
+
+    Returns:
+        Estimated cost, 0.0 if the model has no known price
+    """
+    try:
+        if response is not None:
+            return float(litellm.completion_cost(completion_response=response, model=model))
+        prompt_cost, output_cost = litellm.cost_per_token(
+            model=model,
+            prompt_tokens=getattr(usage, "prompt_tokens", 0) or 0,
+            completion_tokens=getattr(usage, "completion_tokens", 0) or 0,
+        )
+        return float(prompt_cost + output_cost)
+    except Exception:
+        logger.debug("No price known for model %s", model, exc_info=True)
+        return 0.0
+
+
+def record_completion(
+    model: str,
+    task: str,
+    status: str,
+    latency: float,
+    usage: Any = None,
+    ttft: float | None = None,
+    response: Any = None,
+) -> None:
+    """Export one completion's timing, token usage and cost.
+
+    Args:
+        model: litellm model name
+        task: Prompt task (e.g. "validation", "interpretation")
+        status: "ok", "error" or "cancelled"
+        latency: Seconds from request to last byte
+        usage: Usage object, if the provider reported one
+        ttft: Seconds to the first content token, if it was observed
+        response: Full non-streaming response, for cost estimation
+    """
+    LLM_REQUESTS.labels(model=model, task=task, status=status).inc()
+    LLM_REQUEST_LATENCY.labels(model=model, task=task, status=status).observe(latency)
+    if ttft is not None:
+        LLM_TIME_TO_FIRST_TOKEN.labels(model=model, task=task).observe(ttft)
+    if usage is None:
+        return
+
+    prompt_tokens = getattr(usage, "prompt_tokens", 0) or 0
+    completion_tokens = getattr(usage, "completion_tokens", 0) or 0
+    LLM_TOKENS.labels(model=model, task=task, kind="prompt").inc(prompt_tokens)
+    LLM_TOKENS.labels(model=model, task=task, kind="completion").inc(completion_tokens)
+    LLM_TOKENS.labels(model=model, task=task, kind="cached").inc(cached_prompt_tokens(usage))
+    LLM_COMPLETION_COST.labels(model=model, task=task).inc(
+        completion_cost(model, usage, response)
+    )
+
+
+async def acompletion(task: str, **kwargs: Any) -> Any:
+    """Call litellm.acompletion with telemetry.
+
+    Streaming calls return a wrapped stream that records time to first
+    token and, once exhausted, total latency and the usage reported in the
+    final chunk. With ``LLM_INTERNAL_STREAMING`` (the default), non-streaming
+    calls are streamed too and reassembled into a full response, so time to
+    first token is measured for every call; otherwise only latency is.
+
+    Args:
+        task: Prompt task used to tag the metrics
+        **kwargs: litellm.acompletion arguments
+
+    Returns:
+        The response, or a stream of chunks when ``stream=True``
+    """
+    model = kwargs.get("model", "unknown")
+    streamed = bool(kwargs.get("stream"))
+    collect = not streamed and settings.llm_internal_streaming
+    if collect:
+        kwargs = {**kwargs, "stream": True, "stream_options": {"include_usage": True}}
+
+    started = time.perf_counter()
+    try:
+        response = await litellm.acompletion(**kwargs)
+    except BaseException as e:
+        record_completion(model, task, _status(e), time.perf_counter() - started)
+        raise
+
+    if streamed:
+        return _instrumented_stream(response, model, task, started)
+    if collect and hasattr(response, "__aiter__"):
+        return await _collect_stream(response, model, task, started, kwargs.get("messages"))
+
+    record_completion(
+        model,
+        task,
+        "ok",
+        time.perf_counter() - started,
+        usage=getattr(response, "usage", None),
+        response=response,
+    )
+    return response
+
+
+async def _collect_stream(
+    stream: AsyncIterator[Any],
+    model: str,
+    task: str,
+    started: float,
+    messages: list[dict[str, str]] | None,
+) -> Any:
+    """Drain a stream into a full response, recording time to first token."""
+    chunks = []
+    ttft = None
+    try:
+        async for chunk in stream:
+            if ttft is None and chunk.choices and chunk.choices[0].delta.content:
+                ttft = time.perf_counter() - started
+            chunks.append(chunk)
+        response = litellm.stream_chunk_builder(chunks, messages=messages)
+    except BaseException as e:
+        record_completion(model, task, _status(e), time.perf_counter() - started, ttft=ttft)
+        raise
+
+    record_completion(
+        model,
+        task,
+        "ok",
+        time.perf_counter() - started,
+        usage=getattr(response, "usage", None),
+        ttft=ttft,
+        response=response,
+    )
+    return response
+
+
+async def _instrumented_stream(
+    stream: AsyncIterator[Any],
+    model: str,
+    task: str,
+    started: float,
+) -> AsyncIterator[Any]:
+    ttft = None
+    usage = None
+    status = "ok"
+    try:
+        async for chunk in stream:
+            if ttft is None and chunk.choices and chunk.choices[0].delta.content:
+                ttft = time.perf_counter() - started
+            usage = getattr(chunk, "usage", None) or usage
+            yield chunk
+    except BaseException as e:
+        status = _status(e)
+        raise
+    finally:
+        record_completion(
+            model, task, status, time.perf_counter() - started, usage=usage, ttft=ttft
+        )
+
+
+def _status(error: BaseException) -> str:
+    # Hedge losers and abandoned streams end in cancellation, not failure
+    if isinstance(error, (asyncio.CancelledError, GeneratorExit)):
+        return "cancelled"
+    return "error"
+
+
+class ModelTaskReport(BaseModel):
+    """Latency and cost of one model on one prompt task since process start."""
+
+    model: str
+    task: str
+    requests: int
+    errors: int
+    mean_latency_seconds: float | None
+    p50_latency_seconds: float | None
+    p90_latency_seconds: float | None
+    mean_ttft_seconds: float | None
+    prompt_tokens: int
+    completion_tokens: int
+    cost_usd: float
+
+    @property
+    def error_rate(self) -> float:
+        """Fraction of completions that failed."""
+        return self.errors / self.requests if self.requests else 0.0
+
+    @property
+    def cost_per_request(self) -> float:
+        """Mean estimated USD cost per completion."""
+        return self.cost_usd / self.requests if self.requests else 0.0
+
+
+def _bucket_quantile(buckets: list[tuple[float, float]], quantile: float) -> float | None:
+    """Estimate a quantile from cumulative histogram buckets.
+
+    Interpolates linearly within the bucket holding the rank, like
+    Prometheus' ``histogram_quantile``.
+
+    Args:
+        buckets: (upper bound, cumulative count) pairs in ascending order
+        quantile: Quantile between 0 and 1
+
+    Returns:
+        Estimated value, or None without observations
+    """
+    if not buckets or buckets[-1][1] == 0:
+        return None
+    rank = quantile * buckets[-1][1]
+    lower_bound, lower_count = 0.0, 0.0
+    for bound, count in buckets:
+        if count >= rank:
+            if math.isinf(bound):
+                # Above the largest finite bucket; its bound is the best estimate
+                return lower_bound
+            if count == lower_count:
+                return bound
+            return lower_bound + (bound - lower_bound) * (rank - lower_count) / (count - lower_count)
+        lower_bound, lower_count = bound, count
+    return lower_bound
+
+
+def report() -> list[ModelTaskReport]:
+    """Compare models per task from this process's completion metrics.
+
+    Latency figures cover successful completions only, so failing fast
+    does not make a model look quick. For the whole deployment, run the
+    equivalent queries against Prometheus.
+
+    Returns:
+        One entry per (model, task) pair seen, sorted by task then model
+    """
+    rows: dict[tuple[str, str], dict[str, Any]] = defaultdict(lambda: defaultdict(float))
+    latency_buckets: dict[tuple[str, str], list[tuple[float, float]]] = defaultdict(list)
+
+    for metric in LLM_REQUESTS.collect():
+        for sample in metric.samples:
+            if sample.name.endswith("_total"):
+                row = rows[sample.labels["model"], sample.labels["task"]]
+                row["requests"] += sample.value
+                if sample.labels["status"] == "error":
+                    row["errors"] += sample.value
+
+    for metric in LLM_REQUEST_LATENCY.collect():
+        for sample in metric.samples:
+            if sample.labels.get("status") != "ok":
+                continue
+            key = sample.labels["model"], sample.labels["task"]
+            if sample.name.endswith("_bucket"):
+                latency_buckets[key].append((float(sample.labels["le"]), sample.value))
+            elif sample.name.endswith("_sum"):
+                rows[key]["latency_sum"] = sample.value
+            elif sample.name.endswith("_count"):
+                rows[key]["latency_count"] = sample.value
+
+    for metric in LLM_TIME_TO_FIRST_TOKEN.collect():
+        for sample in metric.samples:
+            key = sample.labels["model"], sample.labels["task"]
+            if sample.name.endswith("_sum"):
+                rows[key]["ttft_sum"] = sample.value
+            elif sample.name.endswith("_count"):
+                rows[key]["ttft_count"] = sample.value
+
+    for metric in LLM_TOKENS.collect():
+        for sample in metric.samples:
+            if sample.name.endswith("_total"):
+                key = sample.labels["model"], sample.labels["task"]
+                rows[key][f"{sample.labels['kind']}_tokens"] += sample.value
+
+    for metric in LLM_COMPLETION_COST.collect():
+        for sample in metric.samples:
+            if sample.name.endswith("_total"):
+                rows[sample.labels["model"], sample.labels["task"]]["cost"] += sample.value
+
+    entries = []
+    for (model, task), row in sorted(rows.items(), key=lambda item: (item[0][1], item[0][0])):
+        buckets = sorted(latency_buckets[model, task])
+        entries.append(ModelTaskReport(
+            model=model,
+            task=task,
+            requests=int(row["requests"]),
+            errors=int(row["errors"]),
+            mean_latency_seconds=(
+                row["latency_sum"] / row["latency_count"] if row["latency_count"] else None
+            ),
+            p50_latency_seconds=_bucket_quantile(buckets, 0.5),
+            p90_latency_seconds=_bucket_quantile(buckets, 0.9),
+            mean_ttft_seconds=row["ttft_sum"] / row["ttft_count"] if row["ttft_count"] else None,
+            prompt_tokens=int(row["prompt_tokens"]),
+            completion_tokens=int(row["completion_tokens"]),
+            cost_usd=row["cost"],
+        ))
+    return entries
@@ -0,0 +1,112 @@
+"""Provider-side prompt prefix cache accounting."""
+
+from typing import Any
+
+import redis.asyncio as aioredis
+from pydantic import BaseModel
+
+from app.core.metrics import LLM_CACHED_PROMPT_TOKENS, LLM_PROMPT_TOKENS
+
+
+def cached_prompt_tokens(usage: Any) -> int:
+    """Read the number of prompt tokens served from the provider's prefix cache.
+
+    litellm normalizes OpenAI-style ``prompt_tokens_details.cached_tokens``;
+    DeepSeek additionally reports ``prompt_cache_hit_tokens``.
+
+    Args:
+        usage: Usage object (or dict) from a litellm response
+
+    Returns:
+        Cached prompt tokens, 0 if the provider did not report any
+    """
+    if usage is None:
+        return 0
+    if isinstance(usage, dict):
+        details = usage.get("prompt_tokens_details") or {}
+        cached = details.get("cached_tokens") if isinstance(details, dict) else None
+        return int(cached or usage.get("prompt_cache_hit_tokens") or 0)
+
+    details = getattr(usage, "prompt_tokens_details", None)
+    cached = getattr(details, "cached_tokens", None) if details is not None else None
+    return int(cached or getattr(usage, "prompt_cache_hit_tokens", None) or 0)
+
+
+class PrefixCacheEntry(BaseModel):
+    """Prompt token counters for one template and language."""
+
+    template: str
+    language: str
+    requests: int
+    prompt_tokens: int
+    cached_tokens: int
+
+    @property
+    def hit_ratio(self) -> float:
+        """Fraction of prompt tokens served from the prefix cache."""
+        return self.cached_tokens / self.prompt_tokens if self.prompt_tokens else 0.0
+
+
+class PromptCacheStats:
+    """Redis-backed prompt/cached token counters per template and language.
+
+    Counters are shared by every worker so the report covers the whole
+    deployment; the same numbers are exported as Prometheus counters.
+    """
+
+    STATS_KEY = "prompt_cache:stats"
+
+    def __init__(self, redis_client: aioredis.Redis) -> None:
+        """Initialize PromptCacheStats.
+
+        Args:
+            redis_client: Redis client
+        """
+        self._redis = redis_client
+
+    async def record(self, template: str, language: str, usage: Any) -> None:
+        """Record a completion's prompt token usage.
+
+        Args:
+            template: Prompt template name (e.g. "validation")
+            language: Response language
+            usage: Usage object from the litellm response
+        """
+        if usage is None:
+            return
+        if isinstance(usage, dict):
+            prompt_tokens = int(usage.get("prompt_tokens") or 0)
+        else:
+            prompt_tokens = int(getattr(usage, "prompt_tokens", 0) or 0)
+        cached_tokens = cached_prompt_tokens(usage)
+
+        LLM_PROMPT_TOKENS.labels(template=template, language=language).inc(prompt_tokens)
+        LLM_CACHED_PROMPT_TOKENS.labels(template=template, language=language).inc(cached_tokens)
+
+        prefix = f"{template}:{language}"
+        await self._redis.hincrby(self.STATS_KEY, f"{prefix}:requests", 1)
+        await self._redis.hincrby(self.STATS_KEY, f"{prefix}:prompt_tokens", prompt_tokens)
+        await self._redis.hincrby(self.STATS_KEY, f"{prefix}:cached_tokens", cached_tokens)
+
+    async def report(self) -> list[PrefixCacheEntry]:
+        """Get counters per template and language.
+
+        Returns:
+            PrefixCacheEntry list sorted by template then language
+        """
+        counters = await self._redis.hgetall(self.STATS_KEY)
+        grouped: dict[tuple[str, str], dict[str, int]] = {}
+        for field, value in counters.items():
+            template, language, counter = field.split(":", 2)
+            grouped.setdefault((template, language), {})[counter] = int(value)
+
+        return [
+            PrefixCacheEntry(
+                template=template,
+                language=language,
+                requests=counts.get("requests", 0),
+                prompt_tokens=counts.get("prompt_tokens", 0),
+                cached_tokens=counts.get("cached_tokens", 0),
+            )
+            for (template, language), counts in sorted(grouped.items())
+        ]
@@ -0,0 +1,248 @@
+"""Keyword prefilter that settles clear-cut questions before the LLM."""
+
+import json
+import unicodedata
+from collections import deque
+from collections.abc import Iterable, Iterator
+from functools import lru_cache
+from pathlib import Path
+from typing import Generic, NamedTuple, TypeVar
+
+from app.services.llm_service import ValidationResult
+
+T = TypeVar("T")
+
+KEYWORDS_DIR = Path(__file__).resolve().parent.parent / "data" / "keywords"
+
+# Reject categories in priority order; safety concerns win over everything else
+REJECT_CATEGORIES = ("pain", "factual")
+
+# Words that may touch on health, death or self-harm without settling it
+# (e.g. "hurt by my ex"); they never decide a question locally and keep
+# approve keywords from short-circuiting the LLM safety check
+SENSITIVE = "sensitive"
+
+
+def normalize_text(text: str) -> str:
+    """Normalize text for keyword matching (NFKC + case folding)."""
+    return unicodedata.normalize("NFKC", text).casefold()
+
+
+@lru_cache
+def load_keyword_sets(directory: Path = KEYWORDS_DIR) -> dict[str, dict]:
+    """Load keyword data files keyed by language code.
+
+    Args:
+        directory: Directory containing ``<language>.json`` files
+
+    Returns:
+        Parsed keyword sets
+    """
+    return {
+        path.stem: json.loads(path.read_text(encoding="utf-8"))
+        for path in sorted(directory.glob("*.json"))
+    }
+
+
+class KeywordMatch(NamedTuple, Generic[T]):
+    """A keyword occurrence in the searched text."""
+
+    start: int
+    end: int
+    keyword: str
+    payload: T
+
+
+class KeywordMatcher(Generic[T]):
+    """Aho-Corasick multi-pattern matcher.
+
+    All keywords are compiled into a single automaton so a question is scanned
+    once regardless of how many keywords are loaded. Keywords that begin or end
+    with an ASCII letter or digit only match on word boundaries, so "pain" does
+    not fire inside "Spain" while CJK keywords still match anywhere.
+    """
+
+    def __init__(self, keywords: Iterable[tuple[str, T]]) -> None:
+        """Compile the automaton.
+
+        Args:
+            keywords: (keyword, payload) pairs; keywords are normalized
+        """
+        self._goto: list[dict[str, int]] = [{}]
+        self._fail: list[int] = [0]
+        self._outputs: list[list[tuple[str, T]]] = [[]]
+
+        for keyword, payload in keywords:
+            self._insert(normalize_text(keyword), payload)
+        self._build_failure_links()
+
+    def _insert(self, keyword: str, payload: T) -> None:
+        if not keyword:
+            return
+        state = 0
+        for char in keyword:
+            next_state = self._goto[state].get(char)
+            if next_state is None:
+                next_state = len(self._goto)
+                self._goto.append({})
+                self._fail.append(0)
+                self._outputs.append([])
+                self._goto[state][char] = next_state
+            state = next_state
+        self._outputs[state].append((keyword, payload))
+
+    def _build_failure_links(self) -> None:
+        queue = deque(self._goto[0].values())
+        while queue:
+            state = queue.popleft()
+            for char, next_state in self._goto[state].items():
+                queue.append(next_state)
+                fallback = self._fail[state]
+                while fallback and char not in self._goto[fallback]:
+                    fallback = self._fail[fallback]
+                self._fail[next_state] = self._goto[fallback].get(char, 0)
+                # Inherit matches that end at the failure state
+                self._outputs[next_state] = (
+                    self._outputs[next_state] + self._outputs[self._fail[next_state]]
+                )
+
+    @staticmethod
+    def _is_word_char(char: str) -> bool:
+        return char.isascii() and char.isalnum()
+
+    def _on_boundary(self, text: str, start: int, end: int, keyword: str) -> bool:
+        if self._is_word_char(keyword[0]) and start > 0 and self._is_word_char(text[start - 1]):
+            return False
+        return not (
+            self._is_word_char(keyword[-1]) and end < len(text) and self._is_word_char(text[end])
+        )
+
+    def search(self, text: str) -> Iterator[KeywordMatch[T]]:
+        """Find all keyword occurrences in text.
+
+        Args:
+            text: Text to scan (normalized internally)
+
+        Yields:
+            KeywordMatch for each occurrence, in order of end position
+        """
+        text = normalize_text(text)
+        state = 0
+        for index, char in enumerate(text):
+            while state and char not in self._goto[state]:
+                state = self._fail[state]
+            state = self._goto[state].get(char, 0)
+            for keyword, payload in self._outputs[state]:
+                start = index + 1 - len(keyword)
+                if self._on_boundary(text, start, index + 1, keyword):
+                    yield KeywordMatch(start, index + 1, keyword, payload)
+
+
+class KeywordTag(NamedTuple):
+    """Payload attached to each prefilter keyword."""
+
+    category: str
+    language: str
+
+
+class QuestionPrefilter:
+    """Settle obviously unsuitable or obviously suitable questions locally.
+
+    Returns a ValidationResult when the keyword evidence is unambiguous and
+    None when the question should go to the LLM. Approvals are conservative:
+    any sensitive or reject keyword sends the question to the LLM instead.
+    """
+
+    def __init__(self, keyword_sets: dict[str, dict]) -> None:
+        """Initialize QuestionPrefilter.
+
+        Args:
+            keyword_sets: Parsed keyword data files keyed by language
+        """
+        self._messages = {
+            language: data.get("messages", {}) for language, data in keyword_sets.items()
+        }
+
+        keywords: list[tuple[str, KeywordTag]] = []
+        for language, data in keyword_sets.items():
+            for category, words in data.get("reject", {}).items():
+                keywords.extend((word, KeywordTag(category, language)) for word in words)
+            keywords.extend(
+                (word, KeywordTag("approve", language)) for word in data.get("approve", [])
+            )
+            keywords.extend(
+                (word, KeywordTag(SENSITIVE, language)) for word in data.get(SENSITIVE, [])
+            )
+        self._matcher: KeywordMatcher[KeywordTag] = KeywordMatcher(keywords)
+
+    @classmethod
+    def from_directory(cls, directory: Path = KEYWORDS_DIR) -> "QuestionPrefilter":
+        """Load keyword sets from ``<language>.json`` files in a directory."""
+        return cls(load_keyword_sets(directory))
+
+    def _verdict(
+        self,
+        category: str,
+        languages: list[str],
+        preferred_language: str,
+    ) -> ValidationResult:
+        # Answer in the requested language when it matched, otherwise in the
+        # language of the first matched keyword
+        language = preferred_language if preferred_language in languages else languages[0]
+        messages = self._messages[language][category]
+        return ValidationResult(
+            suitable=category == "approve",
+            reason=messages["reason"],
+            redirect_message=messages.get("redirect_message"),
+        )
+
+    def _hits(self, question: str) -> dict[str, list[str]]:
+        """Map each matched category to the languages it matched in."""
+        hits: dict[str, list[str]] = {}
+        for match in self._matcher.search(question):
+            languages = hits.setdefault(match.payload.category, [])
+            if match.payload.language not in languages:
+                languages.append(match.payload.language)
+        return hits
+
+    def is_sensitive(self, question: str) -> bool:
+        """Whether a question touches health, self-harm or other sensitive topics."""
+        hits = self._hits(question)
+        return "pain" in hits or SENSITIVE in hits
+
+    def check(
+        self,
+        question: str,
+        language: str = "en",
+        defer_sensitive: bool = True,
+    ) -> ValidationResult | None:
+        """Classify a question by keyword evidence.
+
+        Args:
+            question: User's question
+            language: User's preferred language (zh/ja/en)
+            defer_sensitive: Leave sensitive questions to the LLM; when False
+                (no LLM to defer to) they are rejected like pain questions
+
+        Returns:
+            ValidationResult for clear-cut questions, None if ambiguous
+        """
+        hits = self._hits(question)
+        if "pain" in hits:
+            return self._verdict("pain", hits["pain"], language)
+        if SENSITIVE in hits:
+            return None if defer_sensitive else self._verdict("pain", hits[SENSITIVE], language)
+
+        rejects = [category for category in REJECT_CATEGORIES if category in hits]
+        if rejects and "approve" not in hits:
+            return self._verdict(rejects[0], hits[rejects[0]], language)
+        if "approve" in hits and not rejects:
+            return self._verdict("approve", hits["approve"], language)
+
+        return None
+
+
+@lru_cache
+def get_question_prefilter() -> QuestionPrefilter:
+    """Get the shared prefilter compiled from the bundled keyword files."""
+    return QuestionPrefilter.from_directory()
@@ -0,0 +1,226 @@
+"""Near-duplicate question index for reusing validation verdicts."""
+
+import hashlib
+import itertools
+import re
+from collections.abc import Iterable
+
+import redis.asyncio as aioredis
+from pydantic import BaseModel
+
+from app.core.config import settings
+from app.services.llm_service import ValidationResult
+from app.services.question_filter import load_keyword_sets, normalize_text
+
+FINGERPRINT_BITS = 64
+
+# Latin words, or single kana/CJK characters
+_TOKEN_RE = re.compile(r"[0-9a-z']+|[\u3040-\u30ff\u3400-\u9fff\uf900-\ufaff]")
+
+
+def question_features(question: str, stopwords: frozenset[str] = frozenset()) -> list[str]:
+    """Extract SimHash features from a question.
+
+    Tokens are Latin words or single CJK characters (CJK text has no word
+    separators). Features are token unigrams plus token bigrams, so word
+    order counts: "will he leave me" and "will I leave him" share their
+    words but not their bigrams. Pronouns are kept for the same reason.
+
+    Args:
+        question: Raw user question
+        stopwords: Words and characters to ignore
+
+    Returns:
+        Feature strings
+    """
+    tokens = [t for t in _TOKEN_RE.findall(normalize_text(question)) if t not in stopwords]
+    bigrams = [f"{a} {b}" for a, b in itertools.pairwise(tokens)]
+    return tokens + bigrams
+
+
+def simhash(features: Iterable[str]) -> int:
+    """Compute a 64-bit SimHash fingerprint.
+
+    Args:
+        features: Feature strings (each weighted equally)
+
+    Returns:
+        Fingerprint as an unsigned integer
+    """
+    weights = [0] * FINGERPRINT_BITS
+    for feature in features:
+        digest = hashlib.blake2b(feature.encode("utf-8"), digest_size=8).digest()
+        value = int.from_bytes(digest, "big")
+        for bit in range(FINGERPRINT_BITS):
+            weights[bit] += 1 if value >> bit & 1 else -1
+    return sum(1 << bit for bit, weight in enumerate(weights) if weight > 0)
+
+
+def hamming_distance(a: int, b: int) -> int:
+    """Number of differing bits between two fingerprints."""
+    return (a ^ b).bit_count()
+
+
+class IndexStats(BaseModel):
+    """Question index lookup counters."""
+
+    hits: int
+    misses: int
+    by_language: dict[str, dict[str, int]]
+
+    @property
+    def hit_rate(self) -> float:
+        """Fraction of lookups that reused a verdict."""
+        total = self.hits + self.misses
+        return self.hits / total if total else 0.0
+
+
+class QuestionIndex:
+    """Index of recently validated questions keyed by SimHash fingerprint.
+
+    Fingerprints are split into ``max_distance + 1`` bands; by the pigeonhole
+    principle any fingerprint within ``max_distance`` bits of a query shares at
+    least one band exactly, so each band value maps to a Redis set of
+    candidates that are then checked by full Hamming distance. Everything is
+    partitioned by language.
+    """
+
+    # Redis key prefix
+    KEY_PREFIX = "question_index:"
+    STATS_KEY = "question_index:stats"
+
+    def __init__(
+        self,
+        redis_client: aioredis.Redis,
+        max_distance: int | None = None,
+        ttl_seconds: int | None = None,
+        stopwords: frozenset[str] | None = None,
+        min_features: int | None = None,
+    ) -> None:
+        """Initialize QuestionIndex.
+
+        Args:
+            redis_client: Redis client
+            max_distance: Maximum Hamming distance for reuse (default from settings)
+            ttl_seconds: Lifetime of indexed verdicts (default from settings)
+            stopwords: Ignored words (default from bundled keyword files)
+            min_features: Fewest features a question needs to be indexed
+                (default from settings)
+        """
+        self._redis = redis_client
+        self._max_distance = (
+            settings.question_index_max_distance if max_distance is None else max_distance
+        )
+        self._ttl_seconds = ttl_seconds or settings.question_index_ttl_seconds
+        if stopwords is None:
+            stopwords = frozenset(
+                normalize_text(word)
+                for data in load_keyword_sets().values()
+                for word in data.get("stopwords", [])
+            )
+        self._stopwords = stopwords
+        self._min_features = (
+            settings.question_index_min_features if min_features is None else min_features
+        )
+
+        band_count = self._max_distance + 1
+        base, extra = divmod(FINGERPRINT_BITS, band_count)
+        self._band_widths = [base + (1 if i < extra else 0) for i in range(band_count)]
+
+    def fingerprint(self, question: str) -> int | None:
+        """Fingerprint a question, or None if it is too short to compare.
+
+        Very short questions have too few features for their fingerprints to
+        be told apart reliably, so they are neither indexed nor looked up.
+        """
+        features = question_features(question, self._stopwords)
+        if not features or len(features) < self._min_features:
+            return None
+        return simhash(features)
+
+    def _band_keys(self, language: str, fingerprint: int) -> list[str]:
+        keys = []
+        shift = 0
+        for index, width in enumerate(self._band_widths):
+            value = fingerprint >> shift & ((1 << width) - 1)
+            keys.append(f"{self.KEY_PREFIX}{language}:band:{index}:{value:x}")
+            shift += width
+        return keys
+
+    def _verdict_key(self, language: str, fingerprint: int) -> str:
+        return f"{self.KEY_PREFIX}{language}:fp:{fingerprint:016x}"
+
+    async def lookup(self, question: str, language: str) -> ValidationResult | None:
+        """Find the verdict of the closest indexed question within range.
+
+        Args:
+            question: User's question
+            language: User's preferred language (index partition)
+
+        Returns:
+            Reused ValidationResult, or None if no near duplicate is indexed
+        """
+        fingerprint = self.fingerprint(question)
+        if fingerprint is None:
+            return None
+
+        band_keys = self._band_keys(language, fingerprint)
+        candidates = sorted(
+            (hamming_distance(fingerprint, int(member, 16)), member)
+            for member in await self._redis.sunion(*band_keys)
+        )
+
+        for distance, member in candidates:
+            if distance > self._max_distance:
+                break
+            raw = await self._redis.get(self._verdict_key(language, int(member, 16)))
+            if raw is None:
+                # Verdict expired; drop the stale band entries
+                for key in self._band_keys(language, int(member, 16)):
+                    await self._redis.srem(key, member)
+                continue
+            await self._redis.hincrby(self.STATS_KEY, f"{language}:hits", 1)
+            return ValidationResult.model_validate_json(raw)
+
+        await self._redis.hincrby(self.STATS_KEY, f"{language}:misses", 1)
+        return None
+
+    async def add(self, question: str, language: str, result: ValidationResult) -> None:
+        """Index a validated question.
+
+        Args:
+            question: User's question
+            language: User's preferred language (index partition)
+            result: Verdict to reuse for near duplicates
+        """
+        fingerprint = self.fingerprint(question)
+        if fingerprint is None:
+            return
+
+        member = f"{fingerprint:016x}"
+        await self._redis.set(
+            self._verdict_key(language, fingerprint),
+            result.model_dump_json(),
+            ex=self._ttl_seconds,
+        )
+        for key in self._band_keys(language, fingerprint):
+            await self._redis.sadd(key, member)
+            await self._redis.expire(key, self._ttl_seconds)
+
+    async def stats(self) -> IndexStats:
+        """Get lookup counters overall and per language.
+
+        Returns:
+            IndexStats with hit/miss counts
+        """
+        counters = await self._redis.hgetall(self.STATS_KEY)
+        by_language: dict[str, dict[str, int]] = {}
+        for field, value in counters.items():
+            language, _, counter = field.rpartition(":")
+            by_language.setdefault(language, {"hits": 0, "misses": 0})[counter] = int(value)
+
+        return IndexStats(
+            hits=sum(counts["hits"] for counts in by_language.values()),
+            misses=sum(counts["misses"] for counts in by_language.values()),
+            by_language=by_language,
+        )
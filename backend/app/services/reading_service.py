@@ -0,0 +1,102 @@
+"""Reading service that pipelines validation and interpretation."""
+
+import asyncio
+import contextlib
+from typing import Any
+
+from fastapi import Depends
+from pydantic import BaseModel
+
+from app.core.config import settings
+from app.services.llm_service import (
+    InterpretationResult,
+    LLMService,
+    ValidationResult,
+    get_llm_service,
+)
+
+
+class ReadingOutcome(BaseModel):
+    """Result of a one-shot reading."""
+
+    validation: ValidationResult
+    interpretation: InterpretationResult | None = None
+
+
+class ReadingService:
+    """Service that runs a full reading in a single request."""
+
+    def __init__(self, llm_service: LLMService, mode: str | None = None) -> None:
+        """Initialize ReadingService.
+
+        Args:
+            llm_service: LLM service used for validation and interpretation
+            mode: "pipelined" or "merged" (default from settings)
+        """
+        self._llm_service = llm_service
+        self._mode = mode or settings.llm_reading_mode
+
+    async def perform_reading(
+        self,
+        question: str,
+        gender: str,
+        cards: list[dict[str, Any]],
+        language: str = "en",
+    ) -> ReadingOutcome:
+        """Validate a question and interpret already drawn cards.
+
+        In the default pipelined mode the interpretation starts speculatively
+        alongside validation so that wall-clock latency approaches the slower
+        of the two calls rather than their sum; it is cancelled if the
+        question is rejected. In merged mode a single completion returns
+        either the rejection or the full interpretation.
+
+        Args:
+            question: User's question
+            gender: User's gender
+            cards: Drawn tarot cards
+            language: User's preferred language (zh/ja/en)
+
+        Returns:
+            ReadingOutcome with the verdict and, if suitable, the interpretation
+
+        Raises:
+            TarotError: If an LLM call fails
+        """
+        # Large spreads are interpreted in parallel parts, which one merged
+        # completion cannot do
+        if self._mode == "merged" and len(cards) < settings.spread_parallel_min_cards:
+            validation, interpretation = await self._llm_service.validate_and_interpret(
+                question, gender, cards, language
+            )
+            return ReadingOutcome(validation=validation, interpretation=interpretation)
+
+        interpretation_task = asyncio.create_task(
+            self._llm_service.interpret_cards(question, gender, cards, language)
+        )
+
+        try:
+            validation = await self._llm_service.validate_question(question, gender, language)
+        except BaseException:
+            await self._cancel(interpretation_task)
+            raise
+
+        if not validation.suitable:
+            await self._cancel(interpretation_task)
+            return ReadingOutcome(validation=validation)
+
+        return ReadingOutcome(validation=validation, interpretation=await interpretation_task)
+
+    @staticmethod
+    async def _cancel(task: asyncio.Task) -> None:
+        """Cancel a speculative task and wait for it to unwind."""
+        task.cancel()
+        with contextlib.suppress(asyncio.CancelledError, Exception):
+            await task
+
+
+def get_reading_service(
+    llm_service: LLMService = Depends(get_llm_service),
+) -> ReadingService:
+    """Get a configured ReadingService instance."""
+    return ReadingService(llm_service)
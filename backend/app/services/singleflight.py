@@ -0,0 +1,217 @@
+"""Single-flight coalescing of identical concurrent LLM completions."""
+
+import asyncio
+import hashlib
+import json
+import logging
+import time
+import uuid
+from collections.abc import Awaitable, Callable
+from typing import Any, Generic, TypeVar
+
+import redis.asyncio as aioredis
+
+from app.core.config import settings
+
+T = TypeVar("T")
+
+logger = logging.getLogger(__name__)
+
+
+def prompt_key(messages: list[dict[str, str]], task: str) -> str:
+    """Hash rendered chat messages into a single-flight key.
+
+    Args:
+        messages: Rendered chat messages
+        task: Task (prompt template) name, so different tasks never share a flight
+
+    Returns:
+        Hex digest identifying the completion
+    """
+    payload = json.dumps([task, messages], ensure_ascii=False, separators=(",", ":"))
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+class _Flight(Generic[T]):
+    """A running call and the number of callers awaiting it."""
+
+    def __init__(self, task: asyncio.Task[T]) -> None:
+        self.task = task
+        self.waiters = 0
+
+
+class SingleFlight:
+    """Deduplicate concurrent calls with the same key within one process.
+
+    The first caller for a key starts the call; callers arriving while it is
+    in flight await the same task. A caller being cancelled does not cancel
+    the shared call unless it was the last one waiting.
+    """
+
+    def __init__(self) -> None:
+        self._flights: dict[str, _Flight[Any]] = {}
+        self._counters = {"calls": 0, "coalesced": 0}
+
+    def in_flight(self, key: str) -> bool:
+        """Whether a call for this key is currently running."""
+        return key in self._flights
+
+    async def do(self, key: str, fn: Callable[[], Awaitable[T]]) -> T:
+        """Run fn, or join the identical call already in flight.
+
+        Args:
+            key: Call identity (e.g. a prompt_key hash)
+            fn: Starts the call when no flight exists for the key
+
+        Returns:
+            The shared call's result (its exception is raised to every caller)
+        """
+        self._counters["calls"] += 1
+        flight = self._flights.get(key)
+        if flight is None:
+            flight = _Flight(asyncio.ensure_future(fn()))
+            self._flights[key] = flight
+            flight.task.add_done_callback(lambda _: self._forget(key, flight))
+        else:
+            self._counters["coalesced"] += 1
+
+        flight.waiters += 1
+        try:
+            return await asyncio.shield(flight.task)
+        except asyncio.CancelledError:
+            if flight.waiters == 1 and not flight.task.done():
+                flight.task.cancel()
+            raise
+        finally:
+            flight.waiters -= 1
+
+    def _forget(self, key: str, flight: _Flight[Any]) -> None:
+        if self._flights.get(key) is flight:
+            del self._flights[key]
+        # Mark a failure as retrieved; every waiter re-raises it already
+        if not flight.task.cancelled():
+            flight.task.exception()
+
+    def stats(self) -> dict[str, int]:
+        """Call and coalesced counters plus current flights."""
+        return {**self._counters, "in_flight": len(self._flights)}
+
+
+class RedisSingleFlight(SingleFlight):
+    """Single-flight that also coalesces across workers and replicas.
+
+    Within a process calls are coalesced as in SingleFlight. Across
+    processes the first caller takes a Redis lock (SET NX) and publishes the
+    encoded result under a short-lived key; other processes poll for that
+    result instead of starting their own call. If the lock holder dies or
+    the wait times out, the waiter runs the call itself.
+    """
+
+    LOCK_PREFIX = "singleflight:lock:"
+    RESULT_PREFIX = "singleflight:result:"
+
+    def __init__(
+        self,
+        redis_client: aioredis.Redis,
+        lock_seconds: float | None = None,
+        result_seconds: int = 30,
+        poll_interval: float = 0.1,
+    ) -> None:
+        """Initialize RedisSingleFlight.
+
+        Args:
+            redis_client: Redis client
+            lock_seconds: Lock lifetime and maximum wait (default LLM timeout)
+            result_seconds: How long a published result stays readable
+            poll_interval: Seconds between result polls while waiting
+        """
+        super().__init__()
+        self._redis = redis_client
+        self._lock_seconds = lock_seconds or settings.llm_timeout_seconds
+        self._result_seconds = result_seconds
+        self._poll_interval = poll_interval
+        self._counters["remote_coalesced"] = 0
+
+    async def do_shared(
+        self,
+        key: str,
+        fn: Callable[[], Awaitable[T]],
+        encode: Callable[[T], str],
+        decode: Callable[[str], T],
+    ) -> T:
+        """Run fn once across all processes sharing the Redis instance.
+
+        Redis failures fall back to in-process coalescing only.
+
+        Args:
+            key: Call identity (e.g. a prompt_key hash)
+            fn: Starts the call
+            encode: Serializes a result for other processes
+            decode: Restores a result published by another process
+
+        Returns:
+            The call's result
+        """
+        return await self.do(key, lambda: self._run_shared(key, fn, encode, decode))
+
+    async def _run_shared(
+        self,
+        key: str,
+        fn: Callable[[], Awaitable[T]],
+        encode: Callable[[T], str],
+        decode: Callable[[str], T],
+    ) -> T:
+        lock_key = f"{self.LOCK_PREFIX}{key}"
+        result_key = f"{self.RESULT_PREFIX}{key}"
+        token = uuid.uuid4().hex
+
+        try:
+            acquired = await self._redis.set(
+                lock_key, token, nx=True, ex=max(1, int(self._lock_seconds))
+            )
+            if not acquired:
+                published = await self._wait_for_result(lock_key, result_key)
+                if published is not None:
+                    self._counters["remote_coalesced"] += 1
+                    return decode(published)
+        except Exception:
+            logger.warning("Single-flight lock failed, running call locally", exc_info=True)
+            return await fn()
+
+        try:
+            result = await fn()
+        except BaseException:
+            await self._release(lock_key, token)
+            raise
+
+        try:
+            await self._redis.set(result_key, encode(result), ex=self._result_seconds)
+        except Exception:
+            logger.warning("Single-flight result publish failed", exc_info=True)
+        await self._release(lock_key, token)
+        return result
+
+    async def _wait_for_result(self, lock_key: str, result_key: str) -> str | None:
+        """Poll for a result published by the lock holder.
+
+        Returns:
+            Encoded result, or None if the holder gave up or the wait timed out
+        """
+        deadline = time.monotonic() + self._lock_seconds
+        while time.monotonic() < deadline:
+            published = await self._redis.get(result_key)
+            if published is not None:
+                return published
+            if await self._redis.get(lock_key) is None:
+                # Holder failed or finished without publishing; check once more
+                return await self._redis.get(result_key)
+            await asyncio.sleep(self._poll_interval)
+        return None
+
+    async def _release(self, lock_key: str, token: str) -> None:
+        """Delete the lock if this process still holds it."""
+        try:
+            if await self._redis.get(lock_key) == token:
+                await self._redis.delete(lock_key)
+        except Exception:
+            logger.warning("Single-flight lock release failed", exc_info=True)
@@ -0,0 +1,193 @@
+"""Tarot spreads: how many cards are drawn and what each position means."""
+
+from typing import Any
+
+from pydantic import BaseModel
+
+DEFAULT_SPREAD = "three_card"
+DEFAULT_LANGUAGE = "en"
+
+
+class SpreadPosition(BaseModel):
+    """One position in a spread, independent of the card's orientation."""
+
+    key: str
+    # English name and meaning, rendered into prompts
+    name: str
+    meaning: str
+    # Display names for other languages
+    labels: dict[str, str] = {}
+
+    def label(self, language: str = DEFAULT_LANGUAGE) -> str:
+        """Localized position name, falling back to English."""
+        return self.labels.get(language, self.name)
+
+
+class Spread(BaseModel):
+    """A named layout of card positions."""
+
+    key: str
+    name: str
+    labels: dict[str, str] = {}
+    positions: list[SpreadPosition]
+
+    @property
+    def card_count(self) -> int:
+        """Number of cards drawn for the spread."""
+        return len(self.positions)
+
+    def label(self, language: str = DEFAULT_LANGUAGE) -> str:
+        """Localized spread name, falling back to English."""
+        return self.labels.get(language, self.name)
+
+    def position(self, key: str | None) -> SpreadPosition | None:
+        """Get a position by key, or None if the spread has no such position."""
+        return next((p for p in self.positions if p.key == key), None)
+
+    def assign(self, cards: list[dict[str, Any]]) -> list[dict[str, Any]]:
+        """Place cards on the spread's positions in draw order.
+
+        Args:
+            cards: Drawn cards, one per position
+
+        Returns:
+            Copies of the cards with ``spread`` and ``spread_position`` set
+
+        Raises:
+            ValueError: If the number of cards does not match the spread
+        """
+        if len(cards) != self.card_count:
+            raise ValueError(
+                f"The {self.key} spread takes {self.card_count} cards, got {len(cards)}"
+            )
+        return [
+            {**card, "spread": self.key, "spread_position": position.key}
+            for card, position in zip(cards, self.positions, strict=True)
+        ]
+
+    def describe(self, language: str = DEFAULT_LANGUAGE) -> dict[str, Any]:
+        """Client-facing description with localized names."""
+        return {
+            "key": self.key,
+            "name": self.label(language),
+            "positions": [
+                {"key": position.key, "name": position.label(language)}
+                for position in self.positions
+            ],
+        }
+
+
+def _position(key: str, name: str, meaning: str, zh: str, ja: str) -> SpreadPosition:
+    return SpreadPosition(key=key, name=name, meaning=meaning, labels={"zh": zh, "ja": ja})
+
+
+SPREADS: dict[str, Spread] = {
+    spread.key: spread
+    for spread in (
+        Spread(
+            key="three_card",
+            name="Past, Present, Future",
+            labels={"zh": "过去、现在、未来", "ja": "過去・現在・未来"},
+            positions=[
+                _position("past", "Past", "What led to the situation", "过去", "過去"),
+                _position("present", "Present", "The situation as it stands", "现在", "現在"),
+                _position("future", "Future", "Where things are heading", "未来", "未来"),
+            ],
+        ),
+        Spread(
+            key="yes_no",
+            name="Yes or No",
+            labels={"zh": "是或否", "ja": "イエス・ノー"},
+            positions=[
+                _position(
+                    "answer",
+                    "Answer",
+                    "Leans yes when upright and no when reversed; explain why",
+                    "答案",
+                    "答え",
+                ),
+            ],
+        ),
+        Spread(
+            key="five_card",
+            name="Five Card Cross",
+            labels={"zh": "五张牌十字", "ja": "ファイブカード・クロス"},
+            positions=[
+                _position("present", "Present", "The heart of the situation", "现状", "現状"),
+                _position("past", "Past", "Influences from the past", "过去的影响", "過去の影響"),
+                _position("future", "Future", "What is approaching", "未来", "未来"),
+                _position(
+                    "cause", "Hidden cause", "What lies beneath the question",
+                    "潜在原因", "隠れた原因",
+                ),
+                _position(
+                    "potential", "Potential", "The most likely outcome", "可能的结果", "可能性",
+                ),
+            ],
+        ),
+        Spread(
+            key="celtic_cross",
+            name="Celtic Cross",
+            labels={"zh": "凯尔特十字", "ja": "ケルト十字"},
+            positions=[
+                _position("present", "Present", "The heart of the matter", "现状", "現状"),
+                _position(
+                    "challenge", "Challenge", "What crosses or obstructs it", "阻碍", "障害",
+                ),
+                _position(
+                    "foundation", "Foundation", "The root of the situation", "根源", "根底",
+                ),
+                _position(
+                    "recent_past", "Recent past", "What is passing away",
+                    "近期过去", "近い過去",
+                ),
+                _position(
+                    "conscious", "Conscious goal", "What the user is aiming for",
+                    "意识层面的目标", "意識している目標",
+                ),
+                _position(
+                    "near_future", "Near future", "What comes next",
+                    "近期未来", "近い未来",
+                ),
+                _position("self", "Self", "The user's own stance", "自我", "自分自身"),
+                _position(
+                    "environment", "Environment", "Other people and surroundings",
+                    "外部环境", "周囲の環境",
+                ),
+                _position(
+                    "hopes_fears", "Hopes and fears", "What the user hopes for or dreads",
+                    "希望与恐惧", "願望と恐れ",
+                ),
+                _position("outcome", "Outcome", "Where the path leads", "结果", "結果"),
+            ],
+        ),
+    )
+}
+
+# Stable one-byte codes for draw tokens; append only
+SPREAD_CODES = ("three_card", "celtic_cross", "five_card", "yes_no")
+
+
+def get_spread(key: str | None = None) -> Spread:
+    """Get a spread by key.
+
+    Args:
+        key: Spread key (default three-card)
+
+    Raises:
+        ValueError: If the spread is unknown
+    """
+    spread = SPREADS.get(key or DEFAULT_SPREAD)
+    if spread is None:
+        raise ValueError(f"Unknown spread {key!r}; choose one of {', '.join(SPREADS)}")
+    return spread
+
+
+def card_positions(cards: list[dict[str, Any]]) -> list[SpreadPosition | None]:
+    """Resolve each card's spread position, or None for cards without one."""
+    return [
+        spread.position(card.get("spread_position"))
+        if (spread := SPREADS.get(card.get("spread") or "")) is not None
+        else None
+        for card in cards
+    ]
@@ -0,0 +1,235 @@
+"""Interpretation job worker.
+
+Consumes jobs enqueued by ``POST /tarot/jobs`` from the
+Redis Stream consumer group and runs them through the same LLMService the
+API uses. Run one or more worker processes next to the API:
+
+    python -m app.worker
+"""
+
+import asyncio
+import contextlib
+import logging
+import os
+import signal
+import socket
+import time
+from collections.abc import AsyncIterator
+from uuid import uuid4
+
+import httpx
+
+from app.core.config import settings
+from app.core.exceptions import AppError
+from app.services.job_queue import (
+    JOB_DONE,
+    JOB_FAILED,
+    JOB_QUEUED,
+    JOB_RUNNING,
+    InterpretationJob,
+    JobQueue,
+    JobRecord,
+    is_allowed_callback,
+)
+from app.services.llm_service import LLMService
+
+logger = logging.getLogger(__name__)
+
+
+class JobWorker:
+    """Run queued interpretation jobs with bounded concurrency.
+
+    A job is acknowledged only once it is done or dead-lettered. A failed
+    attempt is left pending, so the queue re-delivers it (to this or
+    another worker) once it has been idle for the retry interval. While a
+    job runs, its claim is refreshed so slow calls are not re-delivered.
+    """
+
+    def __init__(
+        self,
+        queue: JobQueue,
+        llm_service: LLMService,
+        consumer: str | None = None,
+        concurrency: int | None = None,
+        http_client: httpx.AsyncClient | None = None,
+    ) -> None:
+        """Initialize JobWorker.
+
+        Args:
+            queue: Job queue to consume
+            llm_service: LLM service used for interpretation
+            consumer: Consumer name within the group (default host-pid)
+            concurrency: Maximum jobs in flight (default from settings)
+            http_client: Client for completion callbacks
+        """
+        self._queue = queue
+        self._llm_service = llm_service
+        self.consumer = consumer or f"{socket.gethostname()}-{os.getpid()}"
+        self._concurrency = concurrency or settings.job_worker_concurrency
+        self._http_client = http_client
+        self._stopping = asyncio.Event()
+
+    @property
+    def _heartbeat_seconds(self) -> float:
+        return max(self._queue.retry_idle_seconds / 3, 1.0)
+
+    def stop(self) -> None:
+        """Stop taking new jobs; in-flight jobs are allowed to finish."""
+        self._stopping.set()
+
+    async def run(self, block_ms: int = 1000) -> None:
+        """Consume jobs until stop() is called.
+
+        Args:
+            block_ms: How long each read blocks on an empty stream
+        """
+        await self._queue.ensure_group()
+        tasks: set[asyncio.Task[None]] = set()
+        next_claim = 0.0
+        logger.info("Job worker %s started (concurrency %d)", self.consumer, self._concurrency)
+        try:
+            while not self._stopping.is_set():
+                if len(tasks) >= self._concurrency:
+                    await asyncio.wait(tasks, return_when=asyncio.FIRST_COMPLETED)
+                    continue
+                free = self._concurrency - len(tasks)
+                jobs: list[tuple[str, InterpretationJob]] = []
+                try:
+                    # Stale jobs only appear after the idle interval; no need to scan each poll
+                    if time.monotonic() >= next_claim:
+                        jobs = await self._queue.claim_stale(self.consumer, free)
+                        next_claim = time.monotonic() + self._heartbeat_seconds
+                    if len(jobs) < free:
+                        jobs += await self._queue.read(self.consumer, free - len(jobs), block_ms)
+                except Exception:
+                    logger.warning("Reading jobs failed", exc_info=True)
+                    await asyncio.sleep(block_ms / 1000)
+                    continue
+                for message_id, job in jobs:
+                    task = asyncio.create_task(self.process(message_id, job))
+                    tasks.add(task)
+                    task.add_done_callback(tasks.discard)
+                # Let the new jobs start before polling again
+                await asyncio.sleep(0)
+        finally:
+            if tasks:
+                await asyncio.gather(*tasks, return_exceptions=True)
+            logger.info("Job worker %s stopped", self.consumer)
+
+    async def process(self, message_id: str, job: InterpretationJob) -> JobRecord:
+        """Run one delivery of a job and record its outcome.
+
+        Args:
+            message_id: Stream message id
+            job: Job payload
+
+        Returns:
+            The updated JobRecord
+        """
+        record = await self._queue.get(job.id) or JobRecord(id=job.id)
+        if record.finished:
+            # Finished by an earlier delivery whose ack was lost
+            await self._queue.ack(message_id)
+            return record
+        if (
+            record.status == JOB_RUNNING
+            and time.time() - record.updated_at < self._queue.retry_idle_seconds
+        ):
+            # Still running elsewhere; its heartbeat will claim the message back
+            return record
+
+        record.attempts += 1
+        record.status = JOB_RUNNING
+        await self._queue.save(record)
+
+        try:
+            async with self._claimed(message_id, record):
+                # No degraded fallback: a job can wait for the LLM to recover
+                result = await self._llm_service.interpret_cards(
+                    job.question, job.gender, job.cards, job.language, fallback=False
+                )
+        except Exception as e:
+            if isinstance(e, AppError):
+                record.error = {"code": e.code, "message": e.message}
+            else:
+                logger.warning("Job %s attempt %d failed", job.id, record.attempts, exc_info=True)
+                record.error = {"code": "INTERNAL_ERROR", "message": str(e)}
+            if record.attempts >= self._queue.max_attempts:
+                record.status = JOB_FAILED
+                await self._queue.save(record)
+                await self._queue.dead_letter(message_id, job, record.error["message"])
+                await self._notify(job, record)
+            else:
+                # Left pending: re-claimed after the retry idle interval
+                record.status = JOB_QUEUED
+                await self._queue.save(record)
+            return record
+
+        # Mock saving reading to DB
+        record.reading_id = str(uuid4())
+        record.result = result
+        record.error = None
+        record.status = JOB_DONE
+        await self._queue.save(record)
+        await self._queue.ack(message_id)
+        await self._notify(job, record)
+        return record
+
+    @contextlib.asynccontextmanager
+    async def _claimed(self, message_id: str, record: JobRecord) -> AsyncIterator[None]:
+        """Keep a running job claimed and its record fresh."""
+
+        async def heartbeat() -> None:
+            while True:
+                await asyncio.sleep(self._heartbeat_seconds)
+                try:
+                    await self._queue.touch(message_id, self.consumer)
+                    await self._queue.save(record)
+                except Exception:
+                    logger.warning("Heartbeat for job %s failed", record.id, exc_info=True)
+
+        task = asyncio.create_task(heartbeat())
+        try:
+            yield
+        finally:
+            task.cancel()
+            with contextlib.suppress(asyncio.CancelledError):
+                await task
+
+    async def _notify(self, job: InterpretationJob, record: JobRecord) -> None:
+        """POST the finished job's id and status to its callback URL."""
+        if not job.callback_url or self._http_client is None:
+            return
+        if not is_allowed_callback(job.callback_url):
+            logger.warning("Skipping callback for job %s: host not allowed", record.id)
+            return
+        try:
+            response = await self._http_client.post(
+                job.callback_url, json={"job_id": record.id, "status": record.status}
+            )
+            response.raise_for_status()
+        except httpx.HTTPError:
+            logger.warning("Callback for job %s failed", record.id, exc_info=True)
+
+
+async def main() -> None:
+    from app.core.redis import close_redis, get_redis, init_redis
+    from app.services.llm_service import close_llm_service, get_llm_service, init_llm_service
+
+    logging.basicConfig(level=logging.DEBUG if settings.debug else logging.INFO)
+    await init_redis()
+    await init_llm_service()
+    async with httpx.AsyncClient(timeout=10.0) as http_client:
+        worker = JobWorker(JobQueue(get_redis()), get_llm_service(), http_client=http_client)
+        loop = asyncio.get_running_loop()
+        for sig in (signal.SIGINT, signal.SIGTERM):
+            loop.add_signal_handler(sig, worker.stop)
+        try:
+            await worker.run()
+        finally:
+            await close_llm_service()
+            await close_redis()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,162 @@
+"""Compare single-call and per-card parallel interpretation latency.
+
+Streams the same three-card readings through ``interpret_cards_stream`` in
+both modes and reports time to the first card, total latency and
+completions per reading. With ``--mock`` the OpenAI-compatible mock
+provider (``benchmarks/mock_llm.py``) is started in-process, configured by
+the usual ``MOCK_LLM_*`` variables; otherwise the configured provider is
+used.
+
+Usage:
+    python -m benchmarks.bench_interpretation_modes --mock --runs 20
+    python -m benchmarks.bench_interpretation_modes --runs 5 --output results/modes.json
+"""
+
+import argparse
+import asyncio
+import contextlib
+import json
+import statistics
+import time
+from collections.abc import AsyncIterator
+from pathlib import Path
+from typing import Any
+
+import litellm
+
+from app.core.config import settings
+from app.services.llm_service import CardInterpretation, LLMService
+from app.services.spreads import get_spread
+from benchmarks.mock_llm import create_app
+
+QUESTIONS = [
+    "What should I focus on this month?",
+    "What does the universe want me to know?",
+    "How can I find more meaning in my daily life?",
+]
+
+CARDS = get_spread("three_card").assign([
+    {"id": "m00", "name": "The Fool", "position": "upright"},
+    {"id": "m16", "name": "The Tower", "position": "reversed"},
+    {"id": "m17", "name": "The Star", "position": "upright"},
+])
+
+
+class CallCounter:
+    """Wrap litellm.acompletion to count completions."""
+
+    def __init__(self) -> None:
+        self.calls = 0
+        self._original = litellm.acompletion
+
+    async def __call__(self, **kwargs: Any) -> Any:
+        self.calls += 1
+        return await self._original(**kwargs)
+
+    def __enter__(self) -> "CallCounter":
+        litellm.acompletion = self
+        return self
+
+    def __exit__(self, *exc: object) -> None:
+        litellm.acompletion = self._original
+
+
+@contextlib.asynccontextmanager
+async def mock_provider(port: int) -> AsyncIterator[None]:
+    """Serve the mock LLM in-process and point providers at it."""
+    import uvicorn
+
+    server = uvicorn.Server(
+        uvicorn.Config(create_app(), host="127.0.0.1", port=port, log_level="warning")
+    )
+    task = asyncio.create_task(server.serve())
+    while not server.started:
+        await asyncio.sleep(0.05)
+    settings.llm_base_url = f"http://127.0.0.1:{port}/v1"
+    try:
+        yield
+    finally:
+        server.should_exit = True
+        await task
+
+
+async def read_once(llm_service: LLMService, question: str, mode: str) -> tuple[float, float]:
+    """Stream one reading; return seconds to the first card and to the end."""
+    started = time.perf_counter()
+    first_card = None
+    async for item in llm_service.interpret_cards_stream(
+        question, "unknown", CARDS, "en", mode=mode
+    ):
+        if first_card is None and isinstance(item, CardInterpretation):
+            first_card = time.perf_counter() - started
+    total = time.perf_counter() - started
+    return first_card if first_card is not None else total, total
+
+
+async def run_mode(
+    llm_service: LLMService,
+    mode: str,
+    runs: int,
+) -> dict[str, Any]:
+    """Run readings in one mode and summarize latency."""
+    # One untimed reading opens the provider connections
+    await read_once(llm_service, QUESTIONS[0], mode)
+
+    first_cards: list[float] = []
+    totals: list[float] = []
+    with CallCounter() as counter:
+        for i in range(runs):
+            first_card, total = await read_once(
+                llm_service, f"{QUESTIONS[i % len(QUESTIONS)]} ({i})", mode
+            )
+            first_cards.append(first_card)
+            totals.append(total)
+
+    return {
+        "mode": mode,
+        "runs": runs,
+        "first_card_median_s": statistics.median(first_cards),
+        "latency_mean_s": statistics.mean(totals),
+        "latency_median_s": statistics.median(totals),
+        "latency_max_s": max(totals),
+        "completions_per_reading": counter.calls / runs,
+    }
+
+
+async def run(args: argparse.Namespace) -> list[dict[str, Any]]:
+    async with contextlib.AsyncExitStack() as stack:
+        if args.mock:
+            await stack.enter_async_context(mock_provider(args.mock_port))
+        # No interpretation cache, so every timed run reaches the provider
+        llm_service = LLMService(api_key="mock" if args.mock else None)
+        return [await run_mode(llm_service, mode, args.runs) for mode in ("single", "parallel")]
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--runs", type=int, default=5)
+    parser.add_argument("--mock", action="store_true", help="Use the in-process mock LLM")
+    parser.add_argument("--mock-port", type=int, default=8101)
+    parser.add_argument("--output", type=Path, help="Write results as JSON")
+    args = parser.parse_args()
+
+    results = asyncio.run(run(args))
+
+    print(f"{'mode':<10} {'first s':>8} {'mean s':>8} {'p50 s':>8} {'max s':>8} {'calls':>6}")
+    for r in results:
+        print(
+            f"{r['mode']:<10} {r['first_card_median_s']:>8.2f} {r['latency_mean_s']:>8.2f} "
+            f"{r['latency_median_s']:>8.2f} {r['latency_max_s']:>8.2f} "
+            f"{r['completions_per_reading']:>6.1f}"
+        )
+    single, parallel = results
+    reduction = 1 - parallel["latency_median_s"] / single["latency_median_s"]
+    print(f"parallel median latency change: {-reduction:+.0%}")
+
+    if args.output:
+        args.output.parent.mkdir(parents=True, exist_ok=True)
+        args.output.write_text(json.dumps(results, indent=2), encoding="utf-8")
+
+
+if __name__ == "__main__":
+    main()
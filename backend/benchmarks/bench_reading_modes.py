@@ -0,0 +1,116 @@
+"""Compare pipelined and merged reading modes against the configured provider.
+
+Runs the same readings through both ReadingService modes and reports
+wall-clock latency, number of completions and token usage per mode.
+
+Usage:
+    python -m benchmarks.bench_reading_modes --runs 5 --language en
+    python -m benchmarks.bench_reading_modes --output results/reading_modes.json
+"""
+
+import argparse
+import asyncio
+import json
+import statistics
+import time
+from pathlib import Path
+from typing import Any
+
+import litellm
+
+from app.services.llm_service import LLMService
+from app.services.question_filter import QuestionPrefilter
+from app.services.reading_service import ReadingService
+
+# Ambiguous questions, so neither mode is short-circuited by the prefilter
+QUESTIONS = [
+    "What should I focus on this month?",
+    "What does the universe want me to know?",
+    "How can I find more meaning in my daily life?",
+]
+
+CARDS = [
+    {"id": "0", "name": "The Fool", "position": "upright"},
+    {"id": "16", "name": "The Tower", "position": "reversed"},
+    {"id": "17", "name": "The Star", "position": "upright"},
+]
+
+
+class UsageRecorder:
+    """Wrap litellm.acompletion to record token usage per completion."""
+
+    def __init__(self) -> None:
+        self.calls: list[dict[str, int]] = []
+        self._original = litellm.acompletion
+
+    async def __call__(self, **kwargs: Any) -> Any:
+        response = await self._original(**kwargs)
+        usage = getattr(response, "usage", None)
+        self.calls.append({
+            "prompt_tokens": getattr(usage, "prompt_tokens", 0) or 0,
+            "completion_tokens": getattr(usage, "completion_tokens", 0) or 0,
+        })
+        return response
+
+    def __enter__(self) -> "UsageRecorder":
+        litellm.acompletion = self
+        return self
+
+    def __exit__(self, *exc: object) -> None:
+        litellm.acompletion = self._original
+
+
+async def run_mode(mode: str, runs: int, language: str) -> dict[str, Any]:
+    """Run readings in one mode and summarize latency and usage."""
+    # An empty prefilter and no cache/index force every reading to the LLM
+    llm_service = LLMService(prefilter=QuestionPrefilter({}))
+    service = ReadingService(llm_service, mode=mode)
+
+    latencies: list[float] = []
+    with UsageRecorder() as recorder:
+        for i in range(runs):
+            question = QUESTIONS[i % len(QUESTIONS)]
+            started = time.perf_counter()
+            await service.perform_reading(question, "unknown", CARDS, language)
+            latencies.append(time.perf_counter() - started)
+
+    calls = recorder.calls
+    return {
+        "mode": mode,
+        "runs": runs,
+        "latency_mean_s": statistics.mean(latencies),
+        "latency_median_s": statistics.median(latencies),
+        "latency_max_s": max(latencies),
+        "completions_per_reading": len(calls) / runs,
+        "prompt_tokens_per_reading": sum(c["prompt_tokens"] for c in calls) / runs,
+        "completion_tokens_per_reading": sum(c["completion_tokens"] for c in calls) / runs,
+    }
+
+
+async def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--runs", type=int, default=5)
+    parser.add_argument("--language", default="en")
+    parser.add_argument("--output", type=Path, help="Write results as JSON")
+    args = parser.parse_args()
+
+    results = [
+        await run_mode(mode, args.runs, args.language) for mode in ("pipelined", "merged")
+    ]
+
+    header = f"{'mode':<10} {'mean s':>8} {'p50 s':>8} {'max s':>8} {'calls':>6} {'prompt':>8} {'output':>8}"
+    print(header)
+    for r in results:
+        print(
+            f"{r['mode']:<10} {r['latency_mean_s']:>8.2f} {r['latency_median_s']:>8.2f} "
+            f"{r['latency_max_s']:>8.2f} {r['completions_per_reading']:>6.1f} "
+            f"{r['prompt_tokens_per_reading']:>8.0f} {r['completion_tokens_per_reading']:>8.0f}"
+        )
+
+    if args.output:
+        args.output.parent.mkdir(parents=True, exist_ok=True)
+        args.output.write_text(json.dumps(results, indent=2), encoding="utf-8")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,338 @@
+"""Async load driver for the tarot API.
+
+Drives a running stack (see ``benchmarks/docker-compose.yml``: app,
+Postgres, Redis and the mock LLM) with a mix of endpoint scenarios and
+reports p50/p95/p99 latency, throughput and error rate per endpoint.
+
+Without ``--rate`` the driver runs closed-loop: ``--concurrency`` workers
+each issue requests back to back. With ``--rate`` it runs open-loop:
+scenarios start as a Poisson process at that many per second, with at most
+``--concurrency`` in flight (arrivals beyond that are counted as dropped).
+
+Usage:
+    python -m benchmarks.load_test --base-url http://127.0.0.1:8000 --duration 30
+    python -m benchmarks.load_test --scenarios validate,interpret --rate 20 \\
+        --output results/$(git rev-parse --short HEAD).json
+    python -m benchmarks.load_test --compare results/baseline.json --max-regression 0.2
+"""
+
+import argparse
+import asyncio
+import json
+import random
+import statistics
+import subprocess
+import sys
+import time
+import uuid
+from collections import defaultdict
+from collections.abc import Awaitable, Callable
+from datetime import UTC, datetime
+from pathlib import Path
+from typing import Any
+
+import httpx
+
+API_PREFIX = "/api/v1"
+
+QUESTIONS = [
+    "What should I focus on this month?",
+    "How can I improve my relationship with my partner?",
+    "What energy surrounds my career right now?",
+    "What do I need to let go of?",
+]
+
+CARDS = [
+    {"id": "0", "name": "The Fool", "position": "upright"},
+    {"id": "16", "name": "The Tower", "position": "reversed"},
+    {"id": "17", "name": "The Star", "position": "upright"},
+]
+
+
+class Recorder:
+    """Collects per-endpoint latencies and failures."""
+
+    def __init__(self) -> None:
+        self.latencies: dict[str, list[float]] = defaultdict(list)
+        self.errors: dict[str, int] = defaultdict(int)
+        self.dropped = 0
+
+    async def request(
+        self,
+        client: httpx.AsyncClient,
+        endpoint: str,
+        json_body: dict[str, Any] | None = None,
+    ) -> httpx.Response | None:
+        """POST to an endpoint, recording its latency and outcome.
+
+        Returns:
+            The response, or None if the request failed or returned an error status
+        """
+        started = time.perf_counter()
+        try:
+            response = await client.post(f"{API_PREFIX}/{endpoint}", json=json_body)
+        except httpx.HTTPError:
+            response = None
+        self.latencies[endpoint].append(time.perf_counter() - started)
+        if response is None or response.status_code >= 400:
+            self.errors[endpoint] += 1
+            return None
+        return response
+
+
+def _question(rng: random.Random, unique: bool) -> str:
+    question = rng.choice(QUESTIONS)
+    # A unique suffix defeats the interpretation cache and validation index
+    return f"{question} ({uuid.uuid4().hex[:8]})" if unique else question
+
+
+def build_scenarios(
+    rng: random.Random,
+    unique: bool,
+) -> dict[str, Callable[[httpx.AsyncClient, Recorder], Awaitable[None]]]:
+    """Build the named endpoint scenarios.
+
+    Args:
+        rng: Random source for question selection
+        unique: Make every question unique so caches do not absorb load
+
+    Returns:
+        Mapping of scenario name to coroutine function
+    """
+
+    async def draw(client: httpx.AsyncClient, recorder: Recorder) -> None:
+        await recorder.request(client, "tarot/draw")
+
+    async def validate(client: httpx.AsyncClient, recorder: Recorder) -> None:
+        await recorder.request(client, "tarot/validate", {
+            "question": _question(rng, unique),
+            "language": "en",
+        })
+
+    async def interpret(client: httpx.AsyncClient, recorder: Recorder) -> None:
+        await recorder.request(client, "tarot/interpret", {
+            "question": _question(rng, unique),
+            "cards": CARDS,
+            "language": "en",
+        })
+
+    async def login(client: httpx.AsyncClient, recorder: Recorder) -> None:
+        email = f"load-{uuid.uuid4().hex[:12]}@example.com"
+        sent = await recorder.request(client, "auth/send-code", {"email": email})
+        if sent is None:
+            return
+        # The MVP send-code endpoint returns the code in its response
+        code = sent.json()["data"]["code"]
+        await recorder.request(client, "auth/login/code", {"email": email, "code": code})
+
+    return {"draw": draw, "validate": validate, "interpret": interpret, "login": login}
+
+
+async def run_load(
+    client: httpx.AsyncClient,
+    scenarios: list[Callable[[httpx.AsyncClient, Recorder], Awaitable[None]]],
+    duration: float,
+    concurrency: int,
+    rate: float | None = None,
+    seed: int | None = None,
+) -> tuple[Recorder, float]:
+    """Run scenarios against a client for a fixed duration.
+
+    Args:
+        client: HTTP client bound to the target base URL
+        scenarios: Scenarios picked uniformly at random per iteration
+        duration: Seconds to generate load
+        concurrency: Workers (closed-loop) or in-flight cap (open-loop)
+        rate: Scenario arrivals per second; closed-loop if None
+        seed: Random seed for scenario selection and arrivals
+
+    Returns:
+        Tuple of (recorder, elapsed seconds)
+    """
+    rng = random.Random(seed)
+    recorder = Recorder()
+    started = time.perf_counter()
+    deadline = started + duration
+
+    if rate is None:
+        async def worker() -> None:
+            while time.perf_counter() < deadline:
+                await rng.choice(scenarios)(client, recorder)
+
+        await asyncio.gather(*(worker() for _ in range(concurrency)))
+    else:
+        slots = asyncio.Semaphore(concurrency)
+        tasks: set[asyncio.Task[None]] = set()
+
+        async def run_one() -> None:
+            try:
+                await rng.choice(scenarios)(client, recorder)
+            finally:
+                slots.release()
+
+        while time.perf_counter() < deadline:
+            await asyncio.sleep(rng.expovariate(rate))
+            if slots.locked():
+                recorder.dropped += 1
+                continue
+            await slots.acquire()
+            task = asyncio.create_task(run_one())
+            tasks.add(task)
+            task.add_done_callback(tasks.discard)
+        if tasks:
+            await asyncio.gather(*tasks)
+
+    return recorder, time.perf_counter() - started
+
+
+def summarize(recorder: Recorder, elapsed: float) -> dict[str, dict[str, float]]:
+    """Compute latency percentiles, throughput and error rate per endpoint.
+
+    Args:
+        recorder: Collected samples
+        elapsed: Wall-clock seconds of the run
+
+    Returns:
+        Mapping of endpoint to its statistics (latencies in milliseconds)
+    """
+    summary = {}
+    for endpoint, samples in sorted(recorder.latencies.items()):
+        ordered = sorted(samples)
+        if len(ordered) >= 2:
+            cuts = statistics.quantiles(ordered, n=100, method="inclusive")
+            p50, p95, p99 = cuts[49], cuts[94], cuts[98]
+        else:
+            p50 = p95 = p99 = ordered[0]
+        summary[endpoint] = {
+            "requests": len(ordered),
+            "errors": recorder.errors[endpoint],
+            "error_rate": recorder.errors[endpoint] / len(ordered),
+            "rps": len(ordered) / elapsed if elapsed else 0.0,
+            "mean_ms": statistics.fmean(ordered) * 1000,
+            "p50_ms": p50 * 1000,
+            "p95_ms": p95 * 1000,
+            "p99_ms": p99 * 1000,
+            "max_ms": ordered[-1] * 1000,
+        }
+    return summary
+
+
+def compare(
+    current: dict[str, dict[str, float]],
+    baseline: dict[str, dict[str, float]],
+    max_regression: float,
+) -> list[str]:
+    """Find endpoints whose p95 latency or error rate regressed.
+
+    Args:
+        current: Summary of this run
+        baseline: Summary of the run to compare against
+        max_regression: Allowed relative p95 increase (e.g. 0.2 for 20%)
+
+    Returns:
+        Human-readable regression descriptions (empty if none)
+    """
+    regressions = []
+    for endpoint, stats in current.items():
+        base = baseline.get(endpoint)
+        if base is None:
+            continue
+        if base["p95_ms"] and stats["p95_ms"] > base["p95_ms"] * (1 + max_regression):
+            regressions.append(
+                f"{endpoint}: p95 {base['p95_ms']:.0f} -> {stats['p95_ms']:.0f} ms"
+            )
+        if stats["error_rate"] > base["error_rate"] + 0.01:
+            regressions.append(
+                f"{endpoint}: error rate {base['error_rate']:.1%} -> {stats['error_rate']:.1%}"
+            )
+    return regressions
+
+
+def _git_commit() -> str | None:
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"],
+            capture_output=True, text=True, check=True,
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+async def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--base-url", default="http://127.0.0.1:8000")
+    parser.add_argument("--scenarios", default="draw,validate,interpret,login")
+    parser.add_argument("--duration", type=float, default=30.0)
+    parser.add_argument("--concurrency", type=int, default=20)
+    parser.add_argument("--rate", type=float, help="Arrivals per second (open-loop)")
+    parser.add_argument("--timeout", type=float, default=60.0)
+    parser.add_argument("--seed", type=int)
+    parser.add_argument(
+        "--repeat-questions", action="store_true",
+        help="Reuse a small question set so caches can absorb load",
+    )
+    parser.add_argument("--output", type=Path, help="Write results as JSON")
+    parser.add_argument("--compare", type=Path, help="Baseline results JSON")
+    parser.add_argument("--max-regression", type=float, default=0.2)
+    args = parser.parse_args()
+
+    available = build_scenarios(random.Random(args.seed), unique=not args.repeat_questions)
+    names = [name.strip() for name in args.scenarios.split(",") if name.strip()]
+    unknown = set(names) - set(available)
+    if unknown:
+        parser.error(f"unknown scenarios: {', '.join(sorted(unknown))}")
+
+    limits = httpx.Limits(
+        max_connections=args.concurrency, max_keepalive_connections=args.concurrency
+    )
+    async with httpx.AsyncClient(
+        base_url=args.base_url, timeout=args.timeout, limits=limits
+    ) as client:
+        recorder, elapsed = await run_load(
+            client,
+            [available[name] for name in names],
+            duration=args.duration,
+            concurrency=args.concurrency,
+            rate=args.rate,
+            seed=args.seed,
+        )
+
+    summary = summarize(recorder, elapsed)
+    print(f"{'endpoint':<18} {'reqs':>6} {'rps':>7} {'err%':>6} {'p50':>7} {'p95':>7} {'p99':>7}")
+    for endpoint, s in summary.items():
+        print(
+            f"{endpoint:<18} {s['requests']:>6} {s['rps']:>7.1f} {s['error_rate']:>6.1%} "
+            f"{s['p50_ms']:>7.0f} {s['p95_ms']:>7.0f} {s['p99_ms']:>7.0f}"
+        )
+    if recorder.dropped:
+        print(f"dropped arrivals (concurrency cap reached): {recorder.dropped}")
+
+    if args.output:
+        args.output.parent.mkdir(parents=True, exist_ok=True)
+        args.output.write_text(json.dumps({
+            "commit": _git_commit(),
+            "timestamp": datetime.now(UTC).isoformat(),
+            "config": {
+                "base_url": args.base_url,
+                "scenarios": names,
+                "duration": args.duration,
+                "concurrency": args.concurrency,
+                "rate": args.rate,
+                "repeat_questions": args.repeat_questions,
+            },
+            "elapsed_s": elapsed,
+            "dropped": recorder.dropped,
+            "endpoints": summary,
+        }, indent=2), encoding="utf-8")
+
+    if args.compare:
+        baseline = json.loads(args.compare.read_text(encoding="utf-8"))["endpoints"]
+        regressions = compare(summary, baseline, args.max_regression)
+        for line in regressions:
+            print(f"REGRESSION {line}")
+        return 1 if regressions else 0
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(asyncio.run(main()))
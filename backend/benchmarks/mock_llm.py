@@ -0,0 +1,255 @@
+"""OpenAI-compatible mock LLM provider for offline load tests and benchmarks.
+
+Serves ``POST /v1/chat/completions`` (streaming and non-streaming) with
+schema-valid validation, interpretation, merged-reading, per-card and
+synthesis JSON, detected from the prompt. Latency follows a log-normal time to first token followed
+by a fixed token rate, and a configurable fraction of requests fail.
+
+Configuration (environment variables):
+    MOCK_LLM_TTFT_MEDIAN     Median seconds to first token (default 0.5)
+    MOCK_LLM_TTFT_SIGMA      Log-normal sigma of the TTFT (default 0.5)
+    MOCK_LLM_TOKENS_PER_SEC  Output token rate; 0 disables pacing (default 50)
+    MOCK_LLM_ERROR_RATE      Fraction of requests answered with an error (default 0)
+    MOCK_LLM_ERROR_STATUS    HTTP status of injected errors (default 503)
+    MOCK_LLM_SEED            Random seed for reproducible runs (optional)
+
+Usage:
+    python -m benchmarks.mock_llm --port 8100
+    LLM_BASE_URL=http://127.0.0.1:8100/v1 uvicorn app.main:app
+"""
+
+import argparse
+import asyncio
+import json
+import math
+import os
+import random
+import re
+import time
+import uuid
+from collections.abc import AsyncIterator
+from typing import Any
+
+from fastapi import FastAPI, Request
+from fastapi.responses import JSONResponse, StreamingResponse
+from pydantic import BaseModel
+
+# Approximate characters per token when pacing and reporting usage
+CHARS_PER_TOKEN = 4
+
+# "Index 0: The Fool (upright)", optionally followed by the spread position
+_CARD_RE = re.compile(r"^Index (\d+): (.+?) \((\w+)[,)]", re.MULTILINE)
+_PART_RE = re.compile(r"Interpret only the cards with index ([\d, ]+)\.")
+
+
+class MockLLMConfig(BaseModel):
+    """Latency and error behaviour of the mock provider."""
+
+    ttft_median: float = 0.5
+    ttft_sigma: float = 0.5
+    tokens_per_second: float = 50.0
+    error_rate: float = 0.0
+    error_status: int = 503
+    seed: int | None = None
+
+    @classmethod
+    def from_env(cls) -> "MockLLMConfig":
+        """Read the configuration from MOCK_LLM_* environment variables."""
+        seed = os.environ.get("MOCK_LLM_SEED")
+        return cls(
+            ttft_median=float(os.environ.get("MOCK_LLM_TTFT_MEDIAN", 0.5)),
+            ttft_sigma=float(os.environ.get("MOCK_LLM_TTFT_SIGMA", 0.5)),
+            tokens_per_second=float(os.environ.get("MOCK_LLM_TOKENS_PER_SEC", 50)),
+            error_rate=float(os.environ.get("MOCK_LLM_ERROR_RATE", 0)),
+            error_status=int(os.environ.get("MOCK_LLM_ERROR_STATUS", 503)),
+            seed=int(seed) if seed else None,
+        )
+
+
+def _prompt_text(messages: list[dict[str, Any]]) -> str:
+    return "\n".join(str(m.get("content", "")) for m in messages)
+
+
+def mock_content(messages: list[dict[str, Any]]) -> str:
+    """Build a schema-valid JSON answer for the task found in the prompt.
+
+    Args:
+        messages: Chat messages of the request
+
+    Returns:
+        JSON text matching the validation, interpretation, merged, per-card
+        or synthesis schema
+    """
+    prompt = _prompt_text(messages)
+    cards = [
+        {"card_index": int(index), "card_name": name, "position": position}
+        for index, name, position in _CARD_RE.findall(prompt)
+    ]
+    interpretations = [
+        {
+            **card,
+            "interpretation": (
+                f"{card['card_name']} ({card['position']}) invites you to pause and "
+                "notice what is already changing around you."
+            ),
+        }
+        for card in cards
+    ]
+    overall = "Together these cards point to steady growth; trust your own pace."
+    body: dict[str, Any]
+
+    if part := _PART_RE.search(prompt):
+        indices = {int(index) for index in part.group(1).split(", ")}
+        body = {"interpretations": [i for i in interpretations if i["card_index"] in indices]}
+    elif "already been interpreted one by one" in prompt:
+        body = {"overall_interpretation": overall}
+    elif "Determine if user's question is suitable" in prompt:
+        body = {
+            "suitable": True,
+            "reason": "The question concerns personal reflection.",
+            "redirect_message": None,
+        }
+    elif "First decide whether" in prompt:
+        body = {
+            "suitable": True,
+            "reason": "The question concerns personal reflection.",
+            "interpretations": interpretations,
+            "overall_interpretation": overall,
+        }
+    else:
+        body = {"interpretations": interpretations, "overall_interpretation": overall}
+    return json.dumps(body, ensure_ascii=False)
+
+
+def _token_count(text: str) -> int:
+    return max(1, math.ceil(len(text) / CHARS_PER_TOKEN))
+
+
+def _usage(messages: list[dict[str, Any]], content: str) -> dict[str, int]:
+    prompt_tokens = _token_count(_prompt_text(messages))
+    completion_tokens = _token_count(content)
+    return {
+        "prompt_tokens": prompt_tokens,
+        "completion_tokens": completion_tokens,
+        "total_tokens": prompt_tokens + completion_tokens,
+    }
+
+
+def create_app(config: MockLLMConfig | None = None) -> FastAPI:
+    """Create the mock provider application.
+
+    Args:
+        config: Latency and error behaviour (default from environment)
+
+    Returns:
+        FastAPI application
+    """
+    config = config or MockLLMConfig.from_env()
+    rng = random.Random(config.seed)
+    app = FastAPI(title="Mock LLM provider")
+
+    def ttft() -> float:
+        if config.ttft_median <= 0:
+            return 0.0
+        return rng.lognormvariate(math.log(config.ttft_median), config.ttft_sigma)
+
+    def token_delay(tokens: int) -> float:
+        if config.tokens_per_second <= 0:
+            return 0.0
+        return tokens / config.tokens_per_second
+
+    async def chat_completions(request: Request) -> Any:
+        payload = await request.json()
+        model = payload.get("model", "mock")
+        messages = payload.get("messages", [])
+
+        if rng.random() < config.error_rate:
+            await asyncio.sleep(ttft())
+            return JSONResponse(
+                status_code=config.error_status,
+                content={"error": {
+                    "message": "Injected mock provider error",
+                    "type": "server_error",
+                    "code": str(config.error_status),
+                }},
+            )
+
+        content = mock_content(messages)
+        usage = _usage(messages, content)
+        completion_id = f"chatcmpl-{uuid.uuid4().hex}"
+        created = int(time.time())
+
+        if not payload.get("stream"):
+            await asyncio.sleep(ttft() + token_delay(usage["completion_tokens"]))
+            return {
+                "id": completion_id,
+                "object": "chat.completion",
+                "created": created,
+                "model": model,
+                "choices": [{
+                    "index": 0,
+                    "message": {"role": "assistant", "content": content},
+                    "finish_reason": "stop",
+                }],
+                "usage": usage,
+            }
+
+        include_usage = bool((payload.get("stream_options") or {}).get("include_usage"))
+
+        def chunk(delta: dict[str, Any], finish_reason: str | None = None) -> str:
+            data = {
+                "id": completion_id,
+                "object": "chat.completion.chunk",
+                "created": created,
+                "model": model,
+                "choices": [{"index": 0, "delta": delta, "finish_reason": finish_reason}],
+            }
+            return f"data: {json.dumps(data, ensure_ascii=False)}\n\n"
+
+        async def events() -> AsyncIterator[str]:
+            await asyncio.sleep(ttft())
+            yield chunk({"role": "assistant", "content": ""})
+            for start in range(0, len(content), CHARS_PER_TOKEN):
+                yield chunk({"content": content[start:start + CHARS_PER_TOKEN]})
+                await asyncio.sleep(token_delay(1))
+            yield chunk({}, finish_reason="stop")
+            if include_usage:
+                usage_chunk = {
+                    "id": completion_id,
+                    "object": "chat.completion.chunk",
+                    "created": created,
+                    "model": model,
+                    "choices": [],
+                    "usage": usage,
+                }
+                yield f"data: {json.dumps(usage_chunk)}\n\n"
+            yield "data: [DONE]\n\n"
+
+        return StreamingResponse(events(), media_type="text/event-stream")
+
+    # Serve with and without the /v1 prefix, since clients differ in what they append
+    app.add_api_route("/v1/chat/completions", chat_completions, methods=["POST"])
+    app.add_api_route("/chat/completions", chat_completions, methods=["POST"])
+
+    @app.get("/v1/models")
+    async def models() -> dict[str, Any]:
+        return {"object": "list", "data": [{"id": "mock", "object": "model"}]}
+
+    return app
+
+
+app = create_app()
+
+
+def main() -> None:
+    import uvicorn
+
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8100)
+    args = parser.parse_args()
+    uvicorn.run(app, host=args.host, port=args.port, log_level="warning")
+
+
+if __name__ == "__main__":
+    main()
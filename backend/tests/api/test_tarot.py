@@ -1,3 +1,4 @@
+import json
 import pytest
 from unittest.mock import AsyncMock, MagicMock
 from fastapi.testclient import TestClient
@@ -13,7 +14,7 @@ class MockLLMService:
             redirect_message=None
         )
 
-    async def interpret_cards(self, question, gender, cards, language):
+    async def interpret_cards(self, question, gender, cards, language, **_kwargs):
         return InterpretationResult(
             interpretations=[
                 CardInterpretation(
@@ -26,6 +27,12 @@ class MockLLMService:
             overall_interpretation="Overall mock interpretation"
         )
 
+    async def interpret_cards_stream(self, question, gender, cards, language, **_kwargs):
+        result = await self.interpret_cards(question, gender, cards, language)
+        for interp in result.interpretations:
+            yield interp
+        yield result
+
 @pytest.fixture
 def mock_llm_service():
     return MockLLMService()
@@ -51,13 +58,14 @@ async def test_tarot_flow(client: TestClient, mock_llm_service):
     data = response.json()["data"]
     assert len(data["cards"]) == 3
     cards = data["cards"]
+    assert all(c["meaning"] for c in cards)
     
+    draw_token = data["draw_token"]
+
     # 3. Interpret
     response = client.post("/api/v1/tarot/interpret", json={
         "question": "Is this a good time to start a business?",
-        "cards": [
-            {"id": c["id"], "name_key": c["name_key"], "position": c["position"]} for c in cards
-        ],
+        "draw_token": draw_token,
         "language": "en",
         "device_fingerprint": "test_fingerprint"
     })
@@ -66,6 +74,194 @@ async def test_tarot_flow(client: TestClient, mock_llm_service):
     assert "reading_id" in data
     assert len(data["interpretations"]) == 3
     assert "overall_interpretation" in data
+    # Cards are re-derived from the token, not taken from the client
+    assert [i["card_name"] for i in data["interpretations"]] == [c["name_key"] for c in cards]
+
+    response = client.post("/api/v1/tarot/interpret", json={
+        "question": "Is this a good time to start a business?",
+        "draw_token": draw_token[:-2] + ("AA" if draw_token[-2:] != "AA" else "BB"),
+        "language": "en",
+    })
+    assert response.status_code == 422
     
     # Clear overrides
     app.dependency_overrides = {}
+
+
+def test_interpret_card_ids(client: TestClient, mock_llm_service):
+    from app.main import app
+    app.dependency_overrides[get_llm_service] = lambda: mock_llm_service
+
+    body = {
+        "question": "Is this a good time to start a business?",
+        "cards": [{"id": "0", "position": "upright"}, {"id": "w2", "position": "reversed"}],
+        "language": "en",
+    }
+    response = client.post("/api/v1/tarot/interpret", json=body)
+    assert response.status_code == 200
+    assert len(response.json()["data"]["interpretations"]) == 2
+
+    body["cards"] = [{"id": "nope", "position": "upright"}]
+    assert client.post("/api/v1/tarot/interpret", json=body).status_code == 422
+    body["cards"] = [{"id": "0", "position": "sideways"}]
+    assert client.post("/api/v1/tarot/interpret", json=body).status_code == 422
+
+    app.dependency_overrides = {}
+
+
+def test_card_catalog_is_cacheable(client: TestClient):
+    response = client.get("/api/v1/tarot/cards?language=zh")
+    assert response.status_code == 200
+    data = response.json()["data"]
+    assert len(data["cards"]) == 78
+    assert data["cards"][0]["name"] == "愚者"
+    assert data["cards"][0]["image"].startswith("/cards/0.")
+    assert data["cards"][0]["image"] != "/cards/0.webp"
+    etag = response.headers["etag"]
+    assert etag.startswith('"')
+    assert "immutable" not in response.headers["cache-control"]
+
+    response = client.get(
+        "/api/v1/tarot/cards?language=zh", headers={"If-None-Match": f'W/{etag}'}
+    )
+    assert response.status_code == 304
+    assert response.content == b""
+    assert response.headers["etag"] == etag
+
+    response = client.get(f"/api/v1/tarot/cards?language=en&v={data['version']}")
+    assert response.status_code == 200
+    assert response.headers["etag"] != etag
+    assert response.headers["cache-control"] == "public, max-age=31536000, immutable"
+
+
+def test_draw_spread(client: TestClient):
+    response = client.post("/api/v1/tarot/draw?spread=celtic_cross&language=zh")
+    assert response.status_code == 200
+    data = response.json()["data"]
+    assert len(data["cards"]) == 10
+    assert data["spread"]["name"] == "凯尔特十字"
+    assert [c["spread_position"] for c in data["cards"]] == [
+        p["key"] for p in data["spread"]["positions"]
+    ]
+
+    response = client.post("/api/v1/tarot/draw?spread=unknown")
+    assert response.status_code == 422
+
+
+def test_interpret_stream(client: TestClient, mock_llm_service):
+    from app.main import app
+    app.dependency_overrides[get_llm_service] = lambda: mock_llm_service
+
+    response = client.post("/api/v1/tarot/interpret/stream", json={
+        "question": "Is this a good time to start a business?",
+        "cards": [
+            {"id": "0", "name_key": "card_0", "position": "upright"},
+            {"id": "1", "name_key": "card_1", "position": "reversed"},
+        ],
+        "language": "en",
+    })
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("text/event-stream")
+
+    events = [
+        line.removeprefix("event: ")
+        for line in response.text.splitlines()
+        if line.startswith("event: ")
+    ]
+    assert events == ["preview", "card", "card", "overall", "done"]
+    preview = json.loads(response.text.split("data: ", 1)[1].split("\n", 1)[0])
+    assert [card["card_name"] for card in preview["cards"]] == ["The Fool", "The Magician"]
+
+    app.dependency_overrides = {}
+
+
+def test_reading_endpoint(client: TestClient, mock_llm_service):
+    from app.main import app
+    app.dependency_overrides[get_llm_service] = lambda: mock_llm_service
+
+    response = client.post("/api/v1/tarot/reading", json={
+        "question": "Is this a good time to start a business?",
+        "language": "en",
+    })
+    assert response.status_code == 200
+    data = response.json()["data"]
+    assert data["suitable"] is True
+    assert data["reading_id"]
+    assert len(data["cards"]) == 3
+    assert len(data["interpretations"]) == 3
+    assert data["overall_interpretation"] == "Overall mock interpretation"
+
+    app.dependency_overrides = {}
+
+
+def test_interpret_batch(client: TestClient, mock_llm_service):
+    from app.core.exceptions import TarotError
+    from app.main import app
+
+    original = mock_llm_service.interpret_cards
+
+    async def interpret_cards(question, gender, cards, language):
+        if question == "fail":
+            raise TarotError(message="Failed to interpret cards")
+        return await original(question, gender, cards, language)
+
+    mock_llm_service.interpret_cards = interpret_cards
+    app.dependency_overrides[get_llm_service] = lambda: mock_llm_service
+
+    cards = [{"id": "0", "name_key": "card_0", "position": "upright"}]
+    response = client.post("/api/v1/tarot/interpret/batch", json={
+        "items": [
+            {"question": "First?", "cards": cards, "language": "en"},
+            {"question": "fail", "cards": cards, "language": "en"},
+            {"question": "Third?", "cards": cards, "language": "en"},
+        ],
+    })
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("application/x-ndjson")
+
+    lines = [json.loads(line) for line in response.text.splitlines()]
+    assert [line["index"] for line in lines] == [0, 1, 2]
+    assert [line["status"] for line in lines] == ["ok", "error", "ok"]
+    assert lines[1]["error"]["code"] == "TAROT_ERROR"
+    assert lines[2]["overall_interpretation"] == "Overall mock interpretation"
+
+    response = client.post("/api/v1/tarot/interpret/batch", json={
+        "items": [{"question": "First?", "cards": [{"id": "nope", "position": "upright"}]}],
+    })
+    assert response.status_code == 422
+
+    app.dependency_overrides = {}
+
+
+def test_interpret_job(client: TestClient):
+    card = {"id": "0", "name_key": "card_0", "position": "upright"}
+    response = client.post("/api/v1/tarot/jobs", json={
+        "question": "Is this a good time to start a business?",
+        "cards": [card],
+        "language": "en",
+    })
+    assert response.status_code == 202
+    job = response.json()["data"]
+    assert job["status"] == "queued"
+
+    response = client.get(f"/api/v1/tarot/jobs/{job['job_id']}")
+    assert response.status_code == 200
+    assert response.json()["data"]["status"] == "queued"
+    assert client.get("/api/v1/tarot/jobs/unknown").status_code == 404
+
+
+def test_job_callback_url_is_restricted(client: TestClient, mock_llm_service):
+    from app.main import app
+
+    app.dependency_overrides[get_llm_service] = lambda: mock_llm_service
+
+    body = {
+        "question": "Is this a good time to start a business?",
+        "cards": [{"id": "0", "name_key": "card_0", "position": "upright"}],
+        "callback_url": "http://169.254.169.254/latest/meta-data",
+    }
+    assert client.post("/api/v1/tarot/jobs", json=body).status_code == 422
+    # Synchronous paths never call back, so the field is rejected there
+    assert client.post("/api/v1/tarot/interpret", json=body).status_code == 422
+
+    app.dependency_overrides = {}
@@ -0,0 +1,63 @@
+"""Test the async load driver."""
+
+import asyncio
+
+import httpx
+import pytest
+from fastapi import FastAPI, HTTPException
+
+from benchmarks.load_test import Recorder, compare, run_load, summarize
+
+
+def _app() -> FastAPI:
+    app = FastAPI()
+
+    @app.post("/api/v1/ok")
+    async def ok():
+        await asyncio.sleep(0.001)
+        return {"success": True}
+
+    @app.post("/api/v1/fail")
+    async def fail():
+        raise HTTPException(status_code=503)
+
+    return app
+
+
+@pytest.mark.asyncio
+async def test_closed_loop_records_latency_and_errors():
+    """Test the driver records every request and counts error statuses."""
+
+    async def scenario(client, recorder):
+        await recorder.request(client, "ok")
+        await recorder.request(client, "fail")
+
+    transport = httpx.ASGITransport(app=_app())
+    async with httpx.AsyncClient(transport=transport, base_url="http://test") as client:
+        recorder, elapsed = await run_load(client, [scenario], duration=0.2, concurrency=4)
+
+    summary = summarize(recorder, elapsed)
+    assert summary["ok"]["requests"] == summary["fail"]["requests"] > 0
+    assert summary["ok"]["error_rate"] == 0
+    assert summary["fail"]["error_rate"] == 1
+    assert summary["ok"]["p50_ms"] <= summary["ok"]["p99_ms"]
+
+
+def test_summarize_percentiles():
+    """Test percentiles and throughput are computed per endpoint."""
+    recorder = Recorder()
+    recorder.latencies["draw"] = [i / 1000 for i in range(1, 101)]
+
+    summary = summarize(recorder, elapsed=10.0)["draw"]
+
+    assert summary["rps"] == 10.0
+    assert summary["p50_ms"] == pytest.approx(50.5)
+    assert summary["p95_ms"] == pytest.approx(95.05)
+
+
+def test_compare_flags_regressions():
+    """Test p95 and error-rate regressions beyond the threshold are reported."""
+    baseline = {"draw": {"p95_ms": 100.0, "error_rate": 0.0}}
+
+    assert compare({"draw": {"p95_ms": 110.0, "error_rate": 0.0}}, baseline, 0.2) == []
+    assert len(compare({"draw": {"p95_ms": 150.0, "error_rate": 0.05}}, baseline, 0.2)) == 2
@@ -0,0 +1,98 @@
+"""Test the mock OpenAI-compatible LLM provider."""
+
+import json
+
+from fastapi.testclient import TestClient
+
+from app.services.llm_service import InterpretationResult, LLMService, ValidationResult
+from benchmarks.mock_llm import MockLLMConfig, create_app
+
+INSTANT = MockLLMConfig(ttft_median=0, tokens_per_second=0)
+CARDS = [
+    {"name": "The Star", "position": "upright"},
+    {"name": "The Tower", "position": "reversed"},
+]
+
+
+def _messages(template: str, **kwargs):
+    return LLMService(api_key="test-key")._prompt_messages(template, "en", **kwargs)
+
+
+def test_validation_response_is_schema_valid():
+    """Test validation prompts get a ValidationResult-shaped answer with usage."""
+    client = TestClient(create_app(INSTANT))
+    response = client.post("/v1/chat/completions", json={
+        "model": "mock",
+        "messages": _messages("validation.j2", question="What now?", gender="f"),
+    })
+
+    assert response.status_code == 200
+    body = response.json()
+    ValidationResult.model_validate_json(body["choices"][0]["message"]["content"])
+    assert body["usage"]["prompt_tokens"] > 0
+
+
+def test_stream_reassembles_to_interpretation():
+    """Test streamed chunks join into an interpretation for every card."""
+    client = TestClient(create_app(INSTANT))
+    response = client.post("/v1/chat/completions", json={
+        "model": "mock",
+        "stream": True,
+        "stream_options": {"include_usage": True},
+        "messages": _messages(
+            "interpretation.j2", question="What now?", gender="f", cards=CARDS
+        ),
+    })
+
+    events = [
+        line.removeprefix("data: ")
+        for line in response.text.splitlines()
+        if line.startswith("data: ")
+    ]
+    assert events[-1] == "[DONE]"
+    chunks = [json.loads(event) for event in events[:-1]]
+    content = "".join(
+        chunk["choices"][0]["delta"].get("content", "") for chunk in chunks if chunk["choices"]
+    )
+
+    result = InterpretationResult.model_validate_json(content)
+    assert [i.card_name for i in result.interpretations] == ["The Star", "The Tower"]
+    assert chunks[-1]["usage"]["completion_tokens"] > 0
+
+
+def test_part_and_synthesis_prompts_are_answered():
+    """Test per-card prompts get only their cards and synthesis only the overall."""
+    from app.services.spreads import get_spread
+
+    client = TestClient(create_app(INSTANT))
+    cards = get_spread("three_card").assign(
+        [{"name": "The Star", "position": "upright"} for _ in range(3)]
+    )
+
+    def content(template, **kwargs):
+        response = client.post("/v1/chat/completions", json={
+            "model": "mock",
+            "messages": _messages(template, question="What now?", gender="f", cards=cards, **kwargs),
+        })
+        return json.loads(response.json()["choices"][0]["message"]["content"])
+
+    part = content("cards.j2", indices=[1])
+    assert [i["card_index"] for i in part["interpretations"]] == [1]
+    assert "overall_interpretation" not in part
+
+    interpretations = [
+        {"card_index": 0, "card_name": "The Star", "position": "upright", "interpretation": "Hope."}
+    ]
+    assert set(content("synthesis.j2", interpretations=interpretations)) == {
+        "overall_interpretation"
+    }
+
+
+def test_error_rate_injects_failures():
+    """Test an error rate of 1 fails every request with the configured status."""
+    config = INSTANT.model_copy(update={"error_rate": 1.0, "error_status": 429})
+    client = TestClient(create_app(config))
+    response = client.post("/v1/chat/completions", json={"model": "mock", "messages": []})
+
+    assert response.status_code == 429
+    assert "error" in response.json()
@@ -1,6 +1,14 @@
 """Pytest configuration and fixtures."""
 
+import asyncio
+import os
+import time
+
+# Keep app startup offline: no provider connection warm-up in tests
+os.environ.setdefault("LLM_WARMUP_ENABLED", "false")
+
 import pytest
+import redis.asyncio as redis
 from typing import AsyncGenerator, Generator
 from unittest.mock import AsyncMock, MagicMock
 from fastapi.testclient import TestClient
@@ -16,15 +24,133 @@ class MockRedis:
     async def get(self, key):
         return self.store.get(key)
 
-    async def set(self, key, value, ex=None):
+    async def set(self, key, value, ex=None, nx=False):
+        if nx and key in self.store:
+            return None
         self.store[key] = value
         return True
 
-    async def delete(self, key):
-        if key in self.store:
-            del self.store[key]
+    async def delete(self, *keys):
+        for key in keys:
+            self.store.pop(key, None)
         return True
 
+    async def hincrby(self, key, field, amount=1):
+        hash_ = self.store.setdefault(key, {})
+        hash_[field] = str(int(hash_.get(field, 0)) + amount)
+        return int(hash_[field])
+
+    async def hgetall(self, key):
+        return dict(self.store.get(key, {}))
+
+    async def zadd(self, key, mapping):
+        self.store.setdefault(key, {}).update(mapping)
+        return len(mapping)
+
+    async def zcard(self, key):
+        return len(self.store.get(key, {}))
+
+    async def zremrangebyscore(self, key, min_score, max_score):
+        zset = self.store.get(key, {})
+        removed = [m for m, score in zset.items() if min_score <= score <= max_score]
+        for member in removed:
+            del zset[member]
+        return len(removed)
+
+    async def expire(self, key, _seconds):
+        return key in self.store
+
+    async def sadd(self, key, *members):
+        set_ = self.store.setdefault(key, set())
+        added = len(set(members) - set_)
+        set_.update(members)
+        return added
+
+    async def srem(self, key, *members):
+        set_ = self.store.get(key, set())
+        removed = len(set_ & set(members))
+        set_.difference_update(members)
+        return removed
+
+    async def sunion(self, *keys):
+        return set().union(*(self.store.get(key, set()) for key in keys))
+
+    async def zpopmin(self, key, count=1):
+        zset = self.store.get(key, {})
+        popped = sorted(zset.items(), key=lambda item: item[1])[:count]
+        for member, _ in popped:
+            del zset[member]
+        return popped
+
+    async def rpush(self, key, *values):
+        list_ = self.store.setdefault(key, [])
+        list_.extend(values)
+        return len(list_)
+
+    async def blpop(self, keys, **_kwargs):
+        # Blocks briefly rather than for the full timeout
+        for _ in range(2):
+            for key in keys:
+                if self.store.get(key):
+                    return key, self.store[key].pop(0)
+            await asyncio.sleep(0.01)
+        return None
+
+    async def xadd(self, name, fields):
+        stream = self.store.setdefault(name, {"entries": [], "groups": {}})
+        message_id = f"{len(stream['entries']) + 1}-0"
+        stream["entries"].append((message_id, dict(fields)))
+        return message_id
+
+    async def xgroup_create(self, name, groupname, id="$", **_kwargs):
+        stream = self.store.setdefault(name, {"entries": [], "groups": {}})
+        if groupname in stream["groups"]:
+            raise redis.ResponseError("BUSYGROUP Consumer Group name already exists")
+        start = 0 if id == "0" else len(stream["entries"])
+        stream["groups"][groupname] = {"next": start, "pending": {}}
+        return True
+
+    async def xreadgroup(self, groupname, consumername, streams, count=None, **_kwargs):
+        response = []
+        for name in streams:
+            stream = self.store[name]
+            group = stream["groups"][groupname]
+            entries = stream["entries"][group["next"]:group["next"] + (count or 1_000_000)]
+            group["next"] += len(entries)
+            for message_id, _ in entries:
+                group["pending"][message_id] = {"consumer": consumername, "since": time.time()}
+            if entries:
+                response.append([name, entries])
+        return response
+
+    async def xack(self, name, groupname, *ids):
+        pending = self.store[name]["groups"][groupname]["pending"]
+        return sum(pending.pop(message_id, None) is not None for message_id in ids)
+
+    async def xclaim(self, name, groupname, consumername, _min_idle_time, message_ids,
+                     **_kwargs):
+        pending = self.store[name]["groups"][groupname]["pending"]
+        claimed = [message_id for message_id in message_ids if message_id in pending]
+        for message_id in claimed:
+            pending[message_id] = {"consumer": consumername, "since": time.time()}
+        return claimed
+
+    async def xautoclaim(self, name, groupname, consumername, min_idle_time,
+                         count=None, **_kwargs):
+        stream = self.store[name]
+        pending = stream["groups"][groupname]["pending"]
+        now = time.time()
+        claimed = []
+        for message_id, entry in stream["entries"]:
+            info = pending.get(message_id)
+            if info is None or (now - info["since"]) * 1000 < min_idle_time:
+                continue
+            pending[message_id] = {"consumer": consumername, "since": now}
+            claimed.append((message_id, entry))
+            if count and len(claimed) >= count:
+                break
+        return ["0-0", claimed, []]
+
 @pytest.fixture
 def mock_redis():
     return MockRedis()
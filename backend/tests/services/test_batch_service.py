@@ -0,0 +1,73 @@
+"""Test batch interpretation fan-out."""
+
+import asyncio
+
+import pytest
+
+from app.core.exceptions import TarotError
+from app.services.batch_service import BatchInterpretationService, BatchItem
+from app.services.llm_service import InterpretationResult
+
+CARDS = [{"id": "17", "position": "upright"}]
+
+
+class FakeLLMService:
+    def __init__(self, delays: dict[str, float]) -> None:
+        self.delays = delays
+        self.in_flight = 0
+        self.max_in_flight = 0
+
+    async def interpret_cards(self, question, _gender, _cards, _language):
+        self.in_flight += 1
+        self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        try:
+            await asyncio.sleep(self.delays.get(question, 0.01))
+            if question == "fail":
+                raise TarotError(message="Failed to interpret cards")
+            return InterpretationResult(interpretations=[], overall_interpretation=question)
+        finally:
+            self.in_flight -= 1
+
+
+def _items(*questions: str) -> list[BatchItem]:
+    return [BatchItem(question=q, cards=CARDS, language="en") for q in questions]
+
+
+@pytest.mark.asyncio
+async def test_concurrency_is_bounded():
+    """Test no more than the configured number of items run at once."""
+    llm = FakeLLMService({})
+    service = BatchInterpretationService(llm, concurrency=2)
+
+    results = [r async for r in service.interpret_many(_items(*"abcdef"))]
+
+    assert [r.result.overall_interpretation for r in results] == list("abcdef")
+    assert llm.max_in_flight == 2
+
+
+@pytest.mark.asyncio
+async def test_unordered_yields_as_completed_and_isolates_errors():
+    """Test completion-order streaming and per-item error results."""
+    llm = FakeLLMService({"slow": 0.05, "fail": 0.0, "fast": 0.0})
+    service = BatchInterpretationService(llm, concurrency=3)
+
+    results = [r async for r in service.interpret_many(_items("slow", "fail", "fast"), False)]
+
+    assert results[-1].index == 0
+    failed = next(r for r in results if r.index == 1)
+    assert not failed.ok
+    assert failed.error_code == "TAROT_ERROR"
+
+
+@pytest.mark.asyncio
+async def test_stopping_early_cancels_pending_items():
+    """Test abandoning the stream cancels items still running."""
+    llm = FakeLLMService({"b": 1.0, "c": 1.0})
+    service = BatchInterpretationService(llm, concurrency=3)
+
+    stream = service.interpret_many(_items("a", "b", "c"))
+    first = await stream.__anext__()
+    await stream.aclose()
+
+    assert first.index == 0
+    assert llm.in_flight == 0
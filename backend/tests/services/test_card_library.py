@@ -0,0 +1,46 @@
+"""Test precomputed card meaning library."""
+
+import json
+
+from app.data.tarot_cards import TAROT_CARDS
+from app.services.card_library import CARD_MEANINGS_PATH, get_card_library
+from app.services.llm_service import SUPPORTED_LANGUAGES
+
+CARDS = [{"id": "0", "position": "upright"}, {"id": "w2", "position": "reversed"}]
+
+
+def test_library_covers_every_card():
+    """Test the bundled library has both positions of every card in each language."""
+    library = get_card_library()
+    meanings = json.loads(CARD_MEANINGS_PATH.read_text(encoding="utf-8"))
+
+    assert len(library) == len(TAROT_CARDS)
+    assert set(meanings["languages"]) == set(SUPPORTED_LANGUAGES)
+    for language in SUPPORTED_LANGUAGES:
+        assert meanings["overall"][language]
+        for card in TAROT_CARDS:
+            for position in ("upright", "reversed"):
+                assert meanings["cards"][card["id"]][position][language]
+
+
+def test_interpret_builds_localized_degraded_reading():
+    """Test library readings use localized names and fall back to English."""
+    library = get_card_library()
+
+    zh = library.interpret(CARDS, "zh")
+    ja = library.interpret(CARDS, "ja")
+    fr = library.interpret(CARDS, "fr")
+
+    assert zh.degraded is True
+    assert [i.card_name for i in zh.interpretations] == ["愚者", "权杖二"]
+    assert zh.interpretations[1].position == "reversed"
+    assert zh.interpretations[1].interpretation == library.meaning("w2", "reversed", "zh")
+    assert ja.interpretations[0].interpretation.startswith("新たな始まり")
+    assert fr.interpretations[0].interpretation == library.meaning("0", "upright", "en")
+
+
+def test_interpret_rejects_unknown_cards():
+    """Test a reading with a card missing from the library is not faked."""
+    library = get_card_library()
+
+    assert library.interpret([{"id": "nope", "position": "upright"}], "en") is None
@@ -0,0 +1,71 @@
+"""Test seeded, signed card draws."""
+
+from collections import Counter
+
+import pytest
+
+from app.services.draw_engine import DrawEngine
+from app.services.spreads import get_spread
+
+
+def test_seed_reproduces_draw():
+    """Test a seed always deals the same distinct cards onto the spread."""
+    engine = DrawEngine(secret="test-secret")
+    celtic_cross = get_spread("celtic_cross")
+    seed = bytes(range(16))
+
+    cards = engine.deal(seed, celtic_cross)
+
+    assert cards == engine.deal(seed, celtic_cross)
+    assert len({card["id"] for card in cards}) == 10
+    assert [card["spread_position"] for card in cards] == [p.key for p in celtic_cross.positions]
+    assert engine.deal(bytes(16), celtic_cross) != cards
+    # Dealing fewer cards deals the same first cards
+    three = engine.deal(seed, get_spread("three_card"))
+    assert [c["id"] for c in three] == [c["id"] for c in cards[:3]]
+
+
+def test_token_round_trip():
+    """Test a draw token re-derives the cards it was issued with."""
+    engine = DrawEngine(secret="test-secret")
+
+    draw = engine.draw(get_spread("five_card"))
+
+    assert len(draw.token) < 64
+    assert engine.cards_for_token(draw.token) == draw.cards
+    assert draw.cards[0]["spread"] == "five_card"
+
+
+@pytest.mark.parametrize("tamper", [
+    lambda token: token[:-2] + ("AA" if token[-2:] != "AA" else "BB"),
+    lambda token: token[:10],
+    lambda _: "not a token!",
+])
+def test_tampered_token_is_rejected(tamper):
+    """Test forged or malformed tokens do not verify."""
+    engine = DrawEngine(secret="test-secret")
+    token = engine.draw(get_spread()).token
+
+    with pytest.raises(ValueError):
+        engine.cards_for_token(tamper(token))
+    with pytest.raises(ValueError):
+        DrawEngine(secret="other-secret").cards_for_token(token)
+
+
+def test_draws_are_roughly_uniform():
+    """Test every card and both orientations come up at about the expected rate."""
+    engine = DrawEngine(secret="test-secret")
+    cards = Counter()
+    positions = Counter()
+    yes_no = get_spread("yes_no")
+    draws = 3000
+    for _ in range(draws):
+        card = engine.draw(yes_no).cards[0]
+        cards[card["id"]] += 1
+        positions[card["position"]] += 1
+
+    expected = draws / 78
+    assert len(cards) == 78
+    assert max(cards.values()) < 2 * expected
+    assert min(cards.values()) > expected / 3
+    assert abs(positions["upright"] - draws / 2) < draws * 0.05
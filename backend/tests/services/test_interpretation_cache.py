@@ -0,0 +1,102 @@
+"""Test interpretation result cache."""
+
+import pytest
+
+from app.core.config import settings
+from app.services.interpretation_cache import InterpretationCache
+from app.services.llm_service import (
+    CardInterpretation,
+    InterpretationResult,
+    LLMService,
+)
+
+CARDS = [
+    {"id": "0", "name_key": "card_0", "position": "upright"},
+    {"id": "16", "name_key": "card_16", "position": "reversed"},
+    {"id": "w1", "name_key": "card_w1", "position": "upright"},
+]
+
+
+def _result(text: str = "Overall") -> InterpretationResult:
+    return InterpretationResult(
+        interpretations=[
+            CardInterpretation(
+                card_index=0, card_name="The Fool", position="upright", interpretation="New"
+            )
+        ],
+        overall_interpretation=text,
+    )
+
+
+def test_build_key_normalizes_question():
+    """Test trivial question variations share a key."""
+    key_a = InterpretationCache.build_key(
+        "Will I get the job?", "unknown", CARDS, "en", "m", "1"
+    )
+    key_b = InterpretationCache.build_key(
+        "  will i  get the JOB ", "unknown", CARDS, "en", "m", "1"
+    )
+
+    assert key_a == key_b
+
+
+def test_build_key_depends_on_context():
+    """Test gender, card order, language, model and template version change the key."""
+    base = InterpretationCache.build_key("Q", "unknown", CARDS, "en", "m", "1")
+
+    assert base != InterpretationCache.build_key("Q", "female", CARDS, "en", "m", "1")
+    assert base != InterpretationCache.build_key("Q", "unknown", CARDS[::-1], "en", "m", "1")
+    assert base != InterpretationCache.build_key("Q", "unknown", CARDS, "zh", "m", "1")
+    assert base != InterpretationCache.build_key("Q", "unknown", CARDS, "en", "other", "1")
+    assert base != InterpretationCache.build_key("Q", "unknown", CARDS, "en", "m", "2")
+
+
+@pytest.mark.asyncio
+async def test_get_set_and_stats(mock_redis):
+    """Test cache round-trip and hit/miss counters."""
+    cache = InterpretationCache(mock_redis, ttl_seconds=60, max_entries=10)
+    key = cache.build_key("Q", "unknown", CARDS, "en", "m", "1")
+
+    assert await cache.get(key) is None
+    await cache.set(key, _result())
+    cached = await cache.get(key)
+
+    assert cached == _result()
+    stats = await cache.stats()
+    assert (stats.hits, stats.misses, stats.entries) == (1, 1, 1)
+    assert stats.hit_rate == 0.5
+
+
+@pytest.mark.asyncio
+async def test_evicts_oldest_entries(mock_redis):
+    """Test entries beyond max_entries are evicted oldest first."""
+    cache = InterpretationCache(mock_redis, ttl_seconds=60, max_entries=2)
+    keys = [cache.build_key(f"Q{i}", "unknown", CARDS, "en", "m", "1") for i in range(3)]
+
+    for key in keys:
+        await cache.set(key, _result())
+
+    assert await cache.get(keys[0]) is None
+    assert await cache.get(keys[2]) is not None
+    assert (await cache.stats()).entries == 2
+
+
+@pytest.mark.asyncio
+async def test_llm_service_skips_llm_on_hit(mock_redis, monkeypatch):
+    """Test a cache hit returns without calling the LLM."""
+    import litellm
+
+    async def fail_acompletion(**kwargs):
+        raise AssertionError("LLM should not be called on cache hit")
+
+    monkeypatch.setattr(litellm, "acompletion", fail_acompletion)
+    cache = InterpretationCache(mock_redis, ttl_seconds=60, max_entries=10)
+    service = LLMService(api_key="test-key", cache=cache)
+    key = cache.build_key(
+        "Q", "unknown", CARDS, "en", service._model, settings.prompt_template_version
+    )
+    await cache.set(key, _result("Cached"))
+
+    result = await service.interpret_cards("Q", "unknown", CARDS, "en")
+
+    assert result.overall_interpretation == "Cached"
@@ -0,0 +1,81 @@
+"""Test the Redis Streams interpretation job queue."""
+
+import asyncio
+
+import pytest
+
+from app.services.job_queue import JOB_DONE, JOB_QUEUED, InterpretationJob, JobQueue
+
+CARDS = [{"name": "The Star", "position": "upright"}]
+
+
+@pytest.mark.asyncio
+async def test_enqueue_and_read(mock_redis):
+    """Test an enqueued job is recorded as queued and delivered once."""
+    queue = JobQueue(mock_redis, stream="jobs:test", group="workers")
+    await queue.ensure_group()
+    await queue.ensure_group()
+
+    record = await queue.enqueue(InterpretationJob(question="Q?", cards=CARDS))
+
+    assert record.status == JOB_QUEUED
+    assert (await queue.get(record.id)).status == JOB_QUEUED
+    jobs = await queue.read("worker-1", count=10, block_ms=0)
+    assert [job.id for _, job in jobs] == [record.id]
+    assert await queue.read("worker-2", count=10, block_ms=0) == []
+
+
+@pytest.mark.asyncio
+async def test_unacked_job_is_reclaimed_after_idle(mock_redis):
+    """Test a job left pending is re-claimed, and an acked one is not."""
+    queue = JobQueue(mock_redis, stream="jobs:test", group="workers", retry_idle_seconds=0)
+    await queue.ensure_group()
+    first = await queue.enqueue(InterpretationJob(question="one", cards=CARDS))
+    await queue.enqueue(InterpretationJob(question="two", cards=CARDS))
+    jobs = await queue.read("worker-1", count=10, block_ms=0)
+
+    await queue.ack(jobs[1][0])
+    claimed = await queue.claim_stale("worker-2", count=10)
+
+    assert [job.id for _, job in claimed] == [first.id]
+
+
+@pytest.mark.asyncio
+async def test_touched_job_is_not_reclaimed(mock_redis):
+    """Test a running job's heartbeat keeps it from going stale."""
+    queue = JobQueue(mock_redis, stream="jobs:test", group="workers", retry_idle_seconds=0.05)
+    await queue.ensure_group()
+    await queue.enqueue(InterpretationJob(question="Q?", cards=CARDS))
+    [(message_id, _)] = await queue.read("worker-1", count=1, block_ms=0)
+
+    await asyncio.sleep(0.06)
+    await queue.touch(message_id, "worker-1")
+
+    assert await queue.claim_stale("worker-2", count=10) == []
+
+
+@pytest.mark.asyncio
+async def test_dead_letter_acks_and_copies_job(mock_redis):
+    """Test dead-lettered jobs move to the dead-letter stream."""
+    queue = JobQueue(mock_redis, stream="jobs:test", group="workers", retry_idle_seconds=0)
+    await queue.ensure_group()
+    await queue.enqueue(InterpretationJob(question="Q?", cards=CARDS))
+    [(message_id, job)] = await queue.read("worker-1", count=1, block_ms=0)
+
+    await queue.dead_letter(message_id, job, "boom")
+
+    assert await queue.claim_stale("worker-1", count=10) == []
+    [(_, fields)] = mock_redis.store["jobs:test:dead"]["entries"]
+    assert fields["error"] == "boom"
+
+
+@pytest.mark.asyncio
+async def test_wait_returns_finished_job(mock_redis):
+    """Test long-polling returns once the job is finished."""
+    queue = JobQueue(mock_redis, stream="jobs:test", group="workers")
+    record = await queue.enqueue(InterpretationJob(question="Q?", cards=CARDS))
+    record.status = JOB_DONE
+    await queue.save(record)
+
+    assert (await queue.wait(record.id, timeout=5)).status == JOB_DONE
+    assert await queue.wait("unknown", timeout=5) is None
@@ -0,0 +1,196 @@
+"""Test LLM provider concurrency limiting and circuit breaking."""
+
+import asyncio
+from types import SimpleNamespace
+
+import litellm
+import pytest
+
+from app.core.exceptions import LLMUnavailableError
+from app.services.llm_resilience import (
+    AdaptiveLimiter,
+    CircuitBreaker,
+    ProviderGuard,
+    is_overload_error,
+)
+from app.services.llm_router import LLMProvider, LLMRouter
+
+PRIMARY = LLMProvider(name="deepseek", model="deepseek/deepseek-chat", api_key="k1")
+SECONDARY = LLMProvider(name="openai", model="gpt-4o-mini", api_key="k2")
+MESSAGES = [{"role": "user", "content": "hi"}]
+
+
+def _rate_limit_error() -> Exception:
+    return litellm.RateLimitError(message="slow down", llm_provider="deepseek", model="m")
+
+
+def test_overload_classification():
+    """Test overload errors are told apart from request errors."""
+    assert is_overload_error(_rate_limit_error())
+    assert is_overload_error(TimeoutError())
+    assert not is_overload_error(ValueError("bad json"))
+
+
+@pytest.mark.asyncio
+async def test_limiter_aimd():
+    """Test the limit grows additively and halves on overload."""
+    limiter = AdaptiveLimiter("test", initial_limit=10, min_limit=2, max_limit=12)
+
+    for _ in range(30):
+        await limiter.acquire()
+        await limiter.release()
+    assert limiter.limit == 12
+
+    await limiter.acquire()
+    await limiter.release(overloaded=True)
+    assert limiter.limit == 6
+
+    for _ in range(5):
+        await limiter.acquire()
+        await limiter.release(overloaded=True)
+    assert limiter.limit == 2
+
+
+@pytest.mark.asyncio
+async def test_limiter_rejects_after_queue_timeout():
+    """Test callers beyond the limit fail fast once the queue timeout passes."""
+    limiter = AdaptiveLimiter("test", initial_limit=1, min_limit=1, queue_timeout=0.05)
+    await limiter.acquire()
+
+    with pytest.raises(LLMUnavailableError):
+        await limiter.acquire()
+
+    waiter = asyncio.create_task(limiter.acquire())
+    await asyncio.sleep(0)
+    await limiter.release()
+    await asyncio.wait_for(waiter, timeout=1)
+    assert limiter.in_flight == 1
+
+
+def test_breaker_opens_and_probes():
+    """Test the breaker opens on consecutive failures and half-opens for one probe."""
+    breaker = CircuitBreaker("test", failure_threshold=2, reset_timeout=0)
+    breaker._reset_timeout = 60
+
+    breaker.record_failure()
+    assert breaker.state == CircuitBreaker.CLOSED
+    breaker.record_failure()
+    assert breaker.state == CircuitBreaker.OPEN
+    assert not breaker.allow()
+
+    breaker._reset_timeout = 0
+    assert breaker.state == CircuitBreaker.HALF_OPEN
+    assert breaker.allow()
+    assert not breaker.allow()
+
+    breaker.record_failure()
+    assert breaker._state == CircuitBreaker.OPEN
+
+    assert breaker.allow()
+    breaker.record_success()
+    assert breaker.state == CircuitBreaker.CLOSED
+
+
+@pytest.mark.asyncio
+async def test_guard_releases_probe_without_verdict():
+    """Test a cancelled or rejected half-open probe does not wedge the breaker."""
+    guard = ProviderGuard("test")
+    guard.breaker._transition(CircuitBreaker.HALF_OPEN)
+
+    with pytest.raises(asyncio.CancelledError):
+        async with guard.call():
+            raise asyncio.CancelledError
+    assert guard.breaker.available()
+
+    guard.limiter = AdaptiveLimiter("test", initial_limit=1, min_limit=1, queue_timeout=0.01)
+    await guard.limiter.acquire()
+    with pytest.raises(LLMUnavailableError):
+        async with guard.call():
+            pass
+    assert guard.breaker.available()
+
+
+@pytest.mark.asyncio
+async def test_guard_ignores_request_errors():
+    """Test non-overload errors do not trip the breaker."""
+    guard = ProviderGuard("test")
+    guard.breaker._failure_threshold = 1
+
+    with pytest.raises(ValueError):
+        async with guard.call():
+            raise ValueError("bad request")
+    assert guard.breaker.state == CircuitBreaker.CLOSED
+
+    with pytest.raises(litellm.RateLimitError):
+        async with guard.call():
+            raise _rate_limit_error()
+    assert guard.breaker.state == CircuitBreaker.OPEN
+    assert guard.limiter.in_flight == 0
+
+    with pytest.raises(LLMUnavailableError):
+        async with guard.call():
+            pass
+
+
+@pytest.mark.asyncio
+async def test_router_fails_over_when_primary_open(monkeypatch):
+    """Test requests go to the secondary while the primary's circuit is open."""
+    calls = []
+
+    async def fake(**kwargs):
+        calls.append(kwargs["model"])
+        if kwargs["model"] == PRIMARY.model:
+            raise _rate_limit_error()
+        return SimpleNamespace(
+            choices=[SimpleNamespace(message=SimpleNamespace(content=kwargs["model"]))]
+        )
+
+    monkeypatch.setattr(litellm, "acompletion", fake)
+    router = LLMRouter(PRIMARY, SECONDARY, hedge_ratio=0.0)
+    router.guard(PRIMARY).breaker._failure_threshold = 1
+    router.guard(PRIMARY).breaker._reset_timeout = 60
+
+    with pytest.raises(litellm.RateLimitError):
+        await router.complete(MESSAGES, lambda text: text)
+
+    assert await router.complete(MESSAGES, lambda text: text) == SECONDARY.model
+    assert calls == [PRIMARY.model, SECONDARY.model]
+    assert router.stats()["failovers"] == 1
+    assert router.stats()["providers"][PRIMARY.model]["circuit"] == CircuitBreaker.OPEN
+
+
+@pytest.mark.asyncio
+async def test_router_unavailable_without_providers(monkeypatch):
+    """Test an open circuit with no secondary fails fast."""
+    router = LLMRouter(PRIMARY)
+    router.guard(PRIMARY).breaker._reset_timeout = 60
+    router.guard(PRIMARY).breaker._transition(CircuitBreaker.OPEN)
+
+    with pytest.raises(LLMUnavailableError):
+        await router.complete(MESSAGES, lambda text: text)
+
+
+@pytest.mark.asyncio
+async def test_router_tries_fallbacks_before_secondary(monkeypatch):
+    """Test an open primary fails over along the fallback chain in order."""
+    fallback = LLMProvider(name="openai", model="gpt-4o", api_key="k3")
+    calls = []
+
+    async def fake(**kwargs):
+        calls.append(kwargs["model"])
+        return SimpleNamespace(
+            choices=[SimpleNamespace(message=SimpleNamespace(content=kwargs["model"]))]
+        )
+
+    monkeypatch.setattr(litellm, "acompletion", fake)
+    router = LLMRouter(PRIMARY, SECONDARY, hedge_ratio=0.0, fallbacks=[fallback])
+    for provider in (PRIMARY, fallback):
+        router.guard(provider).breaker._reset_timeout = 60
+    router.guard(PRIMARY).breaker._transition(CircuitBreaker.OPEN)
+
+    assert [p.model for p in router.providers] == [PRIMARY.model, fallback.model, SECONDARY.model]
+    assert await router.complete(MESSAGES, lambda text: text) == fallback.model
+
+    router.guard(fallback).breaker._transition(CircuitBreaker.OPEN)
+    assert await router.complete(MESSAGES, lambda text: text) == SECONDARY.model
+    assert calls == [fallback.model, SECONDARY.model]
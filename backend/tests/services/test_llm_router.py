@@ -0,0 +1,113 @@
+"""Test hedged LLM provider routing."""
+
+import asyncio
+from types import SimpleNamespace
+
+import litellm
+import pytest
+
+from app.services.llm_router import HedgeBudget, LatencyTracker, LLMProvider, LLMRouter
+
+PRIMARY = LLMProvider(name="deepseek", model="deepseek/deepseek-chat", api_key="k1")
+SECONDARY = LLMProvider(name="openai", model="gpt-4o-mini", api_key="k2")
+MESSAGES = [{"role": "user", "content": "hi"}]
+
+
+def _fake_acompletion(delays, cancelled):
+    async def fake(**kwargs):
+        model = kwargs["model"]
+        try:
+            await asyncio.sleep(delays[model])
+        except asyncio.CancelledError:
+            cancelled.append(model)
+            raise
+        return SimpleNamespace(
+            choices=[SimpleNamespace(message=SimpleNamespace(content=model))]
+        )
+
+    return fake
+
+
+def test_latency_tracker_quantiles():
+    """Test quantiles are reported once enough samples exist."""
+    tracker = LatencyTracker(window=100, min_samples=10)
+    for i in range(5):
+        tracker.record(i)
+    assert tracker.quantile(0.9) is None
+
+    for i in range(5, 100):
+        tracker.record(i)
+    assert tracker.quantile(0.9) == 90
+
+
+def test_hedge_budget_caps_ratio():
+    """Test the budget allows roughly ratio hedges per request after the burst."""
+    budget = HedgeBudget(ratio=0.1, burst=1.0)
+    hedges = 0
+    for _ in range(100):
+        budget.deposit()
+        hedges += budget.try_spend()
+
+    assert hedges <= 11
+
+
+@pytest.mark.asyncio
+async def test_fast_primary_is_not_hedged(monkeypatch):
+    """Test a primary answering within the hedge delay wins alone."""
+    cancelled = []
+    monkeypatch.setattr(
+        litellm, "acompletion",
+        _fake_acompletion({PRIMARY.model: 0.01, SECONDARY.model: 0.01}, cancelled),
+    )
+    router = LLMRouter(PRIMARY, SECONDARY, hedge_ratio=1.0, initial_delay=0.5)
+
+    assert await router.complete(MESSAGES, str) == PRIMARY.model
+    assert router.stats()["hedged"] == 0
+
+
+@pytest.mark.asyncio
+async def test_slow_primary_is_hedged_and_cancelled(monkeypatch):
+    """Test the secondary wins once the primary exceeds the hedge delay."""
+    cancelled = []
+    monkeypatch.setattr(
+        litellm, "acompletion",
+        _fake_acompletion({PRIMARY.model: 1.0, SECONDARY.model: 0.01}, cancelled),
+    )
+    router = LLMRouter(PRIMARY, SECONDARY, hedge_ratio=1.0, initial_delay=0.05)
+
+    assert await router.complete(MESSAGES, str) == SECONDARY.model
+    assert cancelled == [PRIMARY.model]
+    stats = router.stats()
+    assert (stats["hedged"], stats["hedge_wins"]) == (1, 1)
+
+
+@pytest.mark.asyncio
+async def test_invalid_primary_response_falls_to_secondary(monkeypatch):
+    """Test the first response that parses wins."""
+    cancelled = []
+    monkeypatch.setattr(
+        litellm, "acompletion",
+        _fake_acompletion({PRIMARY.model: 0.1, SECONDARY.model: 0.2}, cancelled),
+    )
+    router = LLMRouter(PRIMARY, SECONDARY, hedge_ratio=1.0, initial_delay=0.01)
+
+    def parse(content):
+        if content == PRIMARY.model:
+            raise ValueError("invalid JSON")
+        return content
+
+    assert await router.complete(MESSAGES, parse) == SECONDARY.model
+
+
+@pytest.mark.asyncio
+async def test_exhausted_budget_waits_for_primary(monkeypatch):
+    """Test no hedge is issued without budget."""
+    cancelled = []
+    monkeypatch.setattr(
+        litellm, "acompletion",
+        _fake_acompletion({PRIMARY.model: 0.1, SECONDARY.model: 0.01}, cancelled),
+    )
+    router = LLMRouter(PRIMARY, SECONDARY, hedge_ratio=0.0, initial_delay=0.01)
+
+    assert await router.complete(MESSAGES, str) == PRIMARY.model
+    assert router.stats()["hedged"] == 0
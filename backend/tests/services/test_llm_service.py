@@ -1,9 +1,25 @@
 """Test LLM service."""
 
+import asyncio
+import json
+from types import SimpleNamespace
+from unittest.mock import AsyncMock
+
+import litellm
 import pytest
 
-from app.services.llm_service import LLMService
-from app.core.exceptions import TarotError
+from app.services.llm_service import (
+    CardInterpretation,
+    InterpretationResult,
+    InterpretationStreamParser,
+    LLMService,
+    PartialOutputError,
+    ValidationResult,
+    parse_interpretation,
+    parse_json_model,
+    repair_json,
+)
+from app.core.exceptions import LLMUnavailableError, TarotError
 
 
 def test_validate_question_suitable():
@@ -70,3 +86,536 @@ def test_interpret_cards():
         assert interp.interpretation is not None
 
     assert len(result.overall_interpretation) > 0
+
+
+def test_interpretation_stream_parser_emits_finished_cards():
+    """Test incremental parser yields each card once its object closes."""
+    parser = InterpretationStreamParser()
+    payload = (
+        '{"interpretations": [{"card_index": 0, "card_name": "The Fool", '
+        '"position": "upright", "interpretation": "A {new} \\"start\\""}, '
+        '{"card_index": 1, "card_name": "The Tower", "position": "reversed", '
+        '"interpretation": "Change"}], "overall_interpretation": "Be brave"}'
+    )
+
+    first_object_end = payload.index("}, ") + 1
+    emitted = parser.feed(payload[:first_object_end])
+    assert [c.card_name for c in emitted] == ["The Fool"]
+
+    for i in range(first_object_end, len(payload), 7):
+        emitted.extend(parser.feed(payload[i : i + 7]))
+
+    assert [c.card_name for c in emitted] == ["The Fool", "The Tower"]
+    assert emitted[0].interpretation == 'A {new} "start"'
+    assert parser.content == payload
+
+
+@pytest.mark.asyncio
+async def test_interpret_cards_stream(monkeypatch):
+    """Test streamed interpretation yields cards then the full result."""
+    payload = (
+        '{"interpretations": [{"card_index": 0, "card_name": "The Fool", '
+        '"position": "upright", "interpretation": "New beginnings"}], '
+        '"overall_interpretation": "Trust yourself"}'
+    )
+
+    async def fake_stream():
+        for i in range(0, len(payload), 10):
+            yield SimpleNamespace(
+                choices=[SimpleNamespace(delta=SimpleNamespace(content=payload[i : i + 10]))]
+            )
+
+    captured = {}
+
+    async def fake_acompletion(**kwargs):
+        captured.update(kwargs)
+        return fake_stream()
+
+    monkeypatch.setattr(litellm, "acompletion", fake_acompletion)
+    service = LLMService(api_key="test-key")
+
+    items = [
+        item
+        async for item in service.interpret_cards_stream(
+            question="What lies ahead?",
+            gender="female",
+            cards=[{"name": "The Fool", "position": "upright"}],
+            language="en",
+        )
+    ]
+
+    assert captured["stream"] is True
+    assert isinstance(items[0], CardInterpretation)
+    assert isinstance(items[-1], InterpretationResult)
+    assert items[-1].overall_interpretation == "Trust yourself"
+
+
+def _completion(content: str) -> SimpleNamespace:
+    return SimpleNamespace(
+        choices=[SimpleNamespace(message=SimpleNamespace(content=content))]
+    )
+
+
+@pytest.mark.asyncio
+async def test_validate_and_interpret_merged(monkeypatch):
+    """Test the merged prompt returns verdict and interpretation in one call."""
+    calls = []
+
+    async def fake_acompletion(**kwargs):
+        calls.append(kwargs)
+        return _completion(
+            '{"suitable": true, "reason": "ok", "interpretations": [{"card_index": 0, '
+            '"card_name": "The Star", "position": "upright", "interpretation": "Hope"}], '
+            '"overall_interpretation": "Keep going"}'
+        )
+
+    monkeypatch.setattr(litellm, "acompletion", fake_acompletion)
+    service = LLMService(api_key="test-key")
+
+    validation, interpretation = await service.validate_and_interpret(
+        question="What does the universe want me to know?",
+        gender="unknown",
+        cards=[{"name": "The Star", "position": "upright"}],
+        language="en",
+    )
+
+    assert len(calls) == 1
+    assert validation.suitable is True
+    assert interpretation.overall_interpretation == "Keep going"
+
+
+@pytest.mark.asyncio
+async def test_validate_and_interpret_merged_rejection(monkeypatch):
+    """Test a merged-mode rejection carries no interpretation."""
+
+    async def fake_acompletion(**kwargs):
+        return _completion(
+            '{"suitable": false, "reason": "medical", "redirect_message": "See a doctor"}'
+        )
+
+    monkeypatch.setattr(litellm, "acompletion", fake_acompletion)
+    service = LLMService(api_key="test-key")
+
+    validation, interpretation = await service.validate_and_interpret(
+        question="What does the universe want me to know?",
+        gender="unknown",
+        cards=[{"name": "The Star", "position": "upright"}],
+    )
+
+    assert validation.suitable is False
+    assert validation.redirect_message == "See a doctor"
+    assert interpretation is None
+
+
+def test_templates_and_system_prompts_are_precompiled():
+    """Test prompt templates compile and system prompts render at init."""
+    service = LLMService(api_key="test-key")
+
+    assert set(service._templates) >= {"system.j2", "validation.j2", "interpretation.j2"}
+    assert "zh" in service._system_prompt("validation.j2", "zh")
+    assert service._system_prompt("validation.j2", "en") is service._system_prompt(
+        "validation.j2", "en"
+    )
+
+
+@pytest.mark.asyncio
+async def test_app_scoped_service_lifecycle(mock_redis, monkeypatch):
+    """Test init/close manage a shared service and litellm HTTP client."""
+    from app.services import llm_service as module
+
+    monkeypatch.setattr(module, "get_redis", lambda: mock_redis)
+    monkeypatch.setattr(module.settings, "deepseek_api_key", "test-key")
+    monkeypatch.setattr(module.settings, "llm_warmup_enabled", False)
+
+    await module.init_llm_service()
+    try:
+        service = module.get_llm_service()
+        assert service is module.get_llm_service()
+        assert litellm.aclient_session is module.llm_http_client
+    finally:
+        await module.close_llm_service()
+
+    assert litellm.aclient_session is None
+    with pytest.raises(TarotError):
+        module.get_llm_service()
+
+
+@pytest.mark.asyncio
+async def test_warm_up_opens_provider_connection():
+    """Test warm-up issues a request to the provider base URL."""
+    import httpx
+
+    requested = []
+
+    def handler(request):
+        requested.append(str(request.url))
+        return httpx.Response(401)
+
+    async with httpx.AsyncClient(transport=httpx.MockTransport(handler)) as client:
+        service = LLMService(api_key="test-key", http_client=client)
+        await service.warm_up()
+
+    assert requested == ["https://api.deepseek.com"]
+
+
+@pytest.mark.asyncio
+async def test_tasks_route_to_their_configured_models(monkeypatch):
+    """Test validation and interpretation use their own models and limits."""
+    from app.services import llm_service as module
+
+    calls = []
+
+    async def fake_acompletion(**kwargs):
+        calls.append(kwargs)
+        if kwargs["model"] == "gpt-4o-mini":
+            return _completion('{"suitable": true, "reason": "ok"}')
+        return _completion(json.dumps({
+            "interpretations": [{
+                "card_index": 0, "card_name": "The Fool",
+                "position": "upright", "interpretation": "A new start.",
+            }],
+            "overall_interpretation": "Go.",
+        }))
+
+    monkeypatch.setattr(litellm, "acompletion", fake_acompletion)
+    monkeypatch.setattr(module.settings, "openai_api_key", "test-key")
+    monkeypatch.setattr(module.settings, "llm_task_models", {"validation": "gpt-4o-mini"})
+    monkeypatch.setattr(module.settings, "llm_task_max_tokens", {"validation": 50})
+    service = LLMService(api_key="test-key", model="deepseek/deepseek-chat")
+
+    await service.validate_question("What does the universe want me to know?", "unknown", "en")
+    await service.interpret_cards(
+        "What does the universe want me to know?",
+        "unknown",
+        [{"id": "m00", "name": "The Fool", "position": "upright"}],
+        "en",
+    )
+
+    assert [call["model"] for call in calls] == ["gpt-4o-mini", "deepseek/deepseek-chat"]
+    assert calls[0]["max_tokens"] == 50
+    assert "max_tokens" not in calls[1]
+    assert service.routers["validation"].primary.model == "gpt-4o-mini"
+    assert service.router.primary.model == "deepseek/deepseek-chat"
+
+
+def _fake_split_completion(calls, delay=0.05):
+    """Fake provider answering per-part card prompts and the synthesis prompt."""
+    import re
+
+    async def fake_acompletion(**kwargs):
+        prompt = kwargs["messages"][-1]["content"]
+        calls.append(prompt)
+        await asyncio.sleep(delay)
+        match = re.search(r"Interpret only the cards with index ([\d, ]+)\.", prompt)
+        if match is None:
+            return _completion('{"overall_interpretation": "Together they point forward."}')
+        return _completion(json.dumps({"interpretations": [
+            {
+                "card_index": int(index),
+                "card_name": f"Card {index}",
+                "position": "upright",
+                "interpretation": f"Reading {index}.",
+            }
+            for index in match.group(1).split(", ")
+        ]}))
+
+    return fake_acompletion
+
+
+@pytest.mark.asyncio
+async def test_large_spread_is_interpreted_in_parallel_parts(monkeypatch):
+    """Test a Celtic Cross runs concurrent part calls, then one synthesis call."""
+    from app.services.spreads import get_spread
+
+    calls = []
+    monkeypatch.setattr(litellm, "acompletion", _fake_split_completion(calls))
+    service = LLMService(api_key="test-key", singleflight=None)
+    cards = get_spread("celtic_cross").assign(
+        [{"id": f"m{i:02d}", "name": f"Card {i}", "position": "upright"} for i in range(10)]
+    )
+
+    started = asyncio.get_running_loop().time()
+    result = await service.interpret_cards("Where is my career going?", "unknown", cards, "en")
+    elapsed = asyncio.get_running_loop().time() - started
+
+    # 4 parts of up to 3 cards run concurrently, then the synthesis
+    assert len(calls) == 5
+    assert elapsed < 0.05 * 4
+    assert 'position "Challenge": What crosses or obstructs it' in calls[0]
+    assert "Reading 9." in calls[-1]
+    assert [card.card_index for card in result.interpretations] == list(range(10))
+    assert result.interpretations[1].spread_position == "challenge"
+    assert result.overall_interpretation == "Together they point forward."
+
+
+@pytest.mark.asyncio
+async def test_large_spread_streams_cards_as_parts_finish(monkeypatch):
+    """Test streamed parts yield every card before the merged result."""
+    from app.services.spreads import get_spread
+
+    monkeypatch.setattr(litellm, "acompletion", _fake_split_completion([], delay=0.01))
+    service = LLMService(api_key="test-key")
+    cards = get_spread("five_card").assign(
+        [{"id": f"m{i:02d}", "name": f"Card {i}", "position": "upright"} for i in range(5)]
+    )
+
+    items = [
+        item async for item in service.interpret_cards_stream("Q?", "unknown", cards, "en")
+    ]
+
+    assert sorted(item.card_index for item in items[:-1]) == list(range(5))
+    assert isinstance(items[-1], InterpretationResult)
+    assert items[-1].interpretations[0].spread_position == "present"
+
+
+@pytest.mark.asyncio
+async def test_parallel_mode_interprets_each_card_separately(monkeypatch):
+    """Test parallel mode makes one call per card, then a synthesis call."""
+    from app.services.spreads import get_spread
+
+    calls = []
+    monkeypatch.setattr(litellm, "acompletion", _fake_split_completion(calls))
+    service = LLMService(api_key="test-key", singleflight=None)
+    cards = get_spread("three_card").assign(
+        [{"id": f"m{i:02d}", "name": f"Card {i}", "position": "upright"} for i in range(3)]
+    )
+
+    result = await service.interpret_cards("Q?", "unknown", cards, "en", mode="parallel")
+
+    assert len(calls) == 4
+    assert sorted(
+        prompt.rsplit("index ", 1)[1] for prompt in calls[:3]
+    ) == ["0.", "1.", "2."]
+    assert "Reading 2." in calls[-1]
+    assert [card.card_index for card in result.interpretations] == [0, 1, 2]
+    assert result.overall_interpretation == "Together they point forward."
+
+    with pytest.raises(TarotError):
+        await service.interpret_cards("Q?", "unknown", cards, "en", mode="bogus")
+
+
+@pytest.mark.asyncio
+async def test_card_parts_are_shared_across_processes(monkeypatch, mock_redis):
+    """Test per-card completions coalesce through Redis and decode as lists."""
+    from app.services.singleflight import RedisSingleFlight
+    from app.services.spreads import get_spread
+
+    calls = []
+    monkeypatch.setattr(litellm, "acompletion", _fake_split_completion(calls))
+    services = [
+        LLMService(
+            api_key="test-key",
+            singleflight=RedisSingleFlight(mock_redis, lock_seconds=5, poll_interval=0.01),
+        )
+        for _ in range(2)
+    ]
+    cards = get_spread("three_card").assign(
+        [{"id": f"m{i:02d}", "name": f"Card {i}", "position": "upright"} for i in range(3)]
+    )
+
+    results = await asyncio.gather(*(
+        service.interpret_cards("Q?", "unknown", cards, "en", mode="parallel")
+        for service in services
+    ))
+
+    # 3 card calls and 1 synthesis, published once for both services
+    assert len(calls) == 4
+    assert results[0] == results[1]
+    assert [card.card_index for card in results[1].interpretations] == [0, 1, 2]
+    assert results[1].interpretations[0].spread_position == "past"
+
+
+def test_prompt_resolves_card_names_by_id():
+    """Test cards named only by id render with their localized names."""
+    service = LLMService(api_key="test-key")
+
+    messages = service._prompt_messages(
+        "interpretation.j2",
+        "zh",
+        question="Q?",
+        gender="unknown",
+        cards=[{"id": "0", "position": "upright"}, {"id": "w2", "position": "reversed"}],
+    )
+
+    assert "Index 0: 愚者 (upright)" in messages[-1]["content"]
+    assert "Index 1: 权杖二 (reversed)" in messages[-1]["content"]
+
+
+@pytest.mark.asyncio
+async def test_identical_concurrent_validations_are_coalesced(monkeypatch):
+    """Test concurrent identical prompts share a single completion."""
+    calls = []
+
+    async def fake_acompletion(**kwargs):
+        calls.append(kwargs)
+        await asyncio.sleep(0.05)
+        return _completion('{"suitable": true, "reason": "ok"}')
+
+    monkeypatch.setattr(litellm, "acompletion", fake_acompletion)
+    service = LLMService(api_key="test-key")
+
+    results = await asyncio.gather(*(
+        service.validate_question("What does the universe want me to know?", "unknown", "en")
+        for _ in range(3)
+    ))
+
+    assert len(calls) == 1
+    assert all(result.suitable for result in results)
+    assert service.singleflight.stats()["coalesced"] == 2
+
+
+@pytest.mark.asyncio
+async def test_singleflight_key_names_the_task(monkeypatch):
+    """Test flights are keyed by template name, not the shared parser qualname."""
+    from app.services.singleflight import prompt_key
+
+    monkeypatch.setattr(
+        litellm, "acompletion",
+        AsyncMock(return_value=_completion('{"suitable": true, "reason": "ok"}')),
+    )
+    service = LLMService(api_key="test-key")
+    keys = []
+    do = service.singleflight.do
+
+    async def spy(key, fn):
+        keys.append(key)
+        return await do(key, fn)
+
+    monkeypatch.setattr(service.singleflight, "do", spy)
+    await service.validate_question("Will I move?", "unknown", "en")
+
+    messages = service._prompt_messages(
+        "validation.j2", "en", question="Will I move?", gender="unknown"
+    )
+    assert keys == [prompt_key(messages, "validation")]
+
+
+def test_prompts_put_static_instructions_first():
+    """Test per-user data is kept out of the cacheable system prefix."""
+    service = LLMService(api_key="test-key")
+
+    first = service._prompt_messages("validation.j2", "en", question="Will I move?", gender="f")
+    second = service._prompt_messages("validation.j2", "en", question="Job?", gender="m")
+
+    assert first[0] == second[0]
+    assert "Will I move?" not in first[0]["content"]
+    assert first[-1]["role"] == "user"
+    assert "Will I move?" in first[-1]["content"]
+
+
+@pytest.mark.asyncio
+async def test_completion_usage_is_recorded(monkeypatch, mock_redis):
+    """Test cached prompt tokens are recorded per template and language."""
+    from app.services.prompt_cache_stats import PromptCacheStats
+
+    async def fake_acompletion(**kwargs):
+        response = _completion('{"suitable": true, "reason": "ok"}')
+        response.usage = SimpleNamespace(
+            prompt_tokens=300, prompt_tokens_details=SimpleNamespace(cached_tokens=256)
+        )
+        return response
+
+    monkeypatch.setattr(litellm, "acompletion", fake_acompletion)
+    stats = PromptCacheStats(mock_redis)
+    service = LLMService(api_key="test-key", prompt_cache_stats=stats)
+
+    await service.validate_question("What does the universe want me to know?", "unknown", "ja")
+
+    [entry] = await stats.report()
+    assert (entry.template, entry.language) == ("validation", "ja")
+    assert entry.cached_tokens == 256
+
+
+@pytest.mark.asyncio
+async def test_interpret_cards_falls_back_to_card_library(monkeypatch):
+    """Test unavailable providers get library meanings unless fallback is off."""
+    service = LLMService(api_key="test-key")
+    cards = [{"id": "17", "position": "upright"}]
+
+    def unavailable():
+        raise LLMUnavailableError(message="All LLM providers are unavailable")
+
+    async def complete(*args, **kwargs):
+        unavailable()
+
+    monkeypatch.setattr(service.router, "complete", complete)
+    monkeypatch.setattr(service.router, "select_provider", unavailable)
+
+    result = await service.interpret_cards("Will it work out?", "unknown", cards, "en")
+    streamed = [
+        item async for item in service.interpret_cards_stream("Q?", "unknown", cards, "zh")
+    ]
+
+    assert result.degraded is True
+    assert result.interpretations[0].card_name == "The Star"
+    assert [type(item) for item in streamed] == [CardInterpretation, InterpretationResult]
+    assert streamed[-1].degraded is True
+    assert streamed[0].card_name == "星星"
+    with pytest.raises(LLMUnavailableError):
+        await service.interpret_cards("Q?", "unknown", cards, "en", fallback=False)
+
+
+CARD_JSON = (
+    '{{"card_index": {0}, "card_name": "Card {0}", "position": "upright", '
+    '"interpretation": "Meaning {0}"}}'
+)
+
+
+def test_repair_json_fixes_common_defects():
+    """Test fences, surrounding prose, trailing commas and raw newlines are repaired."""
+    raw = (
+        'Here is the reading:\n```json\n{"suitable": true, "reason": "Line one\nline two",'
+        ' "tags": ["a", "b",],}\n```\nHope this helps!'
+    )
+
+    repaired = repair_json(raw)
+    result = parse_json_model(ValidationResult, raw)
+
+    assert json.loads(repaired)["tags"] == ["a", "b"]
+    assert result.suitable is True
+    assert result.reason == "Line one\nline two"
+
+
+def test_parse_interpretation_salvages_truncated_output():
+    """Test complete cards survive output cut off at the token limit."""
+    truncated = (
+        '```json\n{"interpretations": [' + CARD_JSON.format(0) + ", "
+        + CARD_JSON.format(1) + ', {"card_index": 2, "card_name": "Card 2", "interpr'
+    )
+
+    with pytest.raises(PartialOutputError) as excinfo:
+        parse_interpretation(truncated, expected=range(3))
+
+    assert [c.card_index for c in excinfo.value.interpretations] == [0, 1]
+    assert excinfo.value.missing == [2]
+    assert excinfo.value.overall_interpretation is None
+    with pytest.raises(ValueError):
+        parse_interpretation('{"interpretations": [{"card_in', expected=range(3))
+
+
+@pytest.mark.asyncio
+async def test_truncated_interpretation_reasks_only_missing_parts(monkeypatch):
+    """Test a cut-off reading is completed by a re-ask for the missing cards."""
+    prompts = []
+    replies = [
+        '{"interpretations": [' + CARD_JSON.format(0) + ", " + CARD_JSON.format(1) + ", {",
+        '{"interpretations": [' + CARD_JSON.format(2) + '], "overall_interpretation": "All"}',
+    ]
+
+    async def fake_acompletion(**kwargs):
+        prompts.append(kwargs["messages"][-1]["content"])
+        return _completion(replies[len(prompts) - 1])
+
+    monkeypatch.setattr(litellm, "acompletion", fake_acompletion)
+    service = LLMService(api_key="test-key")
+    cards = [{"name": f"Card {i}", "position": "upright"} for i in range(3)]
+
+    result = await service.interpret_cards("What lies ahead?", "unknown", cards, "en")
+
+    assert len(prompts) == 2
+    assert "already interpreted" in prompts[1]
+    assert "Meaning 1" in prompts[1]
+    assert [c.interpretation for c in result.interpretations] == [
+        "Meaning 0", "Meaning 1", "Meaning 2"
+    ]
+    assert result.overall_interpretation == "All"
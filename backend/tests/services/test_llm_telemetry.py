@@ -0,0 +1,158 @@
+"""Test per-call LLM telemetry."""
+
+from types import SimpleNamespace
+
+import litellm
+import pytest
+from prometheus_client import REGISTRY
+
+from app.services import llm_telemetry
+
+
+def _sample(name: str, **labels: str) -> float:
+    return REGISTRY.get_sample_value(name, labels) or 0.0
+
+
+def _chunk(content: str | None, usage=None) -> SimpleNamespace:
+    choices = [SimpleNamespace(delta=SimpleNamespace(content=content))] if content else []
+    return SimpleNamespace(choices=choices, usage=usage)
+
+
+@pytest.mark.asyncio
+async def test_completion_records_tokens_and_latency(monkeypatch):
+    """Test a non-streaming call records latency and token counters."""
+    usage = SimpleNamespace(
+        prompt_tokens=120,
+        completion_tokens=30,
+        prompt_tokens_details=SimpleNamespace(cached_tokens=64),
+    )
+
+    async def fake_acompletion(**kwargs):
+        return SimpleNamespace(choices=[], usage=usage)
+
+    monkeypatch.setattr(litellm, "acompletion", fake_acompletion)
+    labels = {"model": "test/telemetry-a", "task": "validation"}
+    before = _sample("tarot_llm_tokens_total", **labels, kind="prompt")
+
+    await llm_telemetry.acompletion("validation", model="test/telemetry-a", messages=[])
+
+    assert _sample("tarot_llm_tokens_total", **labels, kind="prompt") - before == 120
+    assert _sample("tarot_llm_tokens_total", **labels, kind="completion") == 30
+    assert _sample("tarot_llm_tokens_total", **labels, kind="cached") == 64
+    assert _sample("tarot_llm_request_latency_seconds_count", **labels, status="ok") == 1
+
+
+@pytest.mark.asyncio
+async def test_failed_completion_is_tagged_as_error(monkeypatch):
+    """Test provider errors are counted with an error status."""
+
+    async def fake_acompletion(**kwargs):
+        raise RuntimeError("boom")
+
+    monkeypatch.setattr(litellm, "acompletion", fake_acompletion)
+
+    with pytest.raises(RuntimeError):
+        await llm_telemetry.acompletion("interpretation", model="test/telemetry-b", messages=[])
+
+    assert _sample(
+        "tarot_llm_requests_total",
+        model="test/telemetry-b",
+        task="interpretation",
+        status="error",
+    ) == 1
+
+
+@pytest.mark.asyncio
+async def test_stream_records_time_to_first_token(monkeypatch):
+    """Test streams record TTFT and the usage from the final chunk."""
+
+    async def stream():
+        yield _chunk("{")
+        yield _chunk("}")
+        yield _chunk(None, usage=SimpleNamespace(prompt_tokens=50, completion_tokens=2))
+
+    async def fake_acompletion(**kwargs):
+        return stream()
+
+    monkeypatch.setattr(litellm, "acompletion", fake_acompletion)
+    labels = {"model": "test/telemetry-c", "task": "interpretation"}
+
+    response = await llm_telemetry.acompletion(
+        "interpretation", model="test/telemetry-c", messages=[], stream=True
+    )
+    chunks = [chunk async for chunk in response]
+
+    assert len(chunks) == 3
+    assert _sample("tarot_llm_time_to_first_token_seconds_count", **labels) == 1
+    assert _sample("tarot_llm_tokens_total", **labels, kind="completion") == 2
+
+
+@pytest.mark.asyncio
+async def test_completion_is_streamed_internally_for_ttft(monkeypatch):
+    """Test non-streaming calls are streamed, timed to first token and reassembled."""
+    from litellm.types.utils import Delta, ModelResponseStream, StreamingChoices, Usage
+
+    def chunk(content):
+        return ModelResponseStream(
+            id="c", model="gpt-4o-mini",
+            choices=[StreamingChoices(index=0, delta=Delta(content=content))],
+        )
+
+    async def stream():
+        yield chunk('{"suitable"')
+        yield chunk(": true}")
+        last = chunk(None)
+        last.usage = Usage(prompt_tokens=40, completion_tokens=4, total_tokens=44)
+        yield last
+
+    requests = []
+
+    async def fake_acompletion(**kwargs):
+        requests.append(kwargs)
+        return stream()
+
+    monkeypatch.setattr(litellm, "acompletion", fake_acompletion)
+    labels = {"model": "test/telemetry-d", "task": "validation"}
+
+    response = await llm_telemetry.acompletion(
+        "validation", model="test/telemetry-d", messages=[{"role": "user", "content": "hi"}]
+    )
+
+    assert requests[0]["stream"] is True
+    assert response.choices[0].message.content == '{"suitable": true}'
+    assert _sample("tarot_llm_time_to_first_token_seconds_count", **labels) == 1
+    assert _sample("tarot_llm_tokens_total", **labels, kind="prompt") == 40
+
+
+@pytest.mark.asyncio
+async def test_report_compares_models_per_task(monkeypatch):
+    """Test the report aggregates requests, latency and tokens per model and task."""
+    usage = SimpleNamespace(prompt_tokens=100, completion_tokens=20)
+
+    async def fake_acompletion(**kwargs):
+        if kwargs["model"] == "test/report-b":
+            raise RuntimeError("boom")
+        return SimpleNamespace(choices=[], usage=usage)
+
+    monkeypatch.setattr(litellm, "acompletion", fake_acompletion)
+    for _ in range(3):
+        await llm_telemetry.acompletion("validation", model="test/report-a", messages=[])
+    with pytest.raises(RuntimeError):
+        await llm_telemetry.acompletion("validation", model="test/report-b", messages=[])
+
+    entries = {entry.model: entry for entry in llm_telemetry.report()}
+    fast = entries["test/report-a"]
+    assert (fast.task, fast.requests, fast.errors) == ("validation", 3, 0)
+    assert fast.prompt_tokens == 300
+    assert fast.p90_latency_seconds is not None
+    assert fast.p90_latency_seconds <= 0.25
+    failing = entries["test/report-b"]
+    assert failing.error_rate == 1.0
+    assert failing.mean_latency_seconds is None
+
+
+def test_bucket_quantile_interpolates():
+    """Test quantiles are interpolated within the matching bucket."""
+    buckets = [(1.0, 0), (2.0, 10), (float("inf"), 10)]
+    assert llm_telemetry._bucket_quantile(buckets, 0.5) == 1.5
+    assert llm_telemetry._bucket_quantile([(1.0, 0), (float("inf"), 0)], 0.5) is None
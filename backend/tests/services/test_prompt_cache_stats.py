@@ -0,0 +1,41 @@
+"""Test provider prompt prefix-cache accounting."""
+
+from types import SimpleNamespace
+
+import pytest
+
+from app.services.prompt_cache_stats import PromptCacheStats, cached_prompt_tokens
+
+
+def test_cached_prompt_tokens_formats():
+    """Test cached tokens are read from OpenAI and DeepSeek usage shapes."""
+    openai_usage = SimpleNamespace(
+        prompt_tokens=100, prompt_tokens_details=SimpleNamespace(cached_tokens=64)
+    )
+    deepseek_usage = {"prompt_tokens": 100, "prompt_cache_hit_tokens": 32}
+
+    assert cached_prompt_tokens(openai_usage) == 64
+    assert cached_prompt_tokens(deepseek_usage) == 32
+    assert cached_prompt_tokens(SimpleNamespace(prompt_tokens=10)) == 0
+    assert cached_prompt_tokens(None) == 0
+
+
+@pytest.mark.asyncio
+async def test_report_groups_by_template_and_language(mock_redis):
+    """Test the report aggregates token counters per template and language."""
+    stats = PromptCacheStats(mock_redis)
+    await stats.record("validation", "en", {"prompt_tokens": 200})
+    await stats.record("validation", "en", {"prompt_tokens": 200, "prompt_cache_hit_tokens": 128})
+    await stats.record("interpretation", "zh", {"prompt_tokens": 400})
+
+    report = await stats.report()
+
+    assert [(e.template, e.language) for e in report] == [
+        ("interpretation", "zh"),
+        ("validation", "en"),
+    ]
+    validation = report[1]
+    assert validation.requests == 2
+    assert validation.prompt_tokens == 400
+    assert validation.hit_ratio == pytest.approx(0.32)
+    assert report[0].hit_ratio == 0.0
@@ -0,0 +1,104 @@
+"""Test keyword prefilter for question validation."""
+
+import pytest
+
+from app.services.llm_service import LLMService
+from app.services.question_filter import KeywordMatcher, get_question_prefilter
+
+
+def test_matcher_finds_overlapping_keywords():
+    """Test the automaton reports every keyword, including overlaps."""
+    matcher = KeywordMatcher([("想自杀", 1), ("自杀", 2), ("杀", 3), ("自残", 4)])
+
+    found = {(m.keyword, m.payload) for m in matcher.search("我想自杀")}
+
+    assert found == {("想自杀", 1), ("自杀", 2), ("杀", 3)}
+
+
+def test_matcher_respects_word_boundaries():
+    """Test Latin keywords only match whole words."""
+    matcher = KeywordMatcher([("pain", "pain"), ("math", "factual")])
+
+    assert list(matcher.search("Moving to Spain, aftermath")) == []
+    assert [m.keyword for m in matcher.search("Back PAIN again")] == ["pain"]
+
+
+@pytest.mark.parametrize(
+    ("question", "language", "suitable"),
+    [
+        ("I want to kill myself", "en", False),
+        ("我想自杀", "zh", False),
+        ("死にたい", "ja", False),
+        ("Solve for x in this equation", "en", False),
+        ("这道数学题怎么做", "zh", False),
+        ("Will my relationship last?", "en", True),
+        ("我和男朋友的感情会好吗", "zh", True),
+        ("転職するべきですか", "ja", True),
+    ],
+)
+def test_prefilter_settles_clear_cut_questions(question, language, suitable):
+    """Test clear-cut questions get a local verdict."""
+    verdict = get_question_prefilter().check(question, language)
+
+    assert verdict is not None
+    assert verdict.suitable is suitable
+
+
+@pytest.mark.parametrize(
+    "question",
+    [
+        "What does the universe want me to know?",
+        "Will I pass the math exam and get my dream job?",
+    ],
+)
+def test_prefilter_defers_ambiguous_questions(question):
+    """Test questions without clear evidence are left to the LLM."""
+    assert get_question_prefilter().check(question, "en") is None
+
+
+@pytest.mark.parametrize(
+    ("question", "language", "expected"),
+    [
+        ("Should I just end it all?", "en", False),
+        ("should i take more sleeping pills tonight", "en", None),
+        ("Should I stop taking my antidepressants?", "en", None),
+        ("我的未来会死吗", "zh", None),
+        ("hurt by my ex, will we get back together?", "en", None),
+    ],
+)
+def test_prefilter_never_approves_sensitive_questions(question, language, expected):
+    """Test health and self-harm wording blocks local approval.
+
+    Such questions are rejected outright or left to the LLM safety check,
+    and emotional wording like "hurt" is not rejected locally either.
+    """
+    verdict = get_question_prefilter().check(question, language)
+
+    if expected is None:
+        assert verdict is None
+    else:
+        assert verdict is not None
+        assert verdict.suitable is expected
+
+
+def test_prefilter_answers_in_requested_language():
+    """Test messages use the requested language when its keywords matched."""
+    verdict = get_question_prefilter().check("我头痛", "zh")
+
+    assert verdict.redirect_message == "请咨询医生或心理健康专业人士。"
+
+
+@pytest.mark.asyncio
+async def test_validate_question_skips_llm_for_clear_cut(monkeypatch):
+    """Test the async validation path returns prefilter verdicts without the LLM."""
+    import litellm
+
+    async def fail_acompletion(**kwargs):
+        raise AssertionError("LLM should not be called for clear-cut questions")
+
+    monkeypatch.setattr(litellm, "acompletion", fail_acompletion)
+    service = LLMService(api_key="test-key")
+
+    result = await service.validate_question("I have a painful injury", "male", "en")
+
+    assert result.suitable is False
@@ -0,0 +1,167 @@
+"""Test near-duplicate question index."""
+
+from types import SimpleNamespace
+
+import pytest
+
+from app.services.llm_service import LLMService, ValidationResult
+from app.services.question_index import QuestionIndex, hamming_distance, simhash
+
+VERDICT = ValidationResult(suitable=True, reason="Suitable", redirect_message=None)
+
+
+def test_simhash_is_stable_and_similarity_preserving():
+    """Test identical features hash identically and small edits stay close."""
+    base = simhash(["career", "change", "offer", "accept", "salary"])
+
+    assert base == simhash(["career", "change", "offer", "accept", "salary"])
+    assert hamming_distance(base, simhash(["career", "change", "offer", "accept"])) < 16
+
+
+@pytest.mark.parametrize(
+    ("original", "variant"),
+    [
+        ("will I get the job", "will I get this job?"),
+        ("Does he love me", "does he really love me?"),
+        ("我能得到这份工作吗", "我能得到这个工作吗\uff1f"),
+    ],
+)
+def test_fingerprints_of_rewordings_are_close(original, variant):
+    """Test small wording changes stay within the default distance."""
+    index = QuestionIndex(redis_client=None, max_distance=3)
+
+    distance = hamming_distance(index.fingerprint(original), index.fingerprint(variant))
+
+    assert distance <= 3
+
+
+# Rewordings users actually send for the same question
+PARAPHRASES = [
+    ("will I get the job", "will I get this job?"),
+    ("Does he love me", "does he really love me?"),
+    ("What does the universe want me to know", "what does the universe want me to know?"),
+    ("Will I find love this year?", "will i find love this year"),
+    ("Will I get the promotion I applied for?",
+     "Will I get the promotion I applied for this year?"),
+    ("Is my boyfriend cheating on me?", "Is my boyfriend cheating on me right now?"),
+    ("Will my relationship with my girlfriend last?",
+     "Will my relationship with my girlfriend last long?"),
+    ("How will my career develop next year?", "How will my career develop over the next year?"),
+    ("Will my ex come back to me?", "Will my ex come back to me soon?"),
+    ("Should I accept the job offer from the startup?",
+     "Should I accept the job offer from that startup?"),
+    ("Should I move to another city for work?", "Should I move to another city for my work?"),
+    ("What should I focus on this month?", "What should I focus on this month?!"),
+    ("Will my business succeed next year?", "Will my new business succeed next year?"),
+    ("Is now a good time to change careers?", "Is now the right time to change careers?"),
+    ("Will I pass my driving test?", "Will I pass my driving test this time?"),
+    ("Does my crush like me back?", "Does my crush like me back at all?"),
+    ("How can I improve my relationship with my mother?",
+     "How can I improve my relationship with my mom?"),
+    ("我能得到这份工作吗", "我能得到这个工作吗\uff1f"),
+    ("我和男朋友的感情会好吗", "我和男朋友的感情会变好吗"),
+    ("我今年能升职吗", "我今年可以升职吗"),
+    ("他还爱我吗", "他现在还爱我吗"),
+    ("我应该换工作吗", "我是不是应该换工作"),
+    ("今年の仕事運はどうですか", "今年の仕事運はどうでしょうか"),
+    ("彼は私のことが好きですか", "彼は私のことが本当に好きですか"),
+    ("転職するべきですか", "今、転職するべきですか"),
+]
+
+# Close wording, different question
+DIFFERENT = [
+    ("Will he leave me?", "Will I leave him?"),
+    ("Is my boyfriend cheating on me?", "Am I cheating on my boyfriend?"),
+    ("Will I find love this year?", "Will I find a job this year?"),
+    ("Should I quit my job?", "Should I keep my job?"),
+    ("Will my business succeed next year?", "Will my marriage succeed next year?"),
+    ("Does my crush like me back?", "Do I like my crush back?"),
+    ("How will my career develop next year?", "How will my health develop next year?"),
+    ("What should I focus on this month?", "What should I avoid this month?"),
+    ("我和男朋友的感情会好吗", "我和女朋友的感情会好吗"),
+    ("他还爱我吗", "我还爱他吗"),
+]
+
+
+@pytest.mark.asyncio
+async def test_paraphrase_hit_rate(mock_redis):
+    """Test default settings reuse verdicts for paraphrases but not for different questions."""
+    index = QuestionIndex(mock_redis, ttl_seconds=60)
+
+    async def reused(pairs, partition):
+        hits = 0
+        for i, (original, variant) in enumerate(pairs):
+            # One partition per pair so pairs cannot match each other
+            await index.add(original, f"{partition}{i}", VERDICT)
+            hits += await index.lookup(variant, f"{partition}{i}") is not None
+        return hits
+
+    assert await reused(PARAPHRASES, "p") / len(PARAPHRASES) >= 0.4
+    assert await reused(DIFFERENT, "d") == 0
+
+
+def test_short_questions_are_not_fingerprinted():
+    """Test questions below the minimum feature count are kept out of the index."""
+    index = QuestionIndex(redis_client=None, min_features=5)
+
+    assert index.fingerprint("Love?") is None
+    assert index.fingerprint("Will he leave me?") is not None
+
+
+@pytest.mark.asyncio
+async def test_lookup_reuses_near_duplicate_verdict(mock_redis):
+    """Test a near duplicate in the same language reuses the stored verdict."""
+    index = QuestionIndex(mock_redis, max_distance=3, ttl_seconds=60)
+    await index.add("will I get the job", "en", VERDICT)
+
+    assert await index.lookup("will I get this job?", "en") == VERDICT
+    assert await index.lookup("will I get this job?", "zh") is None
+    assert await index.lookup("should I move to another city", "en") is None
+
+    stats = await index.stats()
+    assert (stats.hits, stats.misses) == (1, 2)
+    assert stats.by_language["en"] == {"hits": 1, "misses": 1}
+
+
+@pytest.mark.asyncio
+async def test_validate_question_reuses_indexed_verdict(mock_redis, monkeypatch):
+    """Test validate_question skips the LLM for an indexed near duplicate."""
+    import litellm
+
+    async def fail_acompletion(**kwargs):
+        raise AssertionError("LLM should not be called for indexed questions")
+
+    monkeypatch.setattr(litellm, "acompletion", fail_acompletion)
+    index = QuestionIndex(mock_redis, max_distance=3, ttl_seconds=60)
+    await index.add("What does the universe want me to know", "en", VERDICT)
+    service = LLMService(api_key="test-key", question_index=index)
+
+    result = await service.validate_question(
+        "what does the universe want me to know?", "female", "en"
+    )
+
+    assert result == VERDICT
+
+
+@pytest.mark.asyncio
+async def test_sensitive_questions_bypass_index(mock_redis, monkeypatch):
+    """Test health questions always reach the LLM, even if indexed."""
+    import litellm
+
+    calls = []
+
+    async def fake_acompletion(**kwargs):
+        calls.append(kwargs)
+        return SimpleNamespace(choices=[SimpleNamespace(message=SimpleNamespace(
+            content='{"suitable": false, "reason": "Medical", "redirect_message": "See a doctor"}'
+        ))])
+
+    monkeypatch.setattr(litellm, "acompletion", fake_acompletion)
+    index = QuestionIndex(mock_redis, ttl_seconds=60)
+    await index.add("Will my cancer treatment work?", "en", VERDICT)
+    service = LLMService(api_key="test-key", question_index=index)
+
+    result = await service.validate_question("Will my cancer treatment work?", "female", "en")
+
+    assert len(calls) == 1
+    assert result.suitable is False
@@ -0,0 +1,93 @@
+"""Test one-shot reading service."""
+
+import asyncio
+
+import pytest
+
+from app.services.llm_service import (
+    CardInterpretation,
+    InterpretationResult,
+    ValidationResult,
+)
+from app.services.reading_service import ReadingService
+
+CARDS = [{"id": "0", "name_key": "card_0", "position": "upright"}]
+
+
+class SlowLLMService:
+    """LLM stub whose calls each take a fixed delay."""
+
+    def __init__(self, suitable: bool, validate_delay: float, interpret_delay: float) -> None:
+        self.suitable = suitable
+        self.validate_delay = validate_delay
+        self.interpret_delay = interpret_delay
+        self.interpretation_cancelled = False
+
+    async def validate_question(self, _question, _gender, _language):
+        await asyncio.sleep(self.validate_delay)
+        return ValidationResult(suitable=self.suitable, reason="reason")
+
+    async def interpret_cards(self, _question, _gender, _cards, _language):
+        try:
+            await asyncio.sleep(self.interpret_delay)
+        except asyncio.CancelledError:
+            self.interpretation_cancelled = True
+            raise
+        return InterpretationResult(
+            interpretations=[
+                CardInterpretation(
+                    card_index=0, card_name="The Fool", position="upright", interpretation="New"
+                )
+            ],
+            overall_interpretation="Overall",
+        )
+
+
+@pytest.mark.asyncio
+async def test_reading_runs_validation_and_interpretation_concurrently():
+    """Test latency approaches the slower call rather than the sum."""
+    llm = SlowLLMService(suitable=True, validate_delay=0.2, interpret_delay=0.2)
+    service = ReadingService(llm)
+
+    loop = asyncio.get_running_loop()
+    started = loop.time()
+    outcome = await service.perform_reading("Q", "unknown", CARDS, "en")
+    elapsed = loop.time() - started
+
+    assert outcome.validation.suitable is True
+    assert outcome.interpretation.overall_interpretation == "Overall"
+    assert elapsed < 0.35
+
+
+@pytest.mark.asyncio
+async def test_rejected_question_cancels_interpretation():
+    """Test the speculative interpretation is cancelled on rejection."""
+    llm = SlowLLMService(suitable=False, validate_delay=0.01, interpret_delay=1.0)
+    service = ReadingService(llm)
+
+    outcome = await service.perform_reading("Q", "unknown", CARDS, "en")
+
+    assert outcome.validation.suitable is False
+    assert outcome.interpretation is None
+    assert llm.interpretation_cancelled is True
+
+
+class MergedLLMService(SlowLLMService):
+    """LLM stub that records merged-mode calls."""
+
+    async def validate_and_interpret(self, question, gender, _cards, language):
+        self.merged_calls = getattr(self, "merged_calls", 0) + 1
+        validation = await self.validate_question(question, gender, language)
+        return validation, None
+
+
+@pytest.mark.asyncio
+async def test_merged_mode_uses_single_completion():
+    """Test merged mode delegates to validate_and_interpret."""
+    llm = MergedLLMService(suitable=False, validate_delay=0, interpret_delay=0)
+    service = ReadingService(llm, mode="merged")
+
+    outcome = await service.perform_reading("Q", "unknown", CARDS, "en")
+
+    assert llm.merged_calls == 1
+    assert outcome.interpretation is None
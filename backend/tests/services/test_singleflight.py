@@ -0,0 +1,117 @@
+"""Test single-flight coalescing of identical calls."""
+
+import asyncio
+
+import pytest
+
+from app.services.singleflight import RedisSingleFlight, SingleFlight, prompt_key
+
+MESSAGES = [{"role": "user", "content": "hi"}]
+
+
+def test_prompt_key_separates_tasks():
+    """Test the same messages under different parsers get different keys."""
+    assert prompt_key(MESSAGES, "a") == prompt_key(list(MESSAGES), "a")
+    assert prompt_key(MESSAGES, "a") != prompt_key(MESSAGES, "b")
+
+
+@pytest.mark.asyncio
+async def test_concurrent_calls_share_one_flight():
+    """Test identical concurrent calls run once and share the result."""
+    flight = SingleFlight()
+    calls = []
+
+    async def work():
+        calls.append(1)
+        await asyncio.sleep(0.05)
+        return "result"
+
+    results = await asyncio.gather(*(flight.do("k", work) for _ in range(5)))
+
+    assert results == ["result"] * 5
+    assert len(calls) == 1
+    assert flight.stats() == {"calls": 5, "coalesced": 4, "in_flight": 0}
+
+    # Once finished, the next call starts a new flight
+    await flight.do("k", work)
+    assert len(calls) == 2
+
+
+@pytest.mark.asyncio
+async def test_errors_reach_every_caller():
+    """Test a failed flight raises to all waiters and is not cached."""
+    flight = SingleFlight()
+
+    async def fail():
+        await asyncio.sleep(0.01)
+        raise ValueError("boom")
+
+    results = await asyncio.gather(
+        flight.do("k", fail), flight.do("k", fail), return_exceptions=True
+    )
+    assert all(isinstance(r, ValueError) for r in results)
+    assert not flight.in_flight("k")
+
+
+@pytest.mark.asyncio
+async def test_cancelled_waiter_does_not_cancel_shared_call():
+    """Test one caller leaving does not abort the call for the others."""
+    flight = SingleFlight()
+
+    async def work():
+        await asyncio.sleep(0.05)
+        return "result"
+
+    first = asyncio.create_task(flight.do("k", work))
+    second = asyncio.create_task(flight.do("k", work))
+    await asyncio.sleep(0.01)
+    first.cancel()
+
+    assert await second == "result"
+    assert first.cancelled()
+
+
+@pytest.mark.asyncio
+async def test_redis_variant_reuses_published_result(mock_redis):
+    """Test a waiter in another process reads the lock holder's result."""
+    holder = RedisSingleFlight(mock_redis, lock_seconds=5, poll_interval=0.01)
+    waiter = RedisSingleFlight(mock_redis, lock_seconds=5, poll_interval=0.01)
+    calls = []
+
+    async def work():
+        calls.append(1)
+        await asyncio.sleep(0.05)
+        return 42
+
+    results = await asyncio.gather(
+        holder.do_shared("k", work, str, int),
+        waiter.do_shared("k", work, str, int),
+    )
+
+    assert results == [42, 42]
+    assert len(calls) == 1
+    assert waiter.stats()["remote_coalesced"] == 1
+    assert await mock_redis.get(f"{RedisSingleFlight.LOCK_PREFIX}k") is None
+
+
+@pytest.mark.asyncio
+async def test_redis_variant_runs_locally_when_holder_fails(mock_redis):
+    """Test a waiter runs the call itself if the lock holder gives up."""
+    holder = RedisSingleFlight(mock_redis, lock_seconds=5, poll_interval=0.01)
+    waiter = RedisSingleFlight(mock_redis, lock_seconds=5, poll_interval=0.01)
+
+    async def fail():
+        await asyncio.sleep(0.02)
+        raise ValueError("boom")
+
+    async def work():
+        return 7
+
+    results = await asyncio.gather(
+        holder.do_shared("k", fail, str, int),
+        waiter.do_shared("k", work, str, int),
+        return_exceptions=True,
+    )
+
+    assert isinstance(results[0], ValueError)
+    assert results[1] == 7
@@ -0,0 +1,29 @@
+"""Test the spread registry."""
+
+import pytest
+
+from app.services.spreads import SPREAD_CODES, SPREADS, card_positions, get_spread
+
+
+def test_registry_is_consistent():
+    """Test every spread has a token code and unique position keys."""
+    assert set(SPREAD_CODES) == set(SPREADS)
+    for spread in SPREADS.values():
+        keys = [position.key for position in spread.positions]
+        assert len(keys) == len(set(keys))
+    assert get_spread("celtic_cross").card_count == 10
+    with pytest.raises(ValueError):
+        get_spread("unknown")
+
+
+def test_assign_places_cards_on_positions():
+    """Test cards are placed in draw order and resolve back to their positions."""
+    spread = get_spread("three_card")
+    cards = spread.assign([{"id": "m00"}, {"id": "m01"}, {"id": "m02"}])
+
+    assert [card["spread_position"] for card in cards] == ["past", "present", "future"]
+    assert [p.name for p in card_positions(cards)] == ["Past", "Present", "Future"]
+    assert card_positions([{"id": "m00"}]) == [None]
+    assert spread.describe("zh")["positions"][0] == {"key": "past", "name": "过去"}
+    with pytest.raises(ValueError):
+        spread.assign([{"id": "m00"}])
@@ -0,0 +1,73 @@
+"""Test the compiled card registry."""
+
+import dataclasses
+
+import pytest
+
+from app.data.card_registry import CARD_REGISTRY, Card, CardRegistry
+from app.data.tarot_cards import TAROT_CARDS, get_card_by_id
+
+
+def test_registry_indexes_the_whole_deck():
+    """Test every card is indexed by id in deck order with its names."""
+    assert len(CARD_REGISTRY) == len(TAROT_CARDS) == 78
+    assert [card.id for card in CARD_REGISTRY] == [card["id"] for card in TAROT_CARDS]
+    fool = CARD_REGISTRY.get("0")
+    assert fool.name("zh") == "愚者"
+    assert fool.name("ja") == "The Fool"
+    assert "card_" not in {card.name_key for card in CARD_REGISTRY}
+    assert get_card_by_id("w2")["name_key"] == "card_w2"
+    assert CARD_REGISTRY.get("nope") is None
+
+
+def test_cards_are_immutable():
+    """Test card records are frozen and slotted."""
+    fool = CARD_REGISTRY.get("0")
+
+    with pytest.raises(dataclasses.FrozenInstanceError):
+        fool.id = "1"
+    with pytest.raises(TypeError):
+        fool.names["en"] = "Someone else"
+    assert not hasattr(fool, "__dict__")
+
+
+def test_localize_names_known_cards():
+    """Test names are resolved by id and unknown cards pass through."""
+    cards = CARD_REGISTRY.localize(
+        [{"id": "0", "position": "upright"}, {"name": "Custom", "position": "reversed"}], "zh"
+    )
+
+    assert cards == [
+        {"id": "0", "position": "upright", "name": "愚者"},
+        {"name": "Custom", "position": "reversed"},
+    ]
+
+
+def test_duplicate_ids_are_rejected():
+    """Test a deck with repeated ids does not compile."""
+    card = Card(id="0", name_key="card_0", image="/cards/0.webp", names={})
+
+    with pytest.raises(ValueError):
+        CardRegistry([card, card])
+
+
+def test_cards_carry_image_variants():
+    """Test manifest variants become per-format srcsets with a placeholder."""
+    fool = CARD_REGISTRY.get("0")
+
+    assert fool.image.startswith("/cards/0.")
+    assert set(fool.srcset) == {"avif", "webp"}
+    assert fool.srcset["webp"].startswith("/cards/v/0.160.")
+    assert fool.srcset["webp"].endswith(" 480w")
+    assert fool.placeholder.startswith("data:image/webp;base64,")
+    assert set(CARD_REGISTRY.sprite["cards"]) == {card.id for card in CARD_REGISTRY}
+
+
+def test_cards_without_manifest_keep_plain_images():
+    """Test a deck compiled without a manifest falls back to the source images."""
+    registry = CardRegistry.compile(TAROT_CARDS, {})
+
+    fool = registry.get("0")
+    assert fool.assets() == {"image": "/cards/0.webp", "srcset": {}, "placeholder": None}
+    assert registry.back_image == "/cards/card_back.webp"
+    assert registry.sprite is None
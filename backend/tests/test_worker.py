@@ -0,0 +1,121 @@
+"""Test the interpretation job worker."""
+
+import asyncio
+
+import pytest
+
+from app.core.exceptions import TarotError
+from app.services.job_queue import (
+    JOB_DONE,
+    JOB_FAILED,
+    JOB_QUEUED,
+    JOB_RUNNING,
+    InterpretationJob,
+    JobQueue,
+)
+from app.services.llm_service import CardInterpretation, InterpretationResult
+from app.worker import JobWorker
+
+CARDS = [{"name": "The Star", "position": "upright"}]
+
+
+class FakeLLMService:
+    def __init__(self, failures: int = 0) -> None:
+        self.failures = failures
+        self.calls = 0
+        self.fallback = None
+
+    async def interpret_cards(self, _question, _gender, _cards, _language, fallback=True):
+        self.calls += 1
+        self.fallback = fallback
+        if self.calls <= self.failures:
+            raise TarotError(message="Failed to interpret cards")
+        return InterpretationResult(
+            interpretations=[
+                CardInterpretation(
+                    card_index=0, card_name="The Star", position="upright", interpretation="Hope"
+                )
+            ],
+            overall_interpretation="Good",
+        )
+
+
+def _queue(mock_redis) -> JobQueue:
+    return JobQueue(
+        mock_redis, stream="jobs:test", group="workers", max_attempts=2, retry_idle_seconds=0
+    )
+
+
+@pytest.mark.asyncio
+async def test_worker_runs_job(mock_redis):
+    """Test a worker completes queued jobs and stops on request."""
+    queue = _queue(mock_redis)
+    record = await queue.enqueue(InterpretationJob(question="Q?", cards=CARDS))
+    llm_service = FakeLLMService()
+    worker = JobWorker(queue, llm_service, consumer="worker-1", concurrency=2)
+
+    runner = asyncio.create_task(worker.run(block_ms=10))
+    done = await queue.wait(record.id, timeout=1)
+    worker.stop()
+    await asyncio.wait_for(runner, timeout=1)
+
+    assert done.status == JOB_DONE
+    assert done.result.overall_interpretation == "Good"
+    assert done.reading_id
+    # Jobs wait for the LLM rather than settling for library meanings
+    assert llm_service.fallback is False
+
+
+@pytest.mark.asyncio
+async def test_failed_attempt_is_retried_then_dead_lettered(mock_redis):
+    """Test failures stay pending for retry until max attempts."""
+    queue = _queue(mock_redis)
+    await queue.ensure_group()
+    record = await queue.enqueue(InterpretationJob(question="Q?", cards=CARDS))
+    worker = JobWorker(queue, FakeLLMService(failures=5), consumer="worker-1")
+
+    [(message_id, job)] = await queue.read("worker-1", count=1, block_ms=0)
+    first = await worker.process(message_id, job)
+    [(message_id, job)] = await queue.claim_stale("worker-1", count=1)
+    second = await worker.process(message_id, job)
+
+    assert (first.status, first.attempts) == (JOB_QUEUED, 1)
+    assert (second.status, second.attempts) == (JOB_FAILED, 2)
+    assert second.error["code"] == "TAROT_ERROR"
+    assert (await queue.get(record.id)).status == JOB_FAILED
+    assert await queue.claim_stale("worker-1", count=1) == []
+    assert len(mock_redis.store["jobs:test:dead"]["entries"]) == 1
+
+
+@pytest.mark.asyncio
+async def test_retry_succeeds(mock_redis):
+    """Test a transient failure is recovered on redelivery."""
+    queue = _queue(mock_redis)
+    await queue.ensure_group()
+    await queue.enqueue(InterpretationJob(question="Q?", cards=CARDS))
+    worker = JobWorker(queue, FakeLLMService(failures=1), consumer="worker-1")
+
+    [(message_id, job)] = await queue.read("worker-1", count=1, block_ms=0)
+    await worker.process(message_id, job)
+    [(message_id, job)] = await queue.claim_stale("worker-2", count=1)
+    record = await worker.process(message_id, job)
+
+    assert (record.status, record.attempts, record.error) == (JOB_DONE, 2, None)
+
+
+@pytest.mark.asyncio
+async def test_job_running_elsewhere_is_skipped(mock_redis):
+    """Test a re-delivered job is not run again while its record is fresh."""
+    queue = JobQueue(mock_redis, stream="jobs:test", group="workers", retry_idle_seconds=60)
+    await queue.ensure_group()
+    record = await queue.enqueue(InterpretationJob(question="Q?", cards=CARDS))
+    record.status = JOB_RUNNING
+    record.attempts = 1
+    await queue.save(record)
+    llm_service = FakeLLMService()
+    worker = JobWorker(queue, llm_service, consumer="worker-2")
+
+    [(message_id, job)] = await queue.read("worker-2", count=1, block_ms=0)
+    skipped = await worker.process(message_id, job)
+
+    assert (skipped.status, skipped.attempts, llm_service.calls) == (JOB_RUNNING, 1, 0)
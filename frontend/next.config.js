@@ -3,8 +3,28 @@ const createNextIntlPlugin = require('next-intl/plugin');
 
 const withNextIntl = createNextIntlPlugin('./src/i18n/request.ts');
 
+// Content-hashed card image paths (backend/app/data/card_images.json) are
+// served from the plain file; the hash changes with the content.
+const hashedCardImage = '/cards/:file([^/.]+)\\.:hash([0-9a-f]{10})\\.webp';
+
 const nextConfig = {
   reactStrictMode: true,
+  async rewrites() {
+    return [{ source: hashedCardImage, destination: '/cards/:file.webp' }];
+  },
+  async headers() {
+    return [
+      {
+        source: hashedCardImage,
+        headers: [{ key: 'Cache-Control', value: 'public, max-age=31536000, immutable' }],
+      },
+      {
+        // Generated variants, placeholders and sprite; names carry a content hash
+        source: '/cards/v/:file*',
+        headers: [{ key: 'Cache-Control', value: 'public, max-age=31536000, immutable' }],
+      },
+    ];
+  },
 };
 
 module.exports = withNextIntl(nextConfig);
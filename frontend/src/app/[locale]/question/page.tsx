@@ -41,7 +41,8 @@ export default function QuestionPage() {
         // Start interpretation in background, don't await it
         apiClient.post('/tarot/interpret', {
           question: input,
-          cards: drawnCards.map((c: any) => ({ id: c.id, name: c.name_key, position: c.position })),
+          // The server re-derives the drawn cards from the signed token
+          draw_token: drawRes.data.data.draw_token,
           language: locale
         }).then(interpRes => {
           const { interpretations, reading_id, overall_interpretation } = interpRes.data.data;
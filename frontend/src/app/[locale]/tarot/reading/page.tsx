@@ -57,7 +57,8 @@ export default function ReadingPage() {
       setIsInterpreting(true);
       apiClient.post('/tarot/interpret', {
         question,
-        cards: drawnCards.map((c: any) => ({ id: c.id, name: c.name_key, position: c.position })),
+        // The server re-derives the drawn cards from the signed token
+        draw_token: res.data.data.draw_token,
         language: locale
       }).then(res => {
         const { interpretations, reading_id, overall_interpretation } = res.data.data;
@@ -59,12 +59,24 @@ export function TarotCard({
               "w-full h-full flex flex-col items-center justify-between",
               card.position === 'reversed' && "rotate-180"
             )}>
-              {/* Real Card Front Image */}
-              <img 
-                src={card.image || `/cards/${card.id}.webp`} 
-                alt={t(card.name_key)} 
-                className="w-full h-full object-cover"
-              />
+              {/* Real Card Front Image: AVIF/WebP variants sized to the card */}
+              <picture className="w-full h-full">
+                {card.srcset?.avif && (
+                  <source type="image/avif" srcSet={card.srcset.avif} sizes={`${width}px`} />
+                )}
+                {card.srcset?.webp && (
+                  <source type="image/webp" srcSet={card.srcset.webp} sizes={`${width}px`} />
+                )}
+                <img 
+                  src={card.image || `/cards/${card.id}.webp`} 
+                  alt={t(card.name_key)} 
+                  className="w-full h-full object-cover"
+                  style={card.placeholder ? {
+                    backgroundImage: `url(${card.placeholder})`,
+                    backgroundSize: 'cover',
+                  } : undefined}
+                />
+              </picture>
             </div>
           ) : null}
         </div>
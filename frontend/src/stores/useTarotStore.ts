@@ -8,6 +8,8 @@ export interface Card {
   name_key: string; // Updated to match backend
   position: 'upright' | 'reversed';
   image: string; // Updated to match backend
+  srcset?: Record<string, string>; // Responsive variants per format (avif, webp)
+  placeholder?: string | null; // Tiny preview shown while the image loads
   isRevealed?: boolean;
 }
 
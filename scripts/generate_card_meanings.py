@@ -0,0 +1,149 @@
+"""Generate the per-card meaning library (backend/app/data/card_meanings.json).
+
+The API shows these meanings as soon as cards are drawn and serves them in
+place of the LLM reading while no provider is available. Run from the
+backend directory so its .env is picked up:
+
+    cd backend && python ../scripts/generate_card_meanings.py
+
+Existing texts are kept unless --force is given, so adding a language only
+generates what is missing.
+"""
+
+import argparse
+import asyncio
+import json
+import sys
+from pathlib import Path
+
+# Paths
+BASE_DIR = Path(__file__).resolve().parent.parent
+BACKEND_DIR = BASE_DIR / "backend"
+sys.path.insert(0, str(BACKEND_DIR))
+
+import litellm  # noqa: E402
+
+from app.core.config import settings  # noqa: E402
+from app.data.card_registry import CARD_REGISTRY  # noqa: E402
+from app.services.card_library import CARD_MEANINGS_PATH  # noqa: E402
+from app.services.llm_router import LLMProvider  # noqa: E402
+
+POSITIONS = ("upright", "reversed")
+LANGUAGE_NAMES = {"en": "English", "zh": "Simplified Chinese", "ja": "Japanese"}
+
+CARD_PROMPT = """You are an experienced tarot reader writing a reference library.
+Give the traditional meaning of the tarot card "{name}" in {language}.
+Write one or two sentences per position, gentle in tone, with no absolute
+predictions and no health, legal or financial advice.
+Return JSON: {{"upright": "...", "reversed": "..."}}"""
+
+# Shown as the overall interpretation of a degraded reading
+DEFAULT_OVERALL = (
+    "These are the traditional meanings of your cards. A personalised reading is "
+    "not available right now; please try again in a moment."
+)
+
+OVERALL_PROMPT = """Translate this notice into {language}, keeping its meaning and tone.
+Return JSON: {{"text": "..."}}
+
+{text}"""
+
+
+async def complete_json(provider: LLMProvider, prompt: str) -> dict:
+    response = await litellm.acompletion(
+        **provider.completion_kwargs([{"role": "user", "content": prompt}])
+    )
+    return json.loads(response.choices[0].message.content)
+
+
+async def generate_card(
+    provider: LLMProvider,
+    semaphore: asyncio.Semaphore,
+    name: str,
+    language: str,
+) -> dict[str, str]:
+    """Generate upright and reversed meanings for one card in one language."""
+    async with semaphore:
+        data = await complete_json(
+            provider, CARD_PROMPT.format(name=name, language=LANGUAGE_NAMES[language])
+        )
+    texts = {position: str(data.get(position, "")).strip() for position in POSITIONS}
+    missing = [position for position, text in texts.items() if not text]
+    if missing:
+        raise ValueError(f"{name} ({language}): no text for {', '.join(missing)}")
+    return texts
+
+
+async def generate_library(languages: list[str], force: bool, concurrency: int) -> None:
+    library = (
+        json.loads(CARD_MEANINGS_PATH.read_text(encoding="utf-8"))
+        if CARD_MEANINGS_PATH.exists()
+        else {"version": 1, "overall": {}, "cards": {}}
+    )
+    provider = LLMProvider.for_model(settings.deepseek_model or settings.openai_model)
+    if not provider.api_key:
+        print("Error: no LLM API key configured (DEEPSEEK_API_KEY or OPENAI_API_KEY).")
+        sys.exit(1)
+
+    semaphore = asyncio.Semaphore(concurrency)
+    jobs = {}
+    for card in CARD_REGISTRY:
+        entry = library["cards"].setdefault(card.id, {p: {} for p in POSITIONS})
+        for language in languages:
+            if not force and all(language in entry[p] for p in POSITIONS):
+                continue
+            # English names are the most reliable reference for the model
+            jobs[card.id, language] = generate_card(provider, semaphore, card.name("en"), language)
+
+    print(f"Generating {len(jobs)} card meaning sets with {provider.model}...")
+    results = await asyncio.gather(*jobs.values(), return_exceptions=True)
+    failures = 0
+    for (card_id, language), result in zip(jobs, results, strict=True):
+        if isinstance(result, Exception):
+            print(f"Failed {card_id} ({language}): {result}")
+            failures += 1
+            continue
+        for position in POSITIONS:
+            library["cards"][card_id][position][language] = result[position]
+
+    english_overall = library["overall"].setdefault("en", DEFAULT_OVERALL)
+    for language in languages:
+        # English is the source text for the translations
+        if language == "en" or (language in library["overall"] and not force):
+            continue
+        data = await complete_json(provider, OVERALL_PROMPT.format(
+            language=LANGUAGE_NAMES[language], text=english_overall
+        ))
+        library["overall"][language] = data["text"]
+
+    library["languages"] = sorted(
+        {lang for entry in library["cards"].values() for lang in entry["upright"]}
+    )
+    # Keep the deck order for readable diffs
+    library["cards"] = {card.id: library["cards"][card.id] for card in CARD_REGISTRY}
+    with open(CARD_MEANINGS_PATH, "w", encoding="utf-8") as f:
+        json.dump(library, f, indent=2, ensure_ascii=False)
+        f.write("\n")
+
+    print(f"Wrote {CARD_MEANINGS_PATH} ({failures} failures)")
+    if failures:
+        sys.exit(1)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument(
+        "--languages",
+        nargs="+",
+        default=sorted(LANGUAGE_NAMES),
+        choices=sorted(LANGUAGE_NAMES),
+        help="Languages to generate (default: all supported)",
+    )
+    parser.add_argument("--force", action="store_true", help="Regenerate existing texts")
+    parser.add_argument("--concurrency", type=int, default=8)
+    args = parser.parse_args()
+    asyncio.run(generate_library(args.languages, args.force, args.concurrency))
+
+
+if __name__ == "__main__":
+    main()
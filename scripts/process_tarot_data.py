@@ -1,3 +1,6 @@
+import argparse
+import base64
+import hashlib
 import json
 import os
 import shutil
@@ -11,6 +14,23 @@ TAROT_DATA_TXT = BASE_DIR / "tarot_data.txt"
 BACKEND_CARDS_PY = BASE_DIR / "backend/app/data/tarot_cards.py"
 I18N_JSON = BASE_DIR / "backend/app/data/i18n/messages.json"
 FRONTEND_IMAGES_DIR = BASE_DIR / "frontend/public/cards"
+# Content-hashed image paths served by GET /tarot/cards and /tarot/draw
+IMAGE_MANIFEST_JSON = BASE_DIR / "backend/app/data/card_images.json"
+HASH_LENGTH = 10
+
+# Image pipeline: generated files go to VARIANT_DIR under hashed names
+VARIANT_DIR = FRONTEND_IMAGES_DIR / "v"
+# Cards are shown 120-200 CSS px wide; 480 covers them at 2x
+VARIANT_WIDTHS = (160, 320, 480)
+VARIANT_FORMATS = {
+    "avif": {"quality": 50, "speed": 6},
+    "webp": {"quality": 75, "method": 6},
+}
+PLACEHOLDER_WIDTH = 16
+SPRITE_TILE_WIDTH = 64
+SPRITE_COLUMNS = 13
+# Bump when the encoding changes in a way the settings above do not show
+PIPELINE_VERSION = 1
 
 # Ensure directories exist
 FRONTEND_IMAGES_DIR.mkdir(parents=True, exist_ok=True)
@@ -131,7 +151,10 @@ def process_tarot_data():
             # Back or extra
             if "back" in name_slug or "card_back" in name_slug:
                 download_image(url, "card_back.webp")
-                continue
+            else:
+                # Not one of the 78 cards; it must not get a card_ name key
+                print(f"Skipping extra image {filename}")
+            continue
         
         # Download image
         local_filename = f"{card_id}.webp"
@@ -157,6 +180,7 @@ def process_tarot_data():
     with open(I18N_JSON, "r", encoding="utf-8") as f:
         current_i18n = json.load(f)
     
+    # Cards are replaced wholesale so stale keys do not linger
     current_i18n.update(i18n_updates)
     
     with open(I18N_JSON, "w", encoding="utf-8") as f:
@@ -170,17 +194,208 @@ def process_tarot_data():
     for card in new_cards_data:
         py_content += f'    {json.dumps(card, ensure_ascii=False)},\n'
     py_content += ']\n\n'
+    py_content += '_CARDS_BY_ID = {card["id"]: card for card in TAROT_CARDS}\n\n'
     py_content += 'def get_card_by_id(card_id: str) -> dict | None:\n'
     py_content += '    """Get a tarot card by its ID."""\n'
-    py_content += '    for card in TAROT_CARDS:\n'
-    py_content += '        if card["id"] == card_id:\n'
-    py_content += '            return card\n'
-    py_content += '    return None\n'
+    py_content += '    return _CARDS_BY_ID.get(card_id)\n'
 
     with open(BACKEND_CARDS_PY, "w", encoding="utf-8") as f:
         f.write(py_content)
         
     print("Updated tarot_cards.py")
 
+def _digest(data):
+    return hashlib.sha256(data).hexdigest()
+
+def _encode(image, image_format, options):
+    import io
+
+    buffer = io.BytesIO()
+    image.save(buffer, image_format.upper(), **options)
+    return buffer.getvalue()
+
+def _write_variant(name, data):
+    """Write a generated file under its content-hashed name; return its URL path."""
+    target = VARIANT_DIR / name
+    if not target.exists():
+        target.write_bytes(data)
+    return f"/cards/{VARIANT_DIR.name}/{name}"
+
+def build_card_image(source):
+    """Encode the responsive variants and placeholder of one card image.
+
+    Runs in a worker process. Every output is named by its own content
+    hash, so it can be cached as immutable.
+    """
+    from PIL import Image
+
+    data = source.read_bytes()
+    digest = _digest(data)
+    stem = source.name.removesuffix(".webp")
+    with Image.open(source) as opened:
+        image = opened.convert("RGB")
+    width, height = image.size
+
+    variants = []
+    # Never upscale; the original is the largest size served
+    for target_width in [w for w in VARIANT_WIDTHS if w < width]:
+        target_height = round(height * target_width / width)
+        resized = image.resize((target_width, target_height), Image.Resampling.LANCZOS)
+        for image_format, options in VARIANT_FORMATS.items():
+            encoded = _encode(resized, image_format, options)
+            name = f"{stem}.{target_width}.{_digest(encoded)[:HASH_LENGTH]}.{image_format}"
+            variants.append({
+                "format": image_format,
+                "width": target_width,
+                "height": target_height,
+                "path": _write_variant(name, encoded),
+                "bytes": len(encoded),
+            })
+
+    # Low-quality placeholder, inlined as a data URI; scaled up it reads as a blur
+    tiny = image.resize(
+        (PLACEHOLDER_WIDTH, round(height * PLACEHOLDER_WIDTH / width)), Image.Resampling.BOX
+    )
+    placeholder = _encode(tiny, "webp", {"quality": 30})
+
+    return stem, {
+        "path": f"/cards/{stem}.{digest[:HASH_LENGTH]}.webp",
+        "sha256": digest,
+        "bytes": len(data),
+        "width": width,
+        "height": height,
+        "placeholder": "data:image/webp;base64," + base64.b64encode(placeholder).decode("ascii"),
+        "variants": variants,
+    }
+
+def build_sprite(sources):
+    """Tile small thumbnails of the cards into one sheet for the shuffle view."""
+    from PIL import Image
+
+    columns = SPRITE_COLUMNS
+    rows = -(-len(sources) // columns)
+    tile_height = None
+    sheet = None
+    cards = {}
+    for index, source in enumerate(sources):
+        with Image.open(source) as opened:
+            image = opened.convert("RGB")
+        if tile_height is None:
+            tile_height = round(image.height * SPRITE_TILE_WIDTH / image.width)
+            sheet = Image.new("RGB", (columns * SPRITE_TILE_WIDTH, rows * tile_height))
+        x, y = index % columns * SPRITE_TILE_WIDTH, index // columns * tile_height
+        tile = image.resize((SPRITE_TILE_WIDTH, tile_height), Image.Resampling.LANCZOS)
+        sheet.paste(tile, (x, y))
+        cards[source.name.removesuffix(".webp")] = [x, y]
+
+    encoded = _encode(sheet, "webp", VARIANT_FORMATS["webp"])
+    name = f"sprite.{_digest(encoded)[:HASH_LENGTH]}.webp"
+    return {
+        "path": _write_variant(name, encoded),
+        "bytes": len(encoded),
+        "width": sheet.width,
+        "height": sheet.height,
+        "tile_width": SPRITE_TILE_WIDTH,
+        "tile_height": tile_height,
+        "cards": cards,
+    }
+
+def _is_current(entry, digest):
+    """Whether a manifest entry was built from this source and its files exist."""
+    return (
+        entry is not None
+        and entry.get("sha256") == digest
+        and "variants" in entry
+        and all(
+            (VARIANT_DIR / Path(v["path"]).name).exists() for v in entry["variants"]
+        )
+    )
+
+def build_images(sprite=False, jobs=None, force=False):
+    """Build responsive variants, placeholders and the manifest.
+
+    Each card image gets WebP and AVIF variants at VARIANT_WIDTHS and a
+    tiny placeholder. ``/cards/<id>.<hash>.webp`` (the original) is served
+    from ``<id>.webp`` by a rewrite in ``frontend/next.config.js``; the
+    generated files carry their own content hash. Images whose content and
+    encoder settings are unchanged are skipped; the rest are encoded in
+    parallel across processes. Files no longer referenced are removed.
+    """
+    from concurrent.futures import ProcessPoolExecutor
+
+    VARIANT_DIR.mkdir(parents=True, exist_ok=True)
+    settings_key = {
+        "pipeline": PIPELINE_VERSION,
+        "widths": list(VARIANT_WIDTHS),
+        "formats": VARIANT_FORMATS,
+        "placeholder_width": PLACEHOLDER_WIDTH,
+    }
+    previous = {}
+    if IMAGE_MANIFEST_JSON.exists() and not force:
+        previous = json.loads(IMAGE_MANIFEST_JSON.read_text(encoding="utf-8"))
+        if previous.get("settings") != settings_key:
+            previous = {}
+
+    sources = sorted(FRONTEND_IMAGES_DIR.glob("*.webp"))
+    images = {}
+    stale = []
+    for source in sources:
+        stem = source.name.removesuffix(".webp")
+        entry = previous.get("images", {}).get(stem)
+        if _is_current(entry, _digest(source.read_bytes())):
+            images[stem] = entry
+        else:
+            stale.append(source)
+
+    if stale:
+        print(f"Encoding {len(stale)} images ({len(sources) - len(stale)} unchanged)...")
+        with ProcessPoolExecutor(max_workers=jobs or os.cpu_count()) as pool:
+            images.update(pool.map(build_card_image, stale))
+    else:
+        print(f"All {len(sources)} images unchanged")
+
+    manifest = {
+        "version": 2,
+        "settings": settings_key,
+        "images": {stem: images[stem] for stem in sorted(images)},
+    }
+    if sprite:
+        cards = [s for s in sources if s.name != "card_back.webp"]
+        old_sprite = previous.get("sprite")
+        if (
+            not stale
+            and old_sprite
+            and (VARIANT_DIR / Path(old_sprite["path"]).name).exists()
+        ):
+            manifest["sprite"] = old_sprite
+        else:
+            manifest["sprite"] = build_sprite(cards)
+
+    referenced = {Path(v["path"]).name for e in images.values() for v in e["variants"]}
+    if "sprite" in manifest:
+        referenced.add(Path(manifest["sprite"]["path"]).name)
+    for generated in VARIANT_DIR.iterdir():
+        if generated.name not in referenced:
+            generated.unlink()
+
+    with open(IMAGE_MANIFEST_JSON, "w", encoding="utf-8") as f:
+        json.dump(manifest, f, indent=2)
+        f.write("\n")
+
+    total = sum(v["bytes"] for e in images.values() for v in e["variants"])
+    print(f"Wrote {IMAGE_MANIFEST_JSON} ({len(referenced)} files, {total / 1e6:.1f} MB)")
+
 if __name__ == "__main__":
-    process_tarot_data()
+    parser = argparse.ArgumentParser(description="Build card data and image assets.")
+    parser.add_argument(
+        "--images-only",
+        action="store_true",
+        help="Only rebuild the image variants and manifest from the existing images",
+    )
+    parser.add_argument("--sprite", action="store_true", help="Also build the thumbnail sprite")
+    parser.add_argument("--jobs", type=int, help="Encoder processes (default: CPU count)")
+    parser.add_argument("--force", action="store_true", help="Re-encode unchanged images")
+    args = parser.parse_args()
+    if not args.images_only:
+        process_tarot_data()
+    build_images(sprite=args.sprite, jobs=args.jobs, force=args.force)